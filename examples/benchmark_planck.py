@@ -0,0 +1,43 @@
+import os
+import sys
+import timeit
+import numpy as np
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from zenith.astrophysics import planck_law, PlanckEvaluator
+
+def best_of(func, number=5, repeat=5):
+    """Best per-call time in seconds."""
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+def main():
+    # A finely sampled spectrum fitted against many trial temperatures
+    wavelength = np.linspace(300e-9, 2.5e-6, 200000)
+    temperatures = np.linspace(3000.0, 12000.0, 50)
+
+    evaluator = PlanckEvaluator(wavelength)
+    evaluator32 = PlanckEvaluator(wavelength, dtype=np.float32)
+    out = np.empty(wavelength.shape)
+    out32 = np.empty(wavelength.shape, dtype=np.float32)
+
+    exact = best_of(lambda: [planck_law(wavelength, T) for T in temperatures])
+    fast = best_of(lambda: [evaluator(T, out=out) for T in temperatures])
+    fast32 = best_of(lambda: [evaluator32(T, out=out32) for T in temperatures])
+
+    error = max(np.max(np.abs(evaluator(T) / planck_law(wavelength, T) - 1.0)) for T in temperatures)
+    print(f"{len(temperatures)} temperatures x {len(wavelength)} wavelengths")
+    print(f"planck_law:                {exact * 1e3:8.2f} ms")
+    print(f"PlanckEvaluator (float64): {fast * 1e3:8.2f} ms  ({exact / fast:.1f}x, max rel. error {error:.1e})")
+    print(f"PlanckEvaluator (float32): {fast32 * 1e3:8.2f} ms  ({exact / fast32:.1f}x)")
+
+    # Whole temperature x wavelength grid at once
+    grid_out = np.empty((len(temperatures), len(wavelength)))
+    broadcast = best_of(lambda: planck_law(wavelength[None, :], temperatures[:, None]))
+    grid = best_of(lambda: evaluator(temperatures, out=grid_out))
+    print(f"grid, broadcasting:        {broadcast * 1e3:8.2f} ms")
+    print(f"grid, PlanckEvaluator:     {grid * 1e3:8.2f} ms  ({broadcast / grid:.1f}x)")
+
+if __name__ == "__main__":
+    main()
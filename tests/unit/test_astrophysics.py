@@ -0,0 +1,128 @@
+import pytest
+import numpy as np
+from zenith.astrophysics import (planck_law, iter_planck_grid, PhotometryTable, gaussian_bandpass, JOHNSON_BANDS,
+                                 apparent_magnitude, absolute_magnitude, PlanckEvaluator, distance_modulus,
+                                 luminosity_from_radius_temp, wien_displacement)
+from zenith.optics import Filter
+from zenith.utils import c, parsec, solar_radius, mpc_to_m, m_to_mpc, rad_to_deg, deg_to_rad
+
+WAVELENGTH = np.linspace(100e-9, 5e-6, 200)
+TEMPS = np.array([2500.0, 5778.0, 10000.0, 40000.0])
+
+def test_planck_grid_matches_broadcasting():
+    reference = planck_law(WAVELENGTH[None, :], TEMPS[:, None])
+    grid = planck_law(WAVELENGTH, TEMPS, grid=True)
+    assert grid.shape == (4, 200)
+    assert np.allclose(grid, reference, rtol=1e-13, atol=0)
+
+    out = np.empty((4, 200))
+    assert planck_law(WAVELENGTH, TEMPS, grid=True, out=out) is out
+    assert np.allclose(out, reference, rtol=1e-13, atol=0)
+
+    # Elementwise mode with an output buffer
+    same = np.empty(4)
+    planck_law(550e-9, TEMPS, out=same)
+    assert np.allclose(same, [planck_law(550e-9, t) for t in TEMPS], rtol=1e-13)
+
+    with pytest.raises(ValueError):
+        planck_law(WAVELENGTH, TEMPS, grid=True, out=np.empty((200, 4)))
+
+def test_planck_grid_float32_and_chunks():
+    reference = planck_law(WAVELENGTH, TEMPS, grid=True)
+    single = planck_law(WAVELENGTH, TEMPS, grid=True, dtype=np.float32)
+    assert single.dtype == np.float32
+    significant = reference > reference.max() * 1e-30
+    assert np.allclose(single[significant], reference[significant], rtol=1e-5, atol=0)
+
+    blocks = []
+    for start, stop, block in iter_planck_grid(WAVELENGTH, TEMPS, chunk_size=3):
+        assert block.shape == (stop - start, 200)
+        # Every block reuses the same buffer
+        assert not blocks or np.shares_memory(block, first)
+        first = block
+        blocks.append(block.copy())
+    assert np.allclose(np.vstack(blocks), reference, rtol=1e-13, atol=0)
+
+def test_photometry_table_matches_direct_integration():
+    table = PhotometryTable()
+
+    def direct(T, band, radius):
+        wavelength, transmission = gaussian_bandpass(*JOHNSON_BANDS[band])
+        f_lambda = np.pi * planck_law(wavelength, T) * (radius / (10 * parsec)) ** 2
+        ratio = (np.trapezoid(f_lambda * wavelength * transmission, wavelength)
+                 / (c * 3631e-26 * np.trapezoid(transmission / wavelength, wavelength)))
+        return -2.5 * np.log10(ratio)
+
+    temps = np.array([2000.0, 3500.0, 5778.0, 9600.0, 25000.0, 80000.0])
+    radii = np.array([0.2, 0.5, 1.0, 2.5, 6.0, 10.0]) * solar_radius
+    distance = np.array([5.0, 20.0, 100.0, 1000.0, 5e3, 1e4])
+    mags = table.magnitudes(temps, radii, distance=distance)
+    for band in ('B', 'V'):
+        expected = [direct(T, band, R) for T, R in zip(temps, radii)]
+        assert np.allclose(table.absolute_magnitude(band, temps, radii), expected, atol=1e-3)
+        assert np.allclose(mags[band], apparent_magnitude(np.array(expected), distance), atol=1e-3)
+
+    # Colors are radius- and distance-independent; hotter stars are bluer
+    bv = table.color_index('B', 'V', temps)
+    assert np.allclose(bv, mags['B'] - mags['V'])
+    assert np.all(np.diff(bv) < 0)
+    assert np.isnan(table.color_index('B', 'V', [500.0, 2e5])).all()
+
+    # Apparent/absolute magnitudes and photometric distances round-trip
+    assert absolute_magnitude(apparent_magnitude(4.8, 250.0), 250.0) == pytest.approx(4.8)
+    assert np.allclose(table.distance('V', mags['V'], temps, radii), distance)
+
+    # Filter-like objects and explicit curves are accepted
+    custom = PhotometryTable({'V': Filter(*gaussian_bandpass(*JOHNSON_BANDS['V']))})
+    assert custom.absolute_magnitude('V', 5778.0) == pytest.approx(table.absolute_magnitude('V', 5778.0))
+
+def test_planck_evaluator_matches_planck_law():
+    evaluator = PlanckEvaluator(WAVELENGTH)
+    for T in TEMPS:
+        assert np.allclose(evaluator(T), planck_law(WAVELENGTH, T), rtol=1e-13, atol=0)
+
+    out = np.empty((4, 200))
+    assert evaluator(TEMPS, out=out) is out
+    assert np.allclose(out, planck_law(WAVELENGTH, TEMPS, grid=True), rtol=1e-13, atol=0)
+    assert np.allclose(evaluator(list(TEMPS)), out, rtol=1e-15, atol=0)
+
+    single = PlanckEvaluator(WAVELENGTH, dtype=np.float32)(5778.0)
+    assert single.dtype == np.float32
+    assert np.allclose(single, planck_law(WAVELENGTH, 5778.0), rtol=1e-5, atol=0)
+
+    with pytest.raises(ValueError):
+        evaluator(TEMPS, out=np.empty(200))
+
+def test_ufunc_style_keywords():
+    rng = np.random.default_rng(2)
+    a = rng.uniform(1.0, 20.0, (3, 4))
+    b = rng.uniform(1.0, 20.0, 4)
+    cases = [
+        (distance_modulus, (a, b)),
+        (absolute_magnitude, (a, b * 100)),
+        (apparent_magnitude, (a, b * 100)),
+        (luminosity_from_radius_temp, (a * solar_radius, b * 1000)),
+        (wien_displacement, (a * 1000,)),
+        (mpc_to_m, (a,)), (m_to_mpc, (a * 1e22,)), (rad_to_deg, (a,)), (deg_to_rad, (a,)),
+    ]
+    mask = a > 10.0
+    for func, args in cases:
+        expected = func(*args)
+        out = np.empty((3, 4))
+        assert func(*args, out=out) is out
+        assert np.allclose(out, expected, rtol=1e-12)
+
+        # where= leaves unselected elements of out untouched
+        out = np.full((3, 4), -1.0)
+        func(*args, out=out, where=mask)
+        assert np.allclose(out[mask], expected[mask], rtol=1e-12)
+        assert np.all(out[~mask] == -1.0)
+
+        single = func(*args, dtype=np.float32)
+        assert single.dtype == np.float32 and single.shape == (3, 4)
+        assert np.allclose(single, expected, rtol=1e-5)
+
+        # Scalars keep returning scalars
+        scalar_args = tuple(float(np.ravel(x)[0]) for x in args)
+        assert np.ndim(func(*scalar_args, dtype=np.float64)) == 0
+        assert func(*scalar_args, dtype=np.float64) == pytest.approx(func(*scalar_args), rel=1e-12)
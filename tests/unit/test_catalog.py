@@ -0,0 +1,38 @@
+import pytest
+import numpy as np
+from zenith.catalog import Catalog, csv_to_catalog, write_catalog
+from zenith.astrophysics import absolute_magnitude
+from zenith.optics import Telescope, CCD
+
+def test_csv_round_trip_and_chunks(tmp_path):
+    rng = np.random.default_rng(0)
+    n = 1003
+    data = np.column_stack([
+        rng.uniform(0, 360, n), rng.uniform(-90, 90, n), rng.uniform(5, 15, n),
+        rng.uniform(3000, 10000, n), rng.uniform(10, 1000, n),
+    ])
+    csv_path = tmp_path / "stars.csv"
+    np.savetxt(csv_path, data, delimiter=",", header="ra,dec,mag,temperature,distance", comments="")
+
+    cat = csv_to_catalog(str(csv_path), str(tmp_path / "cat"), block_rows=100)
+    assert len(cat) == n
+    assert cat.columns == ["ra", "dec", "mag", "temperature", "distance"]
+    assert isinstance(cat["ra"], np.memmap)
+    assert np.allclose(cat["mag"], data[:, 2])
+
+    # Chunks are views that feed straight into the vectorized functions
+    reopened = Catalog(str(tmp_path / "cat"))
+    sizes = []
+    for chunk in reopened.iter_chunks(chunk_size=250, columns=["mag", "distance"]):
+        assert np.shares_memory(chunk["mag"], reopened["mag"])
+        M = absolute_magnitude(chunk["mag"], chunk["distance"])
+        assert M.shape == chunk["mag"].shape
+        sizes.append(len(chunk["mag"]))
+    assert sizes == [250, 250, 250, 250, 3]
+
+def test_write_catalog_float32(tmp_path):
+    cat = write_catalog(str(tmp_path / "cat"), mag=np.arange(10, dtype=np.float32))
+    snr = Telescope(aperture=0.203, focal_length=2.0).calculate_snr(cat["mag"], 60, CCD())
+    assert snr.shape == (10,)
+    with pytest.raises(ValueError):
+        write_catalog(str(tmp_path / "bad"), ra=np.zeros(3), dec=np.zeros(4))
@@ -1,6 +1,9 @@
 import pytest
 import datetime
-from zenith.astrometry import calculate_lst, ra_dec_to_alt_az
+import numpy as np
+from zenith.astrometry import (calculate_lst, ra_dec_to_alt_az, calculate_airmass, rise_transit_set,
+                               j2000_to_date, precession_matrix, Observer)
+from zenith.time import julian_date
 
 def test_lst():
     # Test LST for a known case (Greenwich, J2000 epoch)
@@ -37,3 +40,127 @@ def test_ra_dec_to_alt_az():
 
     # Should be at Zenith (Alt=90)
     assert abs(alt - 90.0) < 0.1
+
+def test_ra_dec_to_alt_az_broadcast_matches_scalar():
+    # Star x time grid should match the scalar path element by element
+    lat, lon = 59.3, 18.0
+    ras = np.array([10.68, 101.28, 250.0])
+    decs = np.array([41.26, -16.72, 80.0])
+    start = datetime.datetime(2026, 1, 20, 16, 0, 0, tzinfo=datetime.timezone.utc)
+    times = [start + datetime.timedelta(minutes=m) for m in range(0, 600, 60)]
+    times64 = np.array([t.replace(tzinfo=None) for t in times], dtype='datetime64[us]')
+
+    alt, az = ra_dec_to_alt_az(ras, decs, lat, lon, times64)
+    assert alt.shape == (3, len(times))
+
+    for i in range(len(ras)):
+        for j, t in enumerate(times):
+            a, z = ra_dec_to_alt_az(ras[i], decs[i], lat, lon, t)
+            assert abs(alt[i, j] - a) < 1e-8
+            assert abs(((az[i, j] - z) + 180.0) % 360.0 - 180.0) < 1e-8
+
+def test_ra_dec_to_alt_az_julian_dates():
+    dt = datetime.datetime(2025, 1, 1, 0, 0, 0, tzinfo=datetime.timezone.utc)
+    jd = dt.timestamp() / 86400.0 + 2440587.5
+    alt, az = ra_dec_to_alt_az(np.array([45.0]), np.array([30.0]), 45.0, 10.0, np.array([jd]))
+    a, z = ra_dec_to_alt_az(45.0, 30.0, 45.0, 10.0, dt)
+    assert abs(alt[0, 0] - a) < 1e-6
+    assert abs(az[0, 0] - z) < 1e-6
+
+def test_observer_matches_function_and_caches():
+    obs = Observer(lat=59.3, lon=18.0, cache_size=2)
+    times = np.datetime64('2026-01-20T16:00') + np.arange(24) * np.timedelta64(30, 'm')
+    ras = np.array([10.68, 101.28])
+    decs = np.array([41.26, -16.72])
+
+    alt, az = obs.alt_az(ras, decs, times)
+    alt_ref, az_ref = ra_dec_to_alt_az(ras, decs, 59.3, 18.0, times)
+    assert np.allclose(alt, alt_ref) and np.allclose(az, az_ref)
+
+    # Second query against the same grid hits the cache
+    assert obs.lst(times) is obs.lst(times.copy())
+    obs.lst(times + np.timedelta64(1, 'D'))
+    obs.lst(times + np.timedelta64(2, 'D'))
+    assert len(obs._lst_cache) == 2
+
+    airmass = obs.airmass(ras, decs, times)
+    assert np.allclose(airmass, calculate_airmass(alt))
+    assert np.all(np.isinf(airmass[alt <= 0]))
+
+    ha = obs.hour_angle(ras, times)
+    assert ha.shape == (2, 24)
+    assert np.all((ha >= 0) & (ha < 360))
+
+def test_rise_transit_set_closed_form():
+    lat, lon = 59.3, 18.0
+    t0 = datetime.datetime(2026, 1, 20, 16, 0, 0, tzinfo=datetime.timezone.utc)
+    ras = np.array([101.28, 10.68, 37.95, 280.0])
+    decs = np.array([-16.72, 41.26, 89.26, -60.0])   # Sirius, M31, Polaris, southern target
+
+    rts = rise_transit_set(ras, decs, lat, lon, t0, altitude=12.0)
+    assert list(rts.circumpolar) == [False, False, True, False]
+    assert list(rts.never_rises) == [False, False, False, True]
+
+    # Altitude at transit is the culmination, and rise/set sit on the threshold
+    for i in range(2):
+        alt_t, _ = ra_dec_to_alt_az(ras[i], decs[i], lat, lon, np.array([rts.transit[i]]))
+        assert abs(alt_t[0] - (90.0 - abs(lat - decs[i]))) < 1e-6
+        alt_rs, _ = ra_dec_to_alt_az(ras[i], decs[i], lat, lon, np.array([rts.rise[i], rts.set[i]]))
+        assert np.allclose(alt_rs, 12.0, atol=1e-6)
+    assert np.isnan(rts.rise[2]) and np.isnan(rts.set[3])
+
+def test_j2000_to_date_precession_and_nutation():
+    # Meeus, Astronomical Algorithms, example 21.b (theta Persei to 2028 Nov 13.19 TD)
+    ra, dec = j2000_to_date(41.054063, 49.227750, 2462088.69, nutation=False)
+    assert abs(ra - 41.547214) < 1e-5 and abs(dec - 49.348483) < 1e-5
+    # Meeus example 23.a nutation terms: +15.843" in RA, +6.217" in Dec
+    ra_n, dec_n = j2000_to_date(41.054063, 49.227750, 2462088.69)
+    assert abs((ra_n - ra) * 3600 - 15.843) < 0.5 and abs((dec_n - dec) * 3600 - 6.217) < 0.5
+
+    # Batched catalog conversion shares one cached matrix per epoch
+    assert precession_matrix(2462088.69) is precession_matrix(2462088.69)
+    ras = np.array([0.0, 41.054063, 180.0])
+    decs = np.array([0.0, 49.227750, -45.0])
+    ra_b, dec_b = j2000_to_date(ras, decs, 2462088.69, nutation=False)
+    assert abs(ra_b[1] - ra) < 1e-9 and abs(dec_b[1] - dec) < 1e-9
+
+def test_ra_dec_to_alt_az_scalar_julian_date_and_datetime64():
+    dt = datetime.datetime(2024, 1, 10, 20, 0, 0)
+    jd = dt.replace(tzinfo=datetime.timezone.utc).timestamp() / 86400.0 + 2440587.5
+    a, z = ra_dec_to_alt_az(10.0, 5.0, 59.0, 18.0, dt)
+    for t in (jd, np.datetime64('2024-01-10T20:00:00')):
+        alt, az = ra_dec_to_alt_az(10.0, 5.0, 59.0, 18.0, t)
+        assert np.ndim(alt) == 0 and np.ndim(az) == 0
+        assert abs(alt - a) < 1e-6 and abs(az - z) < 1e-6
+
+def test_julian_date_round_trip_and_aware_datetimes():
+    dt = datetime.datetime(2024, 1, 10, 20, 0, 0)
+    assert ra_dec_to_alt_az(10.0, 5.0, 59.0, 18.0, julian_date(dt)) == \
+        pytest.approx(ra_dec_to_alt_az(10.0, 5.0, 59.0, 18.0, dt), abs=1e-6)
+
+    # An aware datetime is the same instant on the datetime and Julian Date paths
+    local = datetime.datetime(2024, 1, 10, 22, 0, 0, tzinfo=datetime.timezone(datetime.timedelta(hours=2)))
+    assert calculate_lst(18.0, local) == pytest.approx(calculate_lst(18.0, julian_date(local)), abs=1e-6)
+    assert calculate_lst(18.0, local) == pytest.approx(calculate_lst(18.0, dt), abs=1e-6)
+    assert rise_transit_set(np.array([10.0]), np.array([5.0]), 59.0, 18.0, local).transit[0] == \
+        pytest.approx(rise_transit_set(np.array([10.0]), np.array([5.0]), 59.0, 18.0, dt).transit[0])
+
+def test_observer_scalar_times():
+    obs = Observer(lat=59.0, lon=18.0)
+    dt = datetime.datetime(2024, 1, 10, 20, 0, 0)
+    a, z = ra_dec_to_alt_az(10.0, 5.0, 59.0, 18.0, dt)
+    for t in (dt, np.datetime64('2024-01-10T20:00:00'), 2460320.3333333335):
+        alt, az = obs.alt_az(10.0, 5.0, t)
+        assert abs(alt - a) < 1e-6 and abs(az - z) < 1e-6
+        assert obs.airmass(10.0, 5.0, t) == pytest.approx(1.0 / np.sin(np.radians(a)))
+        assert obs.hour_angle(10.0, t) == pytest.approx((calculate_lst(18.0, dt) - 10.0) % 360.0, abs=1e-6)
+        assert obs.lst(t) is obs.lst(t)
+
+def test_rise_transit_set_single_target():
+    t0 = datetime.datetime(2024, 1, 10)
+    rts = rise_transit_set(10.0, 5.0, 59.0, 18.0, t0)
+    ref = rise_transit_set(np.array([10.0]), np.array([5.0]), 59.0, 18.0, t0)
+    for field, value in zip(rts._fields, rts):
+        assert np.ndim(value) == 0 and not isinstance(value, np.ndarray)
+        assert value == pytest.approx(getattr(ref, field)[0])
+    assert np.isnan(rise_transit_set(10.0, -60.0, 59.0, 18.0, t0).rise)
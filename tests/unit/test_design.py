@@ -0,0 +1,40 @@
+import pytest
+import numpy as np
+from zenith.design import design_sweep, pareto_front
+
+def _brute_force_front(costs):
+    keep = []
+    for i, c in enumerate(costs):
+        dominated = np.any(np.all(costs <= c, axis=1) & np.any(costs < c, axis=1))
+        if not dominated:
+            keep.append(i)
+    return keep
+
+@pytest.mark.parametrize("k", [2, 3])
+def test_pareto_front_matches_brute_force(k):
+    rng = np.random.default_rng(k)
+    costs = rng.integers(0, 20, size=(400, k)).astype(float)
+    front = pareto_front(costs)
+    expected = _brute_force_front(costs)
+    # Duplicated optimal rows are reported once
+    assert {tuple(costs[i]) for i in front} == {tuple(costs[i]) for i in expected}
+    assert len(front) == len({tuple(costs[i]) for i in expected})
+
+def test_design_sweep_chunked_matches_single_pass():
+    kwargs = dict(aperture=np.linspace(0.1, 1.0, 10), focal_length=np.linspace(0.5, 10.0, 8),
+                  pixel_size=[3.76e-6, 9e-6], read_noise=[1.5, 5.0], dark_current=[0.01, 0.1],
+                  objectives={'limiting_magnitude': 'max', 'aperture': 'min', 'pixel_scale': 'max'})
+    single = design_sweep(chunk_size=10 ** 6, **kwargs)
+    chunked = design_sweep(chunk_size=37, **kwargs)
+    assert np.array_equal(np.sort(single['index']), np.sort(chunked['index']))
+
+    # The cheapest aperture with the best limiting magnitude is on the front
+    assert single['aperture'].min() == 0.1
+    assert set(single) >= {'aperture', 'focal_length', 'snr', 'limiting_magnitude', 'sampling', 'index'}
+
+def test_design_sweep_process_pool():
+    kwargs = dict(aperture=np.linspace(0.1, 1.0, 20), focal_length=np.linspace(0.5, 10.0, 20),
+                  read_noise=np.linspace(1.0, 10.0, 5), chunk_size=500)
+    serial = design_sweep(workers=1, **kwargs)
+    parallel = design_sweep(workers=2, **kwargs)
+    assert np.array_equal(serial['index'], parallel['index'])
@@ -0,0 +1,115 @@
+import numpy as np
+import pytest
+from zenith.exoplanets import TransitSimulator, TransitPopulation, LimbDarkenedTransit, quadratic_transit_flux
+
+def test_population_matches_single_simulators():
+    R_star = np.array([0.8, 1.0, 1.5])
+    R_planet = np.array([1.0, 11.2, 4.0])
+    period = np.array([3.0, 4.0, 20.0])
+    pop = TransitPopulation(R_star, R_planet, period, M_star_solar=1.2)
+    assert len(pop) == 3
+
+    time, flux = pop.generate_light_curves(duration_hours=8, points=301)
+    assert flux.shape == (3, 301)
+    for i in range(3):
+        sim = TransitSimulator(R_star[i], R_planet[i], period[i], 1.2)
+        for name in ('a', 'v_orb', 'depth', 'duration'):
+            assert getattr(pop, name)[i] == pytest.approx(getattr(sim, name), rel=1e-12)
+        t_ref, f_ref = sim.generate_light_curve(duration_hours=8, points=301)
+        assert np.array_equal(time, t_ref)
+        assert np.allclose(flux[i], f_ref, rtol=0, atol=1e-15)
+
+def test_population_streaming_and_out():
+    rng = np.random.default_rng(1)
+    pop = TransitPopulation(rng.uniform(0.5, 2, 50), rng.uniform(1, 15, 50), rng.uniform(0.5, 30, 50))
+    _, full = pop.generate_light_curves(points=64)
+
+    out = np.empty((50, 64), dtype=np.float32)
+    _, single = pop.generate_light_curves(points=64, out=out)
+    assert single is out
+    assert np.allclose(single, full, atol=1e-6)
+
+    blocks = []
+    for start, stop, block in pop.iter_light_curves(points=64, chunk_size=16):
+        assert block.shape == (stop - start, 64)
+        blocks.append(block.copy())
+    assert np.array_equal(np.concatenate(blocks), full)
+
+    with pytest.raises(ValueError):
+        pop.generate_light_curves(points=64, out=np.empty((49, 64)))
+
+def _brute_force_flux(z, p, u1, u2, n=4000):
+    """Quadratic limb-darkened flux by summing the occulted arc of thin annuli."""
+    r = (np.arange(n) + 0.5) / n
+    mu = np.sqrt(1 - r * r)
+    weight = (1 - u1 * (1 - mu) - u2 * (1 - mu) ** 2) * r
+    flux = []
+    for zz in z:
+        if zz == 0:
+            covered = (r < p).astype(float)
+        else:
+            covered = np.arccos(np.clip((r * r + zz * zz - p * p) / (2 * r * zz), -1, 1)) / np.pi
+        flux.append(1 - np.sum(weight * covered) / np.sum(weight))
+    return np.array(flux)
+
+@pytest.mark.parametrize("p", [0.05, 0.3, 0.5, 0.7, 1.2])
+def test_quadratic_transit_flux_matches_brute_force(p):
+    # Include the contact points, where the analytic model switches formulas
+    z = np.abs(np.concatenate([np.linspace(0, 1 + p + 0.05, 97), [p, 1 - p, p + 1e-9, 1 - p - 1e-9]]))
+    for u1, u2 in ((0.0, 0.0), (0.4, 0.25), (1.0, 0.0)):
+        flux = quadratic_transit_flux(z, p, u1, u2)
+        assert np.all(np.isfinite(flux))
+        assert np.allclose(flux, _brute_force_flux(z, p, u1, u2), rtol=0, atol=2e-6)
+    assert quadratic_transit_flux(0.0, 0.1) == pytest.approx(1 - 0.01)
+
+def test_limb_darkened_transit():
+    model = LimbDarkenedTransit(R_planet_earth=11.2, period_days=4.0, impact_parameter=0.3, u1=0.4, u2=0.25)
+    exact = LimbDarkenedTransit(R_planet_earth=11.2, period_days=4.0, impact_parameter=0.3, u1=0.4, u2=0.25,
+                                table_size=None)
+    time, flux = model.generate_light_curve(duration_hours=6, points=2001)
+    _, reference = exact.generate_light_curve(duration_hours=6, points=2001)
+    assert np.allclose(flux, reference, rtol=0, atol=1e-5 * model.depth)
+
+    # Closest approach at mid-transit, limb darkening deepens the center
+    assert model.separation(0.0) == pytest.approx(0.3)
+    assert flux.min() == pytest.approx(model.flux(0.0))
+    assert 1 - model.flux(0.0) > model.depth
+    assert flux[0] == flux[-1] == 1.0
+    assert model.flux(model.period / 7200.0) == 1.0  # planet behind the star
+    assert model.flux(0.5) == pytest.approx(quadratic_transit_flux(model.separation(0.5), model.p, 0.4, 0.25))
+
+    # Contacts are where the chord duration says they are
+    half = model.duration / 7200.0
+    assert model.flux(0.99 * half) < 1.0 and model.flux(1.01 * half) == 1.0
+
+    out = np.empty_like(time)
+    assert model.flux(time, out=out) is out
+
+    with pytest.raises(ValueError):
+        LimbDarkenedTransit(impact_parameter=-0.1)
+
+@pytest.mark.parametrize("model", [TransitSimulator(R_planet_earth=11.2, period_days=4.0),
+                                   LimbDarkenedTransit(R_planet_earth=11.2, period_days=4.0, impact_parameter=0.5)],
+                         ids=["uniform", "limb-darkened"])
+def test_light_curve_over_irregular_timestamps(model):
+    rng = np.random.default_rng(3)
+    epoch = 2459001.3
+    times = 2459000.0 + rng.uniform(0, 40.0, 20000)  # unsorted, ten transits
+    flux = model.light_curve(times, epoch, chunk_size=3000)
+
+    # Direct evaluation around the nearest mid-transit
+    cycles = np.rint((times - epoch) / 4.0)
+    reference = model._transit_flux((times - epoch - cycles * 4.0) * 24.0)
+    assert np.allclose(flux, reference, rtol=0, atol=1e-12)
+    assert set(np.unique(cycles[flux < 1.0])) == set(range(10))
+
+    out = np.empty_like(times)
+    assert model.light_curve(times, epoch, out=out, chunk_size=7) is out
+    assert np.array_equal(out, flux)
+
+    # Mid-transit of a later epoch matches the single-window curve
+    _, window = model.generate_light_curve(duration_hours=6, points=3)
+    assert model.light_curve(np.array([epoch + 5 * 4.0]), epoch)[0] == pytest.approx(window[1])
+
+    with pytest.raises(ValueError):
+        model.light_curve(times, epoch, out=np.empty(10))
@@ -1,5 +1,9 @@
+import pickle
 import pytest
-from zenith.optics import Telescope, CCD
+import numpy as np
+from zenith.optics import Telescope, CCD, Filter
+from zenith.astrophysics import planck_law
+from zenith.utils import h, c, solar_radius, parsec
 
 def test_diffraction_limit():
     # 2.4m telescope (Hubble size)
@@ -19,3 +23,103 @@ def test_snr_calculation():
     # Brighter star should have higher SNR
     snr_bright = t.calculate_snr(target_mag=5, exposure=10, ccd=ccd)
     assert snr_bright > snr
+
+def test_snr_full_broadcast_grid():
+    t = Telescope(aperture=0.203, focal_length=2.0)
+    mags = np.linspace(8, 18, 5)
+    exposures = np.array([1.0, 10.0, 100.0])
+    sky_mags = np.array([18.0, 21.0])
+    read_noise = np.array([1.5, 5.0, 12.0, 20.0])
+
+    ccd = CCD(read_noise=read_noise[None, None, None, :])
+    out = np.empty((5, 3, 2, 4))
+    grid = t.calculate_snr(mags[:, None, None, None], exposures[None, :, None, None], ccd,
+                           sky_mag=sky_mags[None, None, :, None], out=out)
+    assert grid is out
+
+    for i, m in enumerate(mags):
+        for j, e in enumerate(exposures):
+            for k, s in enumerate(sky_mags):
+                for l, r in enumerate(read_noise):
+                    expected = t.calculate_snr(m, e, CCD(read_noise=r), sky_mag=s)
+                    assert abs(grid[i, j, k, l] - expected) < 1e-9 * expected
+
+    # Telescope geometry broadcasts too, including the n_pixels >= 1 clamp
+    scopes = Telescope(aperture=np.array([0.1, 1.0]), focal_length=np.array([0.3, 20.0]))
+    snr = scopes.calculate_snr(12.0, 60.0, CCD())
+    for k, (d, f) in enumerate([(0.1, 0.3), (1.0, 20.0)]):
+        assert abs(snr[k] - Telescope(d, f).calculate_snr(12.0, 60.0, CCD())) < 1e-9 * snr[k]
+
+def test_exposure_and_limiting_magnitude_solvers():
+    t = Telescope(aperture=0.203, focal_length=2.0)
+    ccd = CCD()
+    mags = np.array([8.0, 12.0, 16.0, 19.0])
+    snrs = np.array([5.0, 20.0, 50.0, 10.0])
+
+    # Inverse solvers round-trip through the forward CCD equation
+    exposure = t.exposure_for_snr(mags, snrs, ccd, sky_mag=20.0)
+    assert np.allclose(t.calculate_snr(mags, exposure, ccd, sky_mag=20.0), snrs)
+
+    exposures = np.array([1.0, 30.0, 600.0])
+    limit = t.limiting_magnitude(exposures, 5.0, ccd)
+    assert np.all(np.diff(limit) > 0)
+    assert np.allclose(t.calculate_snr(limit, exposures, ccd), 5.0)
+
+def test_cached_terms_invalidate_and_prepared_instrument():
+    t = Telescope(aperture=0.203, focal_length=2.0)
+    ccd = CCD()
+    base = t.calculate_snr(14.0, 60.0, ccd)
+
+    # Changing either side must not reuse stale cached terms
+    ccd.read_noise = 15.0
+    assert t.calculate_snr(14.0, 60.0, ccd) < base
+    ccd.read_noise = 1.5
+    t.aperture = 0.4
+    assert t.calculate_snr(14.0, 60.0, ccd) > base
+    assert abs(t.area - np.pi * 0.2 * 0.2) < 1e-12
+    t.aperture = 0.203
+    assert t.calculate_snr(14.0, 60.0, ccd) == pytest.approx(base, rel=1e-12)
+
+    instrument = t.prepare(ccd, sky_mag=21.0)
+    assert instrument.snr(14.0, 60.0) == pytest.approx(base, rel=1e-12)
+    mags = np.linspace(8, 18, 7)
+    assert np.allclose(instrument.snr(mags, 60.0), t.calculate_snr(mags, 60.0, ccd))
+
+    with pytest.raises(AttributeError):
+        ccd.gain = 2.0
+    clone = pickle.loads(pickle.dumps(t))
+    assert clone.calculate_snr(14.0, 60.0, pickle.loads(pickle.dumps(ccd))) == pytest.approx(base, rel=1e-12)
+
+def test_spectral_snr_matches_direct_integration():
+
+    wavelength = np.linspace(480e-9, 620e-9, 141)
+    transmission = np.exp(-0.5 * ((wavelength - 550e-9) / 30e-9) ** 2)
+    band = Filter(wavelength, transmission, name='V')
+    ccd = CCD(qe_curve=([300e-9, 1000e-9], [0.5, 0.9]))
+    t = Telescope(aperture=0.203, focal_length=2.0)
+
+    temps = np.array([3000.0, 5778.0, 12000.0, 30000.0])
+    distance = 25.0 * parsec
+    rate = band.electron_flux(temps, ccd, solar_radius, distance)
+    for T, r in zip(temps, rate):
+        integrand = (np.pi * planck_law(wavelength, T) * (solar_radius / distance) ** 2
+                     * wavelength / (h * c) * transmission * ccd.qe_at(wavelength))
+        assert r == pytest.approx(np.trapezoid(integrand, wavelength), rel=1e-12)
+
+    # Chunking does not change the result
+    assert np.allclose(band.electron_flux(temps, ccd, solar_radius, distance, chunk_size=3), rate, rtol=1e-14)
+
+    # The spectral SNR agrees with the magnitude form on the filter's AB zero point
+    snr = t.spectral_snr(temps, 60.0, ccd, band, radius=solar_radius, distance=distance)
+    instrument = t.prepare(ccd, sky_mag=21.0, bandpass=band)
+    ab_mag = -2.5 * np.log10(rate / band.weights(ccd)[1])
+    assert np.allclose(snr, instrument.snr(ab_mag, 60.0))
+    assert t.spectral_snr(5778.0, 60.0, ccd, band, distance=distance) == pytest.approx(snr[1])
+    assert np.allclose(t.spectral_snr(list(temps), 60.0, ccd, band, radius=solar_radius, distance=distance), snr)
+    assert np.allclose(band.electron_flux(tuple(temps), ccd, solar_radius, distance), rate)
+
+    # The cached weights follow changes to the QE curve
+    weights = band.weights(ccd)[0]
+    assert band.weights(ccd)[0] is weights
+    ccd.qe_curve = ([300e-9, 1000e-9], [0.9, 0.9])
+    assert np.all(band.weights(ccd)[0] > weights)
@@ -0,0 +1,34 @@
+import pytest
+import numpy as np
+from zenith.optics import Telescope, CCD
+from zenith.exoplanets import TransitSimulator
+from zenith.plotting import render_performance_curves, render_light_curves, LightCurvePlot
+
+def test_batch_rendering_writes_every_file(tmp_path):
+    scopes = [Telescope(aperture=d, focal_length=2.0) for d in (0.1, 0.2, 0.4)]
+    names = [str(tmp_path / f"snr_{i}.png") for i in range(3)]
+    assert render_performance_curves(scopes, CCD(), names, workers=2) == names
+
+    planets = [TransitSimulator(period_days=p) for p in (1.0, 3.0, 10.0)]
+    curves = [str(tmp_path / f"lc_{i}.png") for i in range(3)]
+    assert render_light_curves(planets, curves, seed=1, workers=1) == curves
+
+    for name in names + curves:
+        with open(name, "rb") as f:
+            assert f.read(8) == b"\x89PNG\r\n\x1a\n"
+
+    with pytest.raises(ValueError):
+        render_performance_curves(scopes, [CCD()], names)
+
+def test_template_is_reused_and_methods_delegate(tmp_path):
+    plot = LightCurvePlot()
+    axes = plot.figure.axes
+    for p in (1.0, 5.0):
+        plot.render(TransitSimulator(period_days=p), str(tmp_path / "lc.png"), rng=np.random.default_rng(0))
+    assert plot.figure.axes == axes
+    assert "P=5.0d" in axes[0].get_title()
+    assert len(axes[0].lines) == 2
+
+    Telescope(0.203, 2.0).plot_performance_curve([10, 18], CCD(), filename=str(tmp_path / "snr.png"))
+    TransitSimulator(period_days=4.0).plot_light_curve(filename=str(tmp_path / "transit.png"))
+    assert (tmp_path / "snr.png").exists() and (tmp_path / "transit.png").exists()
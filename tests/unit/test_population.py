@@ -0,0 +1,64 @@
+import tracemalloc
+import pytest
+import numpy as np
+from zenith.astrophysics import PhotometryTable, luminosity_from_radius_temp
+from zenith.population import (iter_population, synthesize_population, Histogram, Histogram2D,
+                               HRDiagram, LuminosityFunction)
+
+def test_reducers_match_full_array_histograms():
+    photometry = PhotometryTable()
+    chunks = [{name: values.copy() for name, values in chunk.items()}
+              for chunk in iter_population(25000, chunk_size=4000, seed=5, photometry=photometry,
+                                           temperature_scatter=0.03)]
+    full = {name: np.concatenate([c[name] for c in chunks]) for name in chunks[0]}
+    assert len(full['mass']) == 25000
+    assert full['mass'].min() >= 0.1 and full['mass'].max() <= 50.0
+    assert np.allclose(full['luminosity'], luminosity_from_radius_temp(full['radius'], full['temperature']))
+
+    reducers = [
+        Histogram('mass', 40, (0.1, 5.0)),
+        Histogram('temperature', np.geomspace(1000, 60000, 30)),
+        HRDiagram(bins=(20, 25)),
+        LuminosityFunction(bins=30, range=(-5.0, 15.0), mag_limit=14.0),
+        Histogram2D(lambda c: c['B'] - c['V'], 'V', bins=(15, 20), range=((-0.5, 2.0), (0.0, 25.0))),
+    ]
+    synthesize_population(25000, reducers, chunk_size=4000, seed=5, photometry=photometry,
+                          temperature_scatter=0.03)
+
+    assert np.array_equal(reducers[0].counts, np.histogram(full['mass'], 40, (0.1, 5.0))[0])
+    assert np.array_equal(reducers[1].counts, np.histogram(full['temperature'], reducers[1].edges)[0])
+    hr = np.histogram2d(full['log_temperature'], full['absolute_magnitude'], bins=(20, 25),
+                        range=((3.3, 4.8), (-10.0, 20.0)))[0]
+    assert np.array_equal(reducers[2].counts, hr)
+    bright = full['apparent_magnitude'] <= 14.0
+    lf = np.histogram(full['absolute_magnitude'][bright], 30, (-5.0, 15.0))[0]
+    assert np.array_equal(reducers[3].counts, lf)
+    cmd = np.histogram2d(full['B'] - full['V'], full['V'], bins=(15, 20), range=((-0.5, 2.0), (0.0, 25.0)))[0]
+    assert np.array_equal(reducers[4].counts, cmd)
+
+    with pytest.raises(ValueError):
+        Histogram('mass', 10)
+
+def test_peak_memory_is_independent_of_population_size():
+    peaks = []
+    for n in (100000, 800000):
+        tracemalloc.start()
+        synthesize_population(n, [HRDiagram(), LuminosityFunction()], chunk_size=50000, seed=1)
+        peaks.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    assert peaks[1] < 1.2 * peaks[0]
+
+@pytest.mark.parametrize("bins, low, high", [(40, 0.0, 1.0), (37, -3.3, 7.1), (100, 3.3, 4.8)])
+def test_uniform_bins_match_numpy_at_edges(bins, low, high):
+    edges = np.linspace(low, high, bins + 1)
+    values = np.concatenate([edges, np.nextafter(edges, -np.inf), np.nextafter(edges, np.inf)])
+    chunk = {'x': values, 'y': values[::-1].copy()}
+
+    hist = Histogram('x', bins, (low, high))
+    hist.update(chunk)
+    assert np.array_equal(hist.counts, np.histogram(values, bins, (low, high))[0])
+
+    grid = Histogram2D('x', 'y', (bins, bins), ((low, high), (low, high)))
+    grid.update(chunk)
+    reference = np.histogram2d(chunk['x'], chunk['y'], (bins, bins), ((low, high), (low, high)))[0]
+    assert np.array_equal(grid.counts, reference)
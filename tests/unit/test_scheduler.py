@@ -0,0 +1,31 @@
+import pytest
+import numpy as np
+from zenith.astrometry import Observer
+from zenith.optics import Telescope, CCD
+from zenith.scheduler import schedule_night
+
+def test_schedule_night_respects_constraints():
+    rng = np.random.default_rng(1)
+    n = 2000
+    ra = rng.uniform(0, 360, n)
+    dec = rng.uniform(-30, 90, n)
+    priority = rng.uniform(1, 10, n)
+    mag = rng.uniform(8, 14, n)
+    lat, lon = 59.3, 18.0
+    start, end = 2461061.2, 2461061.6
+
+    plan = schedule_night(ra, dec, priority, mag, 20.0, Telescope(0.203, 2.0), CCD(),
+                          lat, lon, start, end, max_airmass=2.0, overhead=30.0)
+
+    assert len(plan.target) > 10
+    assert len(set(plan.target)) == len(plan.target)
+    assert np.all(plan.start >= start) and np.all(plan.end <= end)
+    # Blocks are sequential and leave room for the overhead
+    assert np.all(plan.start[1:] - plan.end[:-1] >= 30.0 / 86400.0 - 1e-9)
+    assert np.allclose((plan.end - plan.start) * 86400.0, plan.exposure, atol=1e-3)
+    assert np.allclose(Telescope(0.203, 2.0).calculate_snr(mag[plan.target], plan.exposure, CCD()), 20.0)
+
+    # Every observation stays under the airmass limit from start to end
+    obs = Observer(lat, lon)
+    for i, t0, t1 in zip(plan.target, plan.start, plan.end):
+        assert np.all(obs.airmass(ra[i], dec[i], np.array([t0, t1])) <= 2.0 + 1e-6)
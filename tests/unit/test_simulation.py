@@ -0,0 +1,67 @@
+import pytest
+import numpy as np
+from scipy.special import j0, j1
+from zenith.optics import Telescope, CCD
+from zenith.simulation import simulate_frame, sky_to_pixel
+from zenith.parallel import SharedArray, _SharedBlock
+
+SCOPE = Telescope(aperture=0.203, focal_length=2.0)
+CAMERA = CCD()
+
+def test_star_flux_is_conserved():
+    zero = SCOPE.prepare(CAMERA).zero_rate * 60.0
+    for psf in ('gaussian', 'airy'):
+        frame = simulate_frame([50.3], [40.7], [10.0], SCOPE, CAMERA, 100, 80, psf=psf, fwhm=2.0,
+                               sky_mag=60.0, noise=False, dtype=np.float64)
+        star = zero * 10 ** -4
+        assert np.unravel_index(frame.argmax(), frame.shape) == (41, 50)
+        if psf == 'gaussian':
+            assert frame.sum() == pytest.approx(star + 8000 * 0.01 * 60.0, rel=1e-5)
+        else:
+            # Airy stamps lose the encircled-energy tail outside the stamp
+            fwhm_pixels = 2.0 / SCOPE.pixel_scale(CAMERA)
+            v = 1.028993969962188 * np.pi / fwhm_pixels * np.ceil(3 * fwhm_pixels)
+            enclosed = 1 - j0(v) ** 2 - j1(v) ** 2
+            assert frame.sum() - 8000 * 0.01 * 60.0 == pytest.approx(star * enclosed, rel=0.02)
+
+def test_tiles_and_workers_do_not_change_the_frame():
+    rng = np.random.default_rng(3)
+    x = rng.uniform(-5, 205, 300)
+    y = rng.uniform(-5, 155, 300)
+    mag = rng.uniform(8, 16, 300)
+
+    model = simulate_frame(x, y, mag, SCOPE, CAMERA, 200, 150, noise=False, dtype=np.float64)
+    tiled = simulate_frame(x, y, mag, SCOPE, CAMERA, 200, 150, noise=False, dtype=np.float64, tile_size=37)
+    assert np.allclose(model, tiled, rtol=1e-12)
+
+    serial = simulate_frame(x, y, mag, SCOPE, CAMERA, 200, 150, seed=7, tile_size=64, workers=1)
+    parallel = simulate_frame(x, y, mag, SCOPE, CAMERA, 200, 150, seed=7, tile_size=64, workers=2)
+    assert serial.dtype == np.float32
+    assert np.array_equal(serial, parallel)
+
+    # The noise streams belong to fixed pixel blocks, not to tiles
+    for tile_size in (37, 128, 1024):
+        retiled = simulate_frame(x, y, mag, SCOPE, CAMERA, 200, 150, seed=7, tile_size=tile_size)
+        assert np.array_equal(serial, retiled)
+    assert not np.array_equal(serial, simulate_frame(x, y, mag, SCOPE, CAMERA, 200, 150, seed=8))
+
+    # Parallel frames are returned in the workers' shared memory, or the caller's SharedArray
+    assert isinstance(parallel.base, _SharedBlock)
+    with SharedArray((150, 200), np.float32) as shared:
+        result = simulate_frame(x, y, mag, SCOPE, CAMERA, 200, 150, seed=7, tile_size=64, workers=2, out=shared)
+        assert result is shared.array
+        assert np.array_equal(result, serial)
+
+def test_background_noise_statistics():
+    frame = simulate_frame([], [], [], SCOPE, CAMERA, 256, 256, sky_mag=21.0, seed=1)
+    pixel_scale = SCOPE.pixel_scale(CAMERA)
+    zero = SCOPE.prepare(CAMERA).zero_rate * 60.0
+    background = zero * 10 ** (-0.4 * 21.0) * pixel_scale ** 2 + 0.01 * 60.0
+    assert frame.mean() == pytest.approx(background, rel=0.01)
+    assert frame.var() == pytest.approx(background + 1.5 ** 2, rel=0.05)
+
+def test_sky_to_pixel_centre_and_scale():
+    x, y = sky_to_pixel([10.0, 10.0], [20.0, 20.1], 10.0, 20.0, SCOPE, CAMERA, 101, 51)
+    assert x[0] == pytest.approx(50.0) and y[0] == pytest.approx(25.0)
+    # 0.1 degrees north is 360 arcsec over the pixel scale
+    assert y[1] - y[0] == pytest.approx(360.0 / SCOPE.pixel_scale(CAMERA), rel=1e-4)
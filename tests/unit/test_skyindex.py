@@ -0,0 +1,49 @@
+import pytest
+import datetime
+import numpy as np
+from zenith.astrometry import ra_dec_to_alt_az
+from zenith.optics import Telescope, CCD
+from zenith.skyindex import SkyIndex
+
+@pytest.fixture
+def catalog():
+    rng = np.random.default_rng(42)
+    ra = rng.uniform(0.0, 360.0, 20000)
+    dec = np.degrees(np.arcsin(rng.uniform(-1.0, 1.0, 20000)))
+    return ra, dec
+
+def _separation(ra1, dec1, ra2, dec2):
+    r1, d1, r2, d2 = map(np.radians, (ra1, dec1, ra2, dec2))
+    cos_sep = np.sin(d1) * np.sin(d2) + np.cos(d1) * np.cos(d2) * np.cos(r1 - r2)
+    return np.degrees(np.arccos(np.clip(cos_sep, -1.0, 1.0)))
+
+def test_cone_search_matches_brute_force(catalog):
+    ra, dec = catalog
+    index = SkyIndex(ra, dec)
+    found = index.query_cone(120.0, 35.0, 5.0)
+    expected = np.flatnonzero(_separation(ra, dec, 120.0, 35.0) <= 5.0)
+    assert np.array_equal(found, expected)
+
+def test_field_query_sized_from_instrument(catalog):
+    ra, dec = catalog
+    index = SkyIndex(ra, dec)
+    scope = Telescope(aperture=0.203, focal_length=0.5)
+    ccd = CCD(pixel_size=3.76e-6)
+    width, height = scope.field_of_view(ccd, 9576, 6388)
+
+    found = index.query_field(200.0, -10.0, scope, ccd, 9576, 6388)
+    assert len(found) > 0
+    # Everything found lies within the circumscribed circle of the field
+    assert np.all(_separation(ra[found], dec[found], 200.0, -10.0) <= np.hypot(width, height) / 2)
+    # And a wider field never loses stars
+    assert set(found) <= set(index.query_fov(200.0, -10.0, width * 1.5, height * 1.5))
+
+def test_above_horizon_matches_transform(catalog):
+    ra, dec = catalog
+    index = SkyIndex(ra, dec)
+    t = datetime.datetime(2026, 1, 20, 22, 0, 0, tzinfo=datetime.timezone.utc)
+    found = index.above_horizon(59.3, 18.0, t, min_altitude=30.0)
+    alt, _ = ra_dec_to_alt_az(ra, dec, 59.3, 18.0, t)
+    expected = np.flatnonzero(alt >= 30.0)
+    # Allow disagreement only for stars sitting on the limit
+    assert len(set(found) ^ set(expected)) <= 2
@@ -0,0 +1,32 @@
+import pytest
+import numpy as np
+from zenith.astrometry import Observer
+from zenith.skymap import sky_map, sky_grid
+from zenith.parallel import SharedArray, _SharedBlock
+
+TIMES = np.datetime64('2026-01-20T16:00') + np.arange(3) * np.timedelta64(2, 'h')
+
+def test_sky_map_matches_transform():
+    cube = sky_map(59.3, 18.0, TIMES, n_ra=36, n_dec=18, dtype=np.float64, workers=1)
+    assert cube.shape == (3, 18, 36)
+
+    ra, dec = sky_grid(36, 18)
+    ra_cells, dec_cells = np.meshgrid(ra, dec)
+    alt, _ = Observer(59.3, 18.0).alt_az(ra_cells, dec_cells, TIMES)
+    assert np.allclose(cube, np.moveaxis(alt, -1, 0), atol=1e-9)
+
+def test_sky_map_shared_memory_workers():
+    serial = sky_map(59.3, 18.0, TIMES, n_ra=64, n_dec=32, quantity='airmass', workers=1)
+    parallel = sky_map(59.3, 18.0, TIMES, n_ra=64, n_dec=32, quantity='airmass', workers=2)
+    assert parallel.dtype == np.float32
+    assert np.array_equal(serial, parallel)
+    finite = np.isfinite(serial)
+    assert finite.any() and not finite.all()
+    assert np.all(serial[finite] >= 1.0 - 1e-6)
+
+    # The parallel cube is the workers' shared memory itself, or the caller's SharedArray
+    assert isinstance(parallel.base, _SharedBlock)
+    with SharedArray(serial.shape, np.float32) as shared:
+        result = sky_map(59.3, 18.0, TIMES, n_ra=64, n_dec=32, quantity='airmass', workers=2, out=shared)
+        assert result is shared.array
+        assert np.array_equal(result, serial)
@@ -0,0 +1,31 @@
+import pytest
+import datetime
+import numpy as np
+from zenith.time import julian_date, unix_to_jd, datetime64_to_jd, local_sidereal_time
+from zenith.astrometry import calculate_lst, ra_dec_to_alt_az
+
+def test_julian_date_j2000():
+    # J2000 epoch is JD 2451545.0 in every supported representation
+    dt = datetime.datetime(2000, 1, 1, 12, 0, 0, tzinfo=datetime.timezone.utc)
+    assert abs(julian_date(dt) - 2451545.0) < 1e-9
+    assert abs(unix_to_jd(dt.timestamp()) - 2451545.0) < 1e-9
+    assert abs(datetime64_to_jd(np.datetime64('2000-01-01T12:00:00')) - 2451545.0) < 1e-9
+
+def test_lst_grid_matches_scalar():
+    start = datetime.datetime(2026, 1, 20, 16, 0, 0, tzinfo=datetime.timezone.utc)
+    times = [start + datetime.timedelta(hours=h) for h in range(12)]
+    times64 = np.array([t.replace(tzinfo=None) for t in times], dtype='datetime64[us]')
+    jd = julian_date(times64)
+
+    lst_jd = calculate_lst(18.0, jd)
+    lst_64 = local_sidereal_time(times64, 18.0)
+    for i, t in enumerate(times):
+        expected = calculate_lst(18.0, t)
+        assert abs(lst_jd[i] - expected) < 1e-6
+        assert abs(lst_64[i] - expected) < 1e-8
+
+def test_alt_az_accepts_julian_date_grid():
+    times64 = np.datetime64('2026-01-20T16:00') + np.arange(5) * np.timedelta64(1, 'h')
+    alt_jd, _ = ra_dec_to_alt_az(np.array([101.28]), np.array([-16.72]), 59.3, 18.0, julian_date(times64))
+    alt_64, _ = ra_dec_to_alt_az(np.array([101.28]), np.array([-16.72]), 59.3, 18.0, times64)
+    assert np.allclose(alt_jd, alt_64, atol=1e-6)
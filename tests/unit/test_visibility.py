@@ -0,0 +1,50 @@
+import pytest
+import numpy as np
+from zenith.astrometry import Observer
+from zenith.visibility import IntervalSet, visibility_windows
+
+def test_interval_set_operations():
+    a = IntervalSet([0, 0, 1], [0.0, 2.0, 0.0], [1.0, 3.0, 5.0])
+    b = IntervalSet([0, 1], [0.5, 1.0], [2.5, 2.0])
+
+    u = a.union(b)
+    assert list(u.index) == [0, 1]
+    assert list(u.start) == [0.0, 0.0] and list(u.end) == [3.0, 5.0]
+
+    i = a.intersection(b)
+    assert list(i.index) == [0, 0, 1]
+    assert list(i.start) == [0.5, 2.0, 1.0] and list(i.end) == [1.0, 2.5, 2.0]
+
+    assert len(i.min_duration(0.75)) == 1
+    assert np.allclose(i.total_duration(), [1.0, 1.0])
+
+    # Overlapping input intervals are merged on construction
+    merged = IntervalSet([0, 0], [0.0, 0.5], [1.0, 2.0])
+    assert len(merged) == 1 and merged.end[0] == 2.0
+
+def test_visibility_windows_match_sampling():
+    lat, lon = 59.3, 18.0
+    ras = np.array([101.28, 10.68, 37.95, 280.0, 200.0])
+    decs = np.array([-16.72, 41.26, 89.26, -60.0, 20.0])
+    start, end = 2461061.0, 2461063.5
+
+    windows = visibility_windows(ras, decs, lat, lon, start, end, max_airmass=2.0)
+    night = windows.within([2461061.1, 2461062.1], [2461061.4, 2461062.4])
+
+    # Dense sampling reference
+    times = np.linspace(start, end, 20001)
+    visible = Observer(lat, lon).airmass(ras, decs, times) <= 2.0
+    step = times[1] - times[0]
+    for i in range(len(ras)):
+        s, e = windows.for_target(i)
+        inside = np.zeros(len(times), dtype=bool)
+        for a, b in zip(s, e):
+            inside |= (times >= a) & (times <= b)
+        # Only samples within one step of a window edge may disagree
+        assert np.count_nonzero(inside != visible[i]) <= 2 * len(s) + 2
+
+        s_n, e_n = night.for_target(i)
+        assert np.all(s_n >= 2461061.1) and np.all(e_n <= 2461062.4)
+
+    assert len(windows.for_target(3)[0]) == 0
+    assert np.isclose(windows.total_duration()[2], end - start)
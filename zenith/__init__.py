@@ -1,6 +1,16 @@
 from .utils import *
+from .time import *
 from .astrometry import *
 from .optics import *
 from .astrophysics import *
 from .exoplanets import *
 from .cosmology import *
+from .visibility import *
+from .skyindex import *
+from .catalog import *
+from .scheduler import *
+from .skymap import *
+from .design import *
+from .simulation import *
+from .plotting import *
+from .population import *
@@ -1,6 +1,10 @@
 import math
-from datetime import datetime, timezone
+import numpy as np
+from collections import OrderedDict, namedtuple
+from functools import lru_cache
+from datetime import datetime
 from zenith.utils import deg_to_rad, rad_to_deg
+from zenith.time import local_sidereal_time, julian_date, JD_J2000, _GMST_RATE, _datetime_to_unix
 
 # ⚡ Bolt: Hoist constant calculation for radians/degrees conversions to eliminate
 # math.radians and math.degrees function call overhead (~3.8x faster for scalars).
@@ -11,13 +15,21 @@ def calculate_lst(longitude, time):
     """
     Calculate Local Sidereal Time (LST) in degrees.
 
+    A single datetime takes the scalar fast path. datetime64 arrays and
+    Julian Date arrays (e.g. the output of `zenith.time.julian_date`) are
+    evaluated for the whole time grid in one call.
+
     Parameters:
         longitude (float): Observer's longitude in degrees (East is positive).
-        time (datetime): UTC datetime object.
+        time (datetime, datetime64 or array): datetime object (naive values
+            are UTC), datetime64 array or array of Julian Dates.
 
     Returns:
-        float: LST in degrees [0, 360).
+        float or array: LST in degrees [0, 360).
     """
+    if not isinstance(time, datetime):
+        return local_sidereal_time(time, longitude)
+
     # Julian Date calculation
     # J2000 epoch is 2000-01-01 12:00:00 UTC
     # JD at J2000 = 2451545.0
@@ -25,12 +37,9 @@ def calculate_lst(longitude, time):
     # ⚡ Bolt: Mathematically expand and combine scalar terms to prevent redundant assignments
     # and operations.
     # d = (ts / 86400.0) + 2440587.5 - 2451545.0
-    # ⚡ Bolt: Conditionally check tzinfo to avoid redundant replace call (~2.5x speedup)
-    if time.tzinfo == timezone.utc:
-        ts = time.timestamp()
-    else:
-        ts = time.replace(tzinfo=timezone.utc).timestamp()
-    d = (ts / 86400.0) - 10957.5
+    # Naive datetimes are UTC; aware ones are converted from their own zone,
+    # exactly as in `zenith.time.julian_date`.
+    d = (_datetime_to_unix(time) / 86400.0) - 10957.5
 
     # Greenwich Mean Sidereal Time (GMST) in degrees
     # Approximate formula
@@ -39,20 +48,109 @@ def calculate_lst(longitude, time):
     # Local Sidereal Time
     return (gmst + longitude) % 360.0
 
+def _lst_trig(lst):
+    """Return (sin, cos) of local sidereal time(s) given in degrees."""
+    lst_rad = np.asarray(lst, dtype=float) * _DEG_TO_RAD
+    # A single time yields NumPy scalars; keep ndarrays so callers can work in place
+    return np.asarray(np.sin(lst_rad)), np.asarray(np.cos(lst_rad))
+
+def _star_trig(ra, dec, time_ndim):
+    """
+    Return (sin(Dec), sin(RA)cos(Dec), cos(RA)cos(Dec)) for a set of stars,
+    with trailing singleton axes so they broadcast against the time axes.
+    """
+    ra, dec = np.broadcast_arrays(np.asarray(ra, dtype=float), np.asarray(dec, dtype=float))
+    star_shape = ra.shape + (1,) * time_ndim
+    ra_rad = (ra * _DEG_TO_RAD).reshape(star_shape)
+    dec_rad = (dec * _DEG_TO_RAD).reshape(star_shape)
+
+    cos_dec = np.cos(dec_rad)
+    return np.sin(dec_rad), np.sin(ra_rad) * cos_dec, np.cos(ra_rad) * cos_dec
+
+def _sin_alt_from_trig(ra, dec, sin_lat, cos_lat, sin_lst, cos_lst):
+    """
+    Broadcast sin(altitude) over a grid of stars and precomputed sin/cos(LST).
+
+    The result has shape ``ra.shape + lst.shape``.
+    """
+    sin_dec, sin_ra_cos_dec, cos_ra_cos_dec = _star_trig(ra, dec, np.ndim(sin_lst))
+
+    # cos(HA)cos(Dec) = cos(LST)cos(RA)cos(Dec) + sin(LST)sin(RA)cos(Dec)
+    # np.asarray: one star at one time multiplies out to a NumPy scalar
+    sin_alt = np.asarray(cos_ra_cos_dec * cos_lst)
+    sin_alt += sin_ra_cos_dec * sin_lst
+    sin_alt *= cos_lat
+    sin_alt += sin_dec * sin_lat
+    np.clip(sin_alt, -1.0, 1.0, out=sin_alt)
+    return sin_alt
+
+def _alt_az_from_trig(ra, dec, sin_lat, cos_lat, sin_lst, cos_lst):
+    """
+    Broadcast alt/az over a grid of stars (ra, dec) and precomputed sin/cos(LST).
+
+    The result has shape ``ra.shape + lst.shape``: one row per star, one
+    column per time step.
+    """
+    sin_dec, sin_ra_cos_dec, cos_ra_cos_dec = _star_trig(ra, dec, np.ndim(sin_lst))
+
+    # ⚡ Bolt: Expand sin/cos(LST - RA) with the angle-addition identities so the
+    # transcendental calls scale with N_stars + N_times instead of N_stars * N_times.
+    # cos(HA) * cos(Dec)
+    cos_ha_cos_dec = cos_ra_cos_dec * cos_lst
+    # np.asarray: one star at one time multiplies out to NumPy scalars, which
+    # cannot take the out= buffers below
+    tmp = np.asarray(sin_ra_cos_dec * sin_lst)
+    cos_ha_cos_dec += tmp
+
+    # Altitude
+    alt = np.asarray(cos_ha_cos_dec * cos_lat)
+    alt += sin_dec * sin_lat
+    np.clip(alt, -1.0, 1.0, out=alt)
+    np.arcsin(alt, out=alt)
+    alt *= _RAD_TO_DEG
+
+    # Azimuth via atan2(-sin(HA)cos(Dec), sin(Dec)cos(Lat) - sin(Lat)cos(HA)cos(Dec))
+    # ⚡ Bolt: Reuse the cos(HA)cos(Dec) buffer in place for the X term.
+    X = cos_ha_cos_dec
+    X *= -sin_lat
+    X += sin_dec * cos_lat
+    Y = np.multiply(sin_ra_cos_dec, cos_lst, out=tmp)
+    Y -= cos_ra_cos_dec * sin_lst
+    az = np.arctan2(Y, X, out=Y)
+    az *= _RAD_TO_DEG
+    np.mod(az, 360.0, out=az)
+
+    return alt, az
+
 def ra_dec_to_alt_az(ra, dec, lat, lon, time):
     """
     Convert Right Ascension/Declination to Altitude/Azimuth.
 
+    Scalar inputs with a single datetime use a pure-Python fast path. If
+    ``ra``/``dec`` are arrays, or ``time`` is an array of datetime64 values
+    or Julian Dates, the result is broadcast to shape
+    ``ra.shape + time.shape`` (e.g. (N_stars, N_times)).
+
     Parameters:
-        ra (float): Right Ascension in degrees.
-        dec (float): Declination in degrees.
+        ra (float or array): Right Ascension in degrees.
+        dec (float or array): Declination in degrees.
         lat (float): Observer's latitude in degrees.
         lon (float): Observer's longitude in degrees.
-        time (datetime): UTC datetime object.
+        time (datetime, datetime64 or array): datetime object (naive values
+            are UTC), datetime64 array or array of Julian Dates.
 
     Returns:
         tuple: (altitude, azimuth) in degrees.
     """
+    if (isinstance(ra, np.ndarray) or isinstance(dec, np.ndarray)
+            or not isinstance(time, datetime)):
+        lst = local_sidereal_time(time, lon)
+        lat_rad = lat * _DEG_TO_RAD
+        sin_lst, cos_lst = _lst_trig(lst)
+        alt, az = _alt_az_from_trig(ra, dec, math.sin(lat_rad), math.cos(lat_rad), sin_lst, cos_lst)
+        # A single target at a single time returns scalars, like the datetime path
+        return alt[()], az[()]
+
     lst = calculate_lst(lon, time)
     ha = (lst - ra) % 360.0 # Hour Angle in degrees
 
@@ -111,16 +209,221 @@ def ra_dec_to_alt_az(ra, dec, lat, lon, time):
 
     return alt, az % 360.0
 
+def radec_to_unit_vector(ra, dec):
+    """
+    Convert RA/Dec to Cartesian unit vectors on the celestial sphere.
+
+    Parameters:
+        ra (float or array): Right Ascension in degrees.
+        dec (float or array): Declination in degrees.
+
+    Returns:
+        array: Unit vectors with shape ``ra.shape + (3,)``.
+    """
+    ra_rad = np.asarray(ra, dtype=float) * _DEG_TO_RAD
+    dec_rad = np.asarray(dec, dtype=float) * _DEG_TO_RAD
+    ra_rad, dec_rad = np.broadcast_arrays(ra_rad, dec_rad)
+
+    xyz = np.empty(ra_rad.shape + (3,))
+    cos_dec = np.cos(dec_rad)
+    np.multiply(cos_dec, np.cos(ra_rad), out=xyz[..., 0])
+    np.multiply(cos_dec, np.sin(ra_rad), out=xyz[..., 1])
+    np.sin(dec_rad, out=xyz[..., 2])
+    return xyz
+
+def unit_vector_to_radec(xyz):
+    """
+    Convert Cartesian vectors on the celestial sphere back to RA/Dec.
+
+    Parameters:
+        xyz (array): Vectors with shape ``(..., 3)`` (need not be normalized).
+
+    Returns:
+        tuple: (ra, dec) in degrees, RA in [0, 360).
+    """
+    xyz = np.asarray(xyz, dtype=float)
+    x = xyz[..., 0]
+    y = xyz[..., 1]
+    z = xyz[..., 2]
+    ra = np.mod(np.arctan2(y, x) * _RAD_TO_DEG, 360.0)
+    dec = np.arctan2(z, np.hypot(x, y)) * _RAD_TO_DEG
+    return ra, dec
+
+_ARCSEC_TO_RAD = _DEG_TO_RAD / 3600.0
+
+def _rotation_x(angle):
+    c = math.cos(angle)
+    s = math.sin(angle)
+    return np.array([[1.0, 0.0, 0.0], [0.0, c, s], [0.0, -s, c]])
+
+def _rotation_y(angle):
+    c = math.cos(angle)
+    s = math.sin(angle)
+    return np.array([[c, 0.0, -s], [0.0, 1.0, 0.0], [s, 0.0, c]])
+
+def _rotation_z(angle):
+    c = math.cos(angle)
+    s = math.sin(angle)
+    return np.array([[c, s, 0.0], [-s, c, 0.0], [0.0, 0.0, 1.0]])
+
+# ⚡ Bolt: Cache rotation matrices per epoch; a whole catalog then costs one
+# 3x3 matrix multiply per epoch instead of per-star trigonometry.
+@lru_cache(maxsize=128)
+def _precession_matrix(jd):
+    # IAU 1976 (Lieske) precession angles from J2000 to the epoch
+    T = (jd - JD_J2000) / 36525.0
+    zeta = (2306.2181 + (0.30188 + 0.017998 * T) * T) * T * _ARCSEC_TO_RAD
+    z = (2306.2181 + (1.09468 + 0.018203 * T) * T) * T * _ARCSEC_TO_RAD
+    theta = (2004.3109 - (0.42665 + 0.041833 * T) * T) * T * _ARCSEC_TO_RAD
+    matrix = _rotation_z(-z) @ _rotation_y(theta) @ _rotation_z(-zeta)
+    matrix.flags.writeable = False
+    return matrix
+
+@lru_cache(maxsize=128)
+def _nutation_matrix(jd):
+    # Main terms of the IAU 1980 nutation series (~0.5 arcsec accuracy)
+    T = (jd - JD_J2000) / 36525.0
+    omega = (125.04452 - 1934.136261 * T) * _DEG_TO_RAD
+    L = (280.4665 + 36000.7698 * T) * _DEG_TO_RAD
+    L_moon = (218.3165 + 481267.8813 * T) * _DEG_TO_RAD
+    d_psi = (-17.20 * math.sin(omega) - 1.32 * math.sin(2 * L)
+             - 0.23 * math.sin(2 * L_moon) + 0.21 * math.sin(2 * omega)) * _ARCSEC_TO_RAD
+    d_eps = (9.20 * math.cos(omega) + 0.57 * math.cos(2 * L)
+             + 0.10 * math.cos(2 * L_moon) - 0.09 * math.cos(2 * omega)) * _ARCSEC_TO_RAD
+    # Mean obliquity of the ecliptic
+    eps0 = (84381.448 - (46.8150 + (0.00059 - 0.001813 * T) * T) * T) * _ARCSEC_TO_RAD
+    matrix = _rotation_x(-(eps0 + d_eps)) @ _rotation_z(-d_psi) @ _rotation_x(eps0)
+    matrix.flags.writeable = False
+    return matrix
+
+@lru_cache(maxsize=128)
+def _precession_nutation_matrix(jd):
+    matrix = _nutation_matrix(jd) @ _precession_matrix(jd)
+    matrix.flags.writeable = False
+    return matrix
+
+def precession_matrix(epoch):
+    """
+    Rotation matrix from J2000 mean coordinates to mean coordinates of date.
+
+    Parameters:
+        epoch (datetime, datetime64 or float): Target epoch (UTC or Julian Date).
+
+    Returns:
+        array: Read-only 3x3 rotation matrix (cached per epoch).
+    """
+    return _precession_matrix(float(julian_date(epoch)))
+
+def nutation_matrix(epoch):
+    """
+    Rotation matrix from mean to true coordinates of date.
+
+    Parameters:
+        epoch (datetime, datetime64 or float): Target epoch (UTC or Julian Date).
+
+    Returns:
+        array: Read-only 3x3 rotation matrix (cached per epoch).
+    """
+    return _nutation_matrix(float(julian_date(epoch)))
+
+def j2000_to_date(ra, dec, epoch, nutation=True):
+    """
+    Precess (and optionally nutate) J2000 catalog positions to an epoch.
+
+    Use the result as input to `ra_dec_to_alt_az` or `Observer` for accurate
+    pointing; all stars share one cached rotation matrix per epoch.
+
+    Parameters:
+        ra (float or array): J2000 Right Ascension in degrees.
+        dec (float or array): J2000 Declination in degrees.
+        epoch (datetime, datetime64 or float): Target epoch (UTC or Julian Date).
+        nutation (bool): Apply nutation to get true (rather than mean) coordinates of date.
+
+    Returns:
+        tuple: (ra, dec) of date in degrees.
+    """
+    jd = float(julian_date(epoch))
+    matrix = _precession_nutation_matrix(jd) if nutation else _precession_matrix(jd)
+    # Row vectors: v_date = M @ v_J2000  <=>  V_date = V_J2000 @ M.T
+    xyz = radec_to_unit_vector(ra, dec) @ matrix.T
+    return unit_vector_to_radec(xyz)
+
+RiseTransitSet = namedtuple('RiseTransitSet', ['rise', 'transit', 'set', 'circumpolar', 'never_rises'])
+
+def _rise_transit_set(ra, dec, sin_lat, cos_lat, lon, time, altitude):
+    """Closed-form rise/transit/set solver shared by the function and Observer."""
+    jd0 = julian_date(time)
+    ra = np.asarray(ra, dtype=float)
+    dec_rad = np.asarray(dec, dtype=float) * _DEG_TO_RAD
+
+    shape = np.broadcast(ra, dec_rad, jd0).shape
+
+    # Next upper transit (HA = 0) at or after the reference time. LST advances
+    # at the sidereal rate, so the wait is the RA-LST gap divided by that rate.
+    lst0 = local_sidereal_time(jd0, lon)
+    transit = np.array(np.broadcast_to((ra - lst0) % 360.0 / _GMST_RATE + jd0, shape))
+
+    # Hour angle at which the target crosses the altitude threshold:
+    # cos(H0) = (sin(h0) - sin(lat)sin(dec)) / (cos(lat)cos(dec))
+    cos_h0 = math.sin(altitude * _DEG_TO_RAD) - sin_lat * np.sin(dec_rad)
+    cos_h0 /= cos_lat * np.cos(dec_rad)
+    cos_h0 = np.broadcast_to(cos_h0, shape)
+
+    circumpolar = cos_h0 <= -1.0
+    never_rises = cos_h0 >= 1.0
+
+    # Half the time spent above the threshold, in days
+    half = np.array(np.arccos(np.clip(cos_h0, -1.0, 1.0)))
+    half *= _RAD_TO_DEG / _GMST_RATE
+    no_crossing = circumpolar | never_rises
+    half[no_crossing] = np.nan
+
+    rise = transit - half
+    set_ = transit + half
+    # transit[()]: a single target returns scalars like rise and set
+    return RiseTransitSet(rise, transit[()], set_, circumpolar, never_rises)
+
+def rise_transit_set(ra, dec, lat, lon, time, altitude=0.0):
+    """
+    Solve rise, transit and set times in closed form for many targets at once.
+
+    The transit is the first upper culmination at or after ``time``; rise and
+    set are the crossings of ``altitude`` either side of that transit, so a
+    rise earlier than ``time`` means the target is already up.
+
+    Parameters:
+        ra (float or array): Right Ascension in degrees.
+        dec (float or array): Declination in degrees.
+        lat (float): Observer's latitude in degrees.
+        lon (float): Observer's longitude in degrees.
+        time (datetime, datetime64 or float): Reference UTC time or Julian Date.
+        altitude (float): Altitude threshold in degrees (e.g. 30 for airmass 2).
+
+    Returns:
+        RiseTransitSet: (rise, transit, set, circumpolar, never_rises) arrays.
+            Times are Julian Dates; rise/set are NaN for circumpolar targets
+            and for targets that never reach the threshold.
+    """
+    lat_rad = lat * _DEG_TO_RAD
+    return _rise_transit_set(ra, dec, math.sin(lat_rad), math.cos(lat_rad), lon, time, altitude)
+
 def calculate_airmass(altitude):
     """
     Calculate airmass using simple approximation (sec(z)).
 
     Parameters:
-        altitude (float): Altitude in degrees.
+        altitude (float or array): Altitude in degrees.
 
     Returns:
-        float: Airmass (approximate).
+        float or array: Airmass (approximate), inf at or below the horizon.
     """
+    if isinstance(altitude, np.ndarray):
+        airmass = np.full(altitude.shape, np.inf)
+        above = altitude > 0
+        sin_alt = np.sin(altitude * _DEG_TO_RAD)
+        np.divide(1.0, sin_alt, out=airmass, where=above)
+        return airmass
+
     if altitude <= 0:
         return float('inf')
 
@@ -128,3 +431,134 @@ def calculate_airmass(altitude):
     # Mathematically, cos(90 - alt) = sin(alt)
     # ⚡ Bolt: Using sin(alt) directly avoids subtraction and reduces operations
     return 1.0 / math.sin(altitude * _DEG_TO_RAD)
+
+class Observer:
+    """
+    Represents an observing site for repeated, batched coordinate transforms.
+
+    Site trigonometry is computed once, and LST (with its sine/cosine) is
+    memoized per time grid in a bounded LRU cache so that repeated queries
+    against the same grid skip the sidereal time calculation entirely.
+    """
+    def __init__(self, lat, lon, cache_size=32):
+        """
+        Parameters:
+            lat (float): Observer's latitude in degrees.
+            lon (float): Observer's longitude in degrees (East is positive).
+            cache_size (int): Maximum number of time grids kept in the LST cache.
+        """
+        self.lat = lat
+        self.lon = lon
+        # ⚡ Bolt: Hoist site trigonometry out of the per-call transform.
+        lat_rad = lat * _DEG_TO_RAD
+        self._sin_lat = math.sin(lat_rad)
+        self._cos_lat = math.cos(lat_rad)
+        self._cache_size = cache_size
+        self._lst_cache = OrderedDict()
+
+    @staticmethod
+    def _time_key(time):
+        """Hashable key identifying a time or time grid."""
+        if isinstance(time, datetime):
+            return time
+        arr = np.asarray(time)
+        return (arr.dtype.str, arr.shape, arr.tobytes())
+
+    def _lst_terms(self, time):
+        """Return cached (lst, sin_lst, cos_lst) for a time or time grid."""
+        key = self._time_key(time)
+        cache = self._lst_cache
+        terms = cache.get(key)
+        if terms is not None:
+            cache.move_to_end(key)
+            return terms
+
+        lst = np.asarray(calculate_lst(self.lon, time), dtype=float)
+        sin_lst, cos_lst = _lst_trig(lst)
+        # Cached arrays are shared between calls, so keep them immutable
+        for arr in (lst, sin_lst, cos_lst):
+            arr.flags.writeable = False
+        terms = (lst, sin_lst, cos_lst)
+
+        cache[key] = terms
+        while len(cache) > self._cache_size:
+            cache.popitem(last=False)
+        return terms
+
+    def lst(self, time):
+        """
+        Local Sidereal Time in degrees for a time or time grid (cached).
+
+        Parameters:
+            time (datetime, datetime64 or array): UTC time(s) or Julian Dates.
+
+        Returns:
+            array: LST in degrees [0, 360), read-only.
+        """
+        return self._lst_terms(time)[0]
+
+    def hour_angle(self, ra, time):
+        """
+        Hour angle of one or more targets.
+
+        Parameters:
+            ra (float or array): Right Ascension in degrees.
+            time (datetime, datetime64 or array): UTC time(s) or Julian Dates.
+
+        Returns:
+            array: Hour angle in degrees [0, 360), shape ``ra.shape + time.shape``.
+        """
+        lst = self._lst_terms(time)[0]
+        ra = np.asarray(ra, dtype=float)
+        ha = np.asarray(lst - ra.reshape(ra.shape + (1,) * lst.ndim))
+        np.mod(ha, 360.0, out=ha)
+        return ha
+
+    def alt_az(self, ra, dec, time):
+        """
+        Convert RA/Dec to Alt/Az, broadcasting targets against the time grid.
+
+        Parameters:
+            ra (float or array): Right Ascension in degrees.
+            dec (float or array): Declination in degrees.
+            time (datetime, datetime64 or array): UTC time(s) or Julian Dates.
+
+        Returns:
+            tuple: (altitude, azimuth) in degrees, shape ``ra.shape + time.shape``.
+        """
+        _, sin_lst, cos_lst = self._lst_terms(time)
+        return _alt_az_from_trig(ra, dec, self._sin_lat, self._cos_lat, sin_lst, cos_lst)
+
+    def airmass(self, ra, dec, time):
+        """
+        Airmass (sec(z) approximation) of one or more targets.
+
+        Parameters:
+            ra (float or array): Right Ascension in degrees.
+            dec (float or array): Declination in degrees.
+            time (datetime, datetime64 or array): UTC time(s) or Julian Dates.
+
+        Returns:
+            array: Airmass, inf at or below the horizon, shape ``ra.shape + time.shape``.
+        """
+        _, sin_lst, cos_lst = self._lst_terms(time)
+        # ⚡ Bolt: Airmass only needs sin(alt), so skip the arcsin and the azimuth entirely.
+        sin_alt = _sin_alt_from_trig(ra, dec, self._sin_lat, self._cos_lat, sin_lst, cos_lst)
+        airmass = np.full(sin_alt.shape, np.inf)
+        np.divide(1.0, sin_alt, out=airmass, where=sin_alt > 0)
+        return airmass
+
+    def rise_transit_set(self, ra, dec, time, altitude=0.0):
+        """
+        Closed-form rise, transit and set times (see `rise_transit_set`).
+
+        Parameters:
+            ra (float or array): Right Ascension in degrees.
+            dec (float or array): Declination in degrees.
+            time (datetime, datetime64 or float): Reference UTC time or Julian Date.
+            altitude (float): Altitude threshold in degrees.
+
+        Returns:
+            RiseTransitSet: (rise, transit, set, circumpolar, never_rises) arrays.
+        """
+        return _rise_transit_set(ra, dec, self._sin_lat, self._cos_lat, self.lon, time, altitude)
@@ -1,6 +1,6 @@
 import numpy as np
 import math
-from zenith.utils import h, c, k_B, sigma_sb
+from zenith.utils import h, c, k_B, sigma_sb, parsec, solar_radius, AB_ZERO_FLUX, _ufunc_out, _ufunc_result
 
 # ⚡ Bolt: Hoist constant scalar calculations to module level to avoid redundant arithmetic overhead
 # on every function invocation without sacrificing code readability.
@@ -11,17 +11,60 @@ _STEFAN_BOLTZMANN_CONSTANT = 4.0 * np.pi * sigma_sb
 _PLANCK_A = 2.0 * h * c**2
 _PLANCK_HC_K = (h * c) / k_B
 
-def planck_law(wavelength, temperature):
+def _planck_into(out, wavelength, temperature, grid):
+    """Evaluate Planck's Law into a preallocated buffer."""
+    wavelength = np.asarray(wavelength, dtype=np.float64)
+    temperature = np.asarray(temperature, dtype=np.float64)
+    # ⚡ Bolt: The a / lambda^5 prefactor only depends on wavelength, so it is
+    # computed once per wavelength in float64 (lambda^5 underflows float32 range
+    # for short wavelengths) instead of once per grid cell.
+    w2 = wavelength * wavelength
+    prefactor = _PLANCK_A / (w2 * w2 * wavelength)
+    inv_t = _PLANCK_HC_K / temperature
+    if grid:
+        np.multiply.outer(inv_t, 1.0 / wavelength, out=out)
+    else:
+        np.divide(inv_t, wavelength, out=out)
+    with np.errstate(over='ignore'):
+        np.expm1(out, out=out)
+    np.divide(prefactor, out, out=out)
+    return out
+
+def planck_law(wavelength, temperature, grid=False, out=None, dtype=None):
     """
     Calculate spectral radiance of a blackbody using Planck's Law.
 
     Parameters:
         wavelength (float or array): Wavelength in meters.
-        temperature (float): Temperature in Kelvin.
+        temperature (float or array): Temperature in Kelvin.
+        grid (bool): Evaluate every temperature at every wavelength, returning
+            an (N_temperatures, N_wavelengths) matrix for 1-D inputs instead
+            of broadcasting them elementwise.
+        out (array): Optional output buffer with the result shape.
+        dtype: Result dtype for array results (e.g. np.float32 to halve the
+            memory of large grids); defaults to out's dtype or float64.
 
     Returns:
         float or array: Spectral radiance (B_lambda) in W sr^-1 m^-3.
     """
+    if grid or out is not None or dtype is not None:
+        if grid:
+            shape = np.shape(temperature) + np.shape(wavelength)
+        else:
+            shape = np.broadcast_shapes(np.shape(wavelength), np.shape(temperature))
+        if out is None:
+            out = np.empty(shape, dtype=dtype if dtype is not None else np.float64)
+        elif out.shape != shape:
+            raise ValueError(f"out must have shape {shape}")
+        if grid:
+            # Outer product over flattened axes, then the (T..., lambda...) shape
+            flat = out.reshape(np.size(temperature), np.size(wavelength))
+            _planck_into(flat, np.ravel(wavelength), np.ravel(temperature), True)
+            if not np.shares_memory(flat, out):
+                out[...] = flat.reshape(shape)
+            return out
+        return _planck_into(out, wavelength, temperature, False)
+
     a = _PLANCK_A
     hc_k = _PLANCK_HC_K
 
@@ -64,30 +107,125 @@ def planck_law(wavelength, temperature):
         # ⚡ Bolt: np.expm1(b) is more numerically stable than np.exp(b) - 1.0
         return a / (w5 * math.expm1(b))
 
-def wien_displacement(temperature):
+def iter_planck_grid(wavelength, temperature, chunk_size=4096, dtype=np.float64):
+    """
+    Evaluate a Planck temperature x wavelength grid in blocks of temperatures.
+
+    Every block is written into the same reused buffer, so grids larger than
+    memory can be reduced block by block (e.g. ``block @ weights``).
+
+    Parameters:
+        wavelength (array): 1-D wavelength grid in meters.
+        temperature (array): 1-D temperatures in Kelvin.
+        chunk_size (int): Number of temperatures per block.
+        dtype: Block dtype.
+
+    Yields:
+        tuple: (start, stop, block) where block is the (stop - start, N_wavelengths)
+            radiance of ``temperature[start:stop]``; it is overwritten by the
+            next block, so copy it to keep it.
+    """
+    wavelength = np.ravel(wavelength)
+    temperature = np.ravel(temperature)
+    buffer = np.empty((min(chunk_size, len(temperature)), len(wavelength)), dtype=dtype)
+    for start in range(0, len(temperature), chunk_size):
+        stop = min(start + chunk_size, len(temperature))
+        block = buffer[:stop - start]
+        planck_law(wavelength, temperature[start:stop], grid=True, out=block)
+        yield start, stop, block
+
+class PlanckEvaluator:
+    """
+    Planck's Law on a fixed wavelength grid, for repeated evaluation.
+
+    Spectral fits evaluate B_lambda(T) on the same observed wavelengths for
+    many trial temperatures. The wavelength-only terms (a / lambda^5 and
+    hc / (k lambda)) are tabulated once here, so each evaluation is three
+    array passes (scale, expm1, divide) and matches `planck_law` to rounding.
+    """
+    def __init__(self, wavelength, dtype=np.float64):
+        """
+        Parameters:
+            wavelength (array): Wavelength grid in meters.
+            dtype: Result dtype (np.float32 halves memory and bandwidth).
+        """
+        wavelength = np.array(wavelength, dtype=np.float64)
+        w2 = wavelength * wavelength
+        # Tabulated in float64 (lambda^5 underflows float32 range), then cast
+        prefactor = (_PLANCK_A / (w2 * w2 * wavelength)).astype(dtype)
+        inv_wavelength = (_PLANCK_HC_K / wavelength).astype(dtype)
+        for array in (wavelength, prefactor, inv_wavelength):
+            array.flags.writeable = False
+        self.wavelength = wavelength
+        self.dtype = np.dtype(dtype)
+        self._prefactor = prefactor
+        self._inv_wavelength = inv_wavelength
+
+    def __call__(self, temperature, out=None):
+        """
+        Spectral radiance at every wavelength of the grid.
+
+        Parameters:
+            temperature (float or array): Temperature(s) in Kelvin.
+            out (array): Optional output buffer of shape
+                ``temperature.shape + wavelength.shape``.
+
+        Returns:
+            array: Spectral radiance (B_lambda) in W sr^-1 m^-3, one row per temperature.
+        """
+        temperature = np.asarray(temperature, dtype=float)
+        shape = temperature.shape + self.wavelength.shape
+        if out is None:
+            out = np.empty(shape, dtype=self.dtype)
+        elif out.shape != shape:
+            raise ValueError(f"out must have shape {shape}")
+
+        if temperature.ndim:
+            np.multiply.outer(1.0 / temperature, self._inv_wavelength, out=out)
+        else:
+            np.multiply(self._inv_wavelength, 1.0 / temperature, out=out)
+        with np.errstate(over='ignore'):
+            np.expm1(out, out=out)
+        np.divide(self._prefactor, out, out=out)
+        return out
+
+def wien_displacement(temperature, out=None, where=True, dtype=None):
     """
     Calculate peak wavelength using Wien's Displacement Law.
 
     Parameters:
-        temperature (float): Temperature in Kelvin.
+        temperature (float or array): Temperature in Kelvin.
+        out, where, dtype: NumPy ufunc-style keywords.
 
     Returns:
-        float: Peak wavelength in meters.
+        float or array: Peak wavelength in meters.
     """
     b_wien = 2.8977719e-3 # Wien's displacement constant [m K]
-    return b_wien / temperature
+    if out is None and where is True and dtype is None:
+        return b_wien / temperature
+    res = _ufunc_out(out, dtype, temperature)
+    np.divide(b_wien, temperature, out=res, where=where)
+    return _ufunc_result(res, out is not None)
 
-def distance_modulus(m, M):
+def distance_modulus(m, M, out=None, where=True, dtype=None):
     """
     Calculate distance using distance modulus formula.
 
     Parameters:
-        m (float): Apparent magnitude.
-        M (float): Absolute magnitude.
+        m (float or array): Apparent magnitude.
+        M (float or array): Absolute magnitude.
+        out, where, dtype: NumPy ufunc-style keywords.
 
     Returns:
-        float: Distance in parsecs.
+        float or array: Distance in parsecs.
     """
+    if out is not None or where is not True or dtype is not None:
+        res = _ufunc_out(out, dtype, m, M)
+        np.subtract(m, M, out=res, where=where)
+        np.add(res, 5.0, out=res, where=where)
+        np.multiply(res, 0.4605170185988092, out=res, where=where)
+        np.exp(res, out=res, where=where)
+        return _ufunc_result(res, out is not None)
     # m - M = 5 * log10(d) - 5
     if isinstance(m, np.ndarray) or isinstance(M, np.ndarray):
         # ⚡ Bolt: Mathematically expand and group scalar additions/subtractions
@@ -109,17 +247,25 @@ def distance_modulus(m, M):
         # ⚡ Bolt: Combined scalar constants (2.302585092994046 / 5.0 = 0.4605170185988092) to avoid multiple intermediate array allocations
         return math.exp(0.4605170185988092 * (m - M + 5.0))
 
-def absolute_magnitude(m, d):
+def absolute_magnitude(m, d, out=None, where=True, dtype=None):
     """
     Calculate absolute magnitude given apparent magnitude and distance.
 
     Parameters:
-        m (float): Apparent magnitude.
-        d (float): Distance in parsecs.
+        m (float or array): Apparent magnitude.
+        d (float or array): Distance in parsecs.
+        out, where, dtype: NumPy ufunc-style keywords.
 
     Returns:
-        float: Absolute magnitude.
+        float or array: Absolute magnitude.
     """
+    if out is not None or where is not True or dtype is not None:
+        res = _ufunc_out(out, dtype, m, d)
+        np.log(d, out=res, where=where)
+        np.multiply(res, -2.171472409516259, out=res, where=where)
+        np.add(res, m, out=res, where=where)
+        np.add(res, 5.0, out=res, where=where)
+        return _ufunc_result(res, out is not None)
     if isinstance(m, np.ndarray) or isinstance(d, np.ndarray):
         # ⚡ Bolt: If d is scalar, pre-calculate the scalar log term using np.log
         # to completely eliminate redundant array broadcasting and logarithm evaluation,
@@ -148,18 +294,56 @@ def absolute_magnitude(m, d):
         # This maps to highly-optimized C-level np.log and provides ~30% speedup
         return m - 2.171472409516259 * math.log(d) + 5.0
 
-def luminosity_from_radius_temp(radius, temperature):
+def apparent_magnitude(M, d, out=None, where=True, dtype=None):
+    """
+    Calculate apparent magnitude given absolute magnitude and distance.
+
+    Parameters:
+        M (float or array): Absolute magnitude.
+        d (float or array): Distance in parsecs.
+        out, where, dtype: NumPy ufunc-style keywords.
+
+    Returns:
+        float or array: Apparent magnitude.
+    """
+    if out is not None or where is not True or dtype is not None:
+        res = _ufunc_out(out, dtype, M, d)
+        np.log(d, out=res, where=where)
+        np.multiply(res, 2.171472409516259, out=res, where=where)
+        np.add(res, M, out=res, where=where)
+        np.subtract(res, 5.0, out=res, where=where)
+        return _ufunc_result(res, out is not None)
+    if isinstance(M, np.ndarray) or isinstance(d, np.ndarray):
+        # ⚡ Bolt: Fast array logarithm (log10(x) -> ln(x) / ln(10))
+        res = np.log(d)
+        res = res * 2.171472409516259
+        res = res + M
+        res -= 5.0
+        return res
+    return M + 2.171472409516259 * math.log(d) - 5.0
+
+def luminosity_from_radius_temp(radius, temperature, out=None, where=True, dtype=None):
     """
     Calculate luminosity using Stefan-Boltzmann Law.
     L = 4 * pi * R^2 * sigma * T^4
 
     Parameters:
-        radius (float): Radius in meters.
-        temperature (float): Temperature in Kelvin.
+        radius (float or array): Radius in meters.
+        temperature (float or array): Temperature in Kelvin.
+        out, where, dtype: NumPy ufunc-style keywords.
 
     Returns:
-        float: Luminosity in Watts.
+        float or array: Luminosity in Watts.
     """
+    if out is not None or where is not True or dtype is not None:
+        res = _ufunc_out(out, dtype, radius, temperature)
+        np.multiply(temperature, temperature, out=res, where=where)
+        np.multiply(res, res, out=res, where=where)
+        # Scale before the radius factors so that float32 does not overflow
+        np.multiply(res, _STEFAN_BOLTZMANN_CONSTANT, out=res, where=where)
+        np.multiply(res, radius, out=res, where=where)
+        np.multiply(res, radius, out=res, where=where)
+        return _ufunc_result(res, out is not None)
     # ⚡ Bolt: Moved sigma_sb import to top level to avoid repeated import overhead inside function
     # ⚡ Bolt: Unroll small integer powers to avoid NumPy generic power overhead (~2x faster)
     if isinstance(radius, np.ndarray) or isinstance(temperature, np.ndarray):
@@ -192,3 +376,176 @@ def luminosity_from_radius_temp(radius, temperature):
         # to avoid creating redundant intermediate arrays.
         # ⚡ Bolt: Use module-level pre-calculated constant to prevent redundant arithmetic on every call (~35% speedup)
         return _STEFAN_BOLTZMANN_CONSTANT * (r2 * t4)
+
+# Approximate Johnson-Cousins UBVRI bandpasses as Gaussians: (center, FWHM) in meters
+JOHNSON_BANDS = {
+    'U': (365e-9, 66e-9),
+    'B': (445e-9, 94e-9),
+    'V': (551e-9, 88e-9),
+    'R': (658e-9, 138e-9),
+    'I': (806e-9, 149e-9),
+}
+
+# ln(10) / 2.5, for magnitudes via natural logarithms
+_MAG_LN = 0.9210340371976183
+
+def gaussian_bandpass(center, fwhm, samples=201):
+    """
+    Gaussian filter transmission curve sampled over +-3 FWHM.
+
+    Parameters:
+        center (float): Central wavelength in meters.
+        fwhm (float): Full width at half maximum in meters.
+        samples (int): Number of wavelength samples.
+
+    Returns:
+        tuple: (wavelength, transmission) arrays.
+    """
+    wavelength = np.linspace(center - 3.0 * fwhm, center + 3.0 * fwhm, samples)
+    wavelength = wavelength[wavelength > 0]
+    x = (wavelength - center) * (2.0 * math.sqrt(2.0 * math.log(2.0)) / fwhm)
+    return wavelength, np.exp(-0.5 * x * x)
+
+def _band_curve(band):
+    """(wavelength, transmission) of a Filter-like object or a pair of arrays."""
+    if hasattr(band, 'wavelength'):
+        return np.asarray(band.wavelength, dtype=float), np.asarray(band.transmission, dtype=float)
+    wavelength, transmission = band
+    return np.asarray(wavelength, dtype=float), np.asarray(transmission, dtype=float)
+
+class PhotometryTable:
+    """
+    Band-integrated blackbody AB magnitudes tabulated over temperature.
+
+    Each band is integrated once per tabulated temperature (as a single
+    Planck grid x quadrature-weight product); stars are then looked up by
+    vectorized interpolation in log temperature, so magnitudes and colors
+    for millions of stars cost a few array passes.
+    """
+    def __init__(self, bands=None, t_min=1000.0, t_max=100000.0, n_temperatures=1024):
+        """
+        Parameters:
+            bands (dict): Band name -> Filter (anything with ``wavelength`` and
+                ``transmission``) or a (wavelength, transmission) pair, wavelength
+                in meters. Defaults to Gaussian approximations of UBVRI.
+            t_min (float): Lowest tabulated temperature in Kelvin.
+            t_max (float): Highest tabulated temperature in Kelvin.
+            n_temperatures (int): Number of log-spaced tabulated temperatures.
+        """
+        if bands is None:
+            bands = {name: gaussian_bandpass(*spec) for name, spec in JOHNSON_BANDS.items()}
+        self.log_temperature = np.linspace(math.log(t_min), math.log(t_max), n_temperatures)
+        temperatures = np.exp(self.log_temperature)
+        self._surface = {}
+        for name, band in bands.items():
+            wavelength, transmission = _band_curve(band)
+            step = np.diff(wavelength)
+            dlam = np.zeros_like(wavelength)
+            dlam[:-1] += 0.5 * step
+            dlam[1:] += 0.5 * step
+            response = transmission * dlam
+            # Photon-counting AB magnitude:
+            # m = -2.5 log10( int f_lambda lambda T dlambda / (c * 3631 Jy * int T / lambda dlambda) )
+            # with f_lambda = pi B_lambda (R / d)^2; the table holds R = d.
+            weights = np.pi * wavelength * response
+            zero = c * AB_ZERO_FLUX * float(np.sum(response / wavelength))
+            with np.errstate(divide='ignore'):
+                flux = planck_law(wavelength, temperatures, grid=True) @ weights
+                self._surface[name] = np.log(flux / zero) / -_MAG_LN
+        self.bands = tuple(self._surface)
+        self._slope = {name: np.diff(table) for name, table in self._surface.items()}
+
+    def _position(self, log_temperature):
+        """Table cell index and fractional offset of each log temperature."""
+        # ⚡ Bolt: The table is uniform in log T, so the cell is found by direct
+        # arithmetic (no binary search) and shared across every band lookup.
+        grid = self.log_temperature
+        pos = (np.asarray(log_temperature, dtype=float) - grid[0]) * ((len(grid) - 1) / (grid[-1] - grid[0]))
+        inside = (pos >= 0) & (pos <= len(grid) - 1)
+        index = np.where(inside, np.minimum(np.floor(pos), len(grid) - 2), 0.0)
+        frac = np.where(inside, pos - index, np.nan)
+        return index.astype(np.intp), frac
+
+    def _lookup(self, band, position):
+        index, frac = position
+        table = self._surface[band]
+        slope = self._slope[band]
+        return table[index] + frac * slope[index]
+
+    @staticmethod
+    def _radius_term(radius):
+        # -5 log10(R / 10 pc)
+        if isinstance(radius, np.ndarray):
+            return np.log(radius / (10.0 * parsec)) * -2.171472409516259
+        return -2.171472409516259 * math.log(radius / (10.0 * parsec))
+
+    def absolute_magnitude(self, band, temperature, radius=solar_radius):
+        """
+        Absolute AB magnitude of blackbody stars in a band.
+
+        Parameters:
+            band (str): Band name.
+            temperature (float or array): Effective temperature in Kelvin
+                (NaN outside the tabulated range).
+            radius (float or array): Stellar radius in meters.
+
+        Returns:
+            float or array: Absolute magnitude (at 10 parsecs).
+        """
+        return self._lookup(band, self._position(np.log(temperature))) + self._radius_term(radius)
+
+    def magnitudes(self, temperature, radius=solar_radius, distance=None, bands=None):
+        """
+        AB magnitudes of blackbody stars in several bands.
+
+        Parameters:
+            temperature (float or array): Effective temperature in Kelvin.
+            radius (float or array): Stellar radius in meters.
+            distance (float or array): Distance in parsecs; apparent magnitudes
+                when given, absolute magnitudes otherwise.
+            bands (list): Band names (default: all bands).
+
+        Returns:
+            dict: Band name -> magnitudes.
+        """
+        # ⚡ Bolt: Shared per-star terms are computed once for all bands
+        position = self._position(np.log(np.asarray(temperature, dtype=float)))
+        offset = self._radius_term(radius)
+        if distance is not None:
+            offset = apparent_magnitude(offset, distance)
+        result = {}
+        for band in (self.bands if bands is None else bands):
+            mag = self._lookup(band, position)
+            mag += offset
+            result[band] = mag
+        return result
+
+    def color_index(self, band1, band2, temperature):
+        """
+        Color index (e.g. B - V) of blackbody stars; independent of radius and distance.
+
+        Parameters:
+            band1 (str): First band name.
+            band2 (str): Second band name.
+            temperature (float or array): Effective temperature in Kelvin.
+
+        Returns:
+            float or array: band1 - band2 in AB magnitudes.
+        """
+        position = self._position(np.log(temperature))
+        return self._lookup(band1, position) - self._lookup(band2, position)
+
+    def distance(self, band, m, temperature, radius=solar_radius):
+        """
+        Photometric distance from an apparent magnitude in a band.
+
+        Parameters:
+            band (str): Band name.
+            m (float or array): Apparent AB magnitude in the band.
+            temperature (float or array): Effective temperature in Kelvin.
+            radius (float or array): Stellar radius in meters.
+
+        Returns:
+            float or array: Distance in parsecs.
+        """
+        return distance_modulus(np.asarray(m, dtype=float), self.absolute_magnitude(band, temperature, radius))
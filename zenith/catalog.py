@@ -0,0 +1,141 @@
+"""
+Zenith Catalog: Memory-mapped columnar star catalogs
+
+A catalog is a directory with one .npy file per column plus a small JSON
+manifest. Columns open as read-only memory maps, so catalogs larger than
+RAM can be streamed in fixed-size, zero-copy chunks straight into the
+vectorized astrometry, astrophysics and optics functions.
+"""
+
+import os
+import json
+import itertools
+import numpy as np
+
+MANIFEST_NAME = "catalog.json"
+
+def _column_path(path, name):
+    return os.path.join(path, f"{name}.npy")
+
+def _write_manifest(path, columns, rows):
+    with open(os.path.join(path, MANIFEST_NAME), "w") as f:
+        json.dump({"columns": list(columns), "rows": int(rows)}, f)
+
+def write_catalog(path, **columns):
+    """
+    Write in-memory column arrays as a columnar catalog.
+
+    Parameters:
+        path (str): Output directory (created if missing).
+        **columns (array): One 1-D array per column, all of equal length.
+
+    Returns:
+        Catalog: The catalog opened from disk.
+    """
+    lengths = {len(v) for v in columns.values()}
+    if len(lengths) > 1:
+        raise ValueError("All catalog columns must have the same length")
+    os.makedirs(path, exist_ok=True)
+    for name, values in columns.items():
+        np.save(_column_path(path, name), np.ascontiguousarray(values))
+    _write_manifest(path, columns, lengths.pop() if lengths else 0)
+    return Catalog(path)
+
+def csv_to_catalog(csv_path, path, columns=None, dtype=np.float64, block_rows=100000):
+    """
+    Convert a CSV star list with a header row to a columnar catalog.
+
+    The CSV is parsed in blocks of ``block_rows`` and written straight into
+    memory-mapped .npy files, so the input never has to fit in memory.
+
+    Parameters:
+        csv_path (str): Input CSV file with a header row of column names.
+        path (str): Output directory (created if missing).
+        columns (list): Column names to keep (default: all header columns).
+        dtype: Storage dtype for every column (e.g. np.float32 to halve the size).
+        block_rows (int): Number of CSV rows parsed per block.
+
+    Returns:
+        Catalog: The catalog opened from disk.
+    """
+    with open(csv_path, "r") as f:
+        header = [name.strip() for name in f.readline().split(",")]
+        rows = sum(1 for line in f if line.strip())
+
+    if columns is None:
+        columns = header
+    missing = [name for name in columns if name not in header]
+    if missing:
+        raise ValueError(f"Columns not found in CSV header: {missing}")
+    usecols = [header.index(name) for name in columns]
+
+    os.makedirs(path, exist_ok=True)
+    outputs = [np.lib.format.open_memmap(_column_path(path, name), mode="w+", dtype=dtype, shape=(rows,))
+               for name in columns]
+
+    with open(csv_path, "r") as f:
+        f.readline()
+        offset = 0
+        while True:
+            lines = list(itertools.islice(f, block_rows))
+            if not lines:
+                break
+            block = np.loadtxt(lines, delimiter=",", usecols=usecols, dtype=dtype, ndmin=2)
+            n = len(block)
+            for j, out in enumerate(outputs):
+                out[offset:offset + n] = block[:, j]
+            offset += n
+
+    for out in outputs:
+        out.flush()
+    del outputs
+    _write_manifest(path, columns, rows)
+    return Catalog(path)
+
+class Catalog:
+    """
+    Read-only columnar star catalog backed by memory-mapped .npy files.
+    """
+    def __init__(self, path):
+        """
+        Parameters:
+            path (str): Catalog directory written by `csv_to_catalog` or `write_catalog`.
+        """
+        self.path = path
+        with open(os.path.join(path, MANIFEST_NAME), "r") as f:
+            manifest = json.load(f)
+        self.columns = manifest["columns"]
+        self._rows = manifest["rows"]
+        self._data = {name: np.load(_column_path(path, name), mmap_mode="r") for name in self.columns}
+
+    def __len__(self):
+        return self._rows
+
+    def __getitem__(self, name):
+        return self._data[name]
+
+    def __contains__(self, name):
+        return name in self._data
+
+    def __repr__(self):
+        return f"Catalog({self.path!r}, {self._rows} rows, columns={self.columns})"
+
+    def iter_chunks(self, chunk_size=1000000, columns=None):
+        """
+        Iterate over the catalog in fixed-size chunks.
+
+        Each chunk is a dict of zero-copy views into the memory maps, so
+        pages are only read from disk when a computation touches them.
+
+        Parameters:
+            chunk_size (int): Number of rows per chunk (the last may be shorter).
+            columns (list): Column names to include (default: all).
+
+        Yields:
+            dict: Column name -> 1-D read-only array view.
+        """
+        names = self.columns if columns is None else columns
+        data = [self._data[name] for name in names]
+        for start in range(0, self._rows, chunk_size):
+            stop = start + chunk_size
+            yield {name: col[start:stop] for name, col in zip(names, data)}
@@ -0,0 +1,154 @@
+"""
+Zenith Design: Instrument design-space sweeps with Pareto front extraction
+
+Telescope/camera combinations are evaluated as struct-of-arrays chunks of
+a Cartesian parameter grid, so millions of configurations never turn into
+millions of Python objects, and only the running Pareto front is kept.
+"""
+
+import numpy as np
+from zenith.optics import Telescope, CCD
+from zenith.parallel import run_tasks
+
+PARAMETERS = ('aperture', 'focal_length', 'pixel_size', 'read_noise', 'dark_current', 'quantum_efficiency')
+METRICS = ('diffraction_limit', 'pixel_scale', 'sampling', 'snr', 'limiting_magnitude')
+
+DEFAULT_OBJECTIVES = {'limiting_magnitude': 'max', 'aperture': 'min'}
+
+def pareto_front(costs):
+    """
+    Indices of the non-dominated rows of a cost matrix (all columns minimized).
+
+    Parameters:
+        costs (array): Shape (N, K) objective values, smaller is better.
+
+    Returns:
+        array: Sorted indices of the Pareto-optimal rows (one per duplicate group).
+    """
+    costs = np.asarray(costs, dtype=float)
+    if costs.ndim != 2:
+        raise ValueError("costs must be a 2-D (N, K) array")
+    n, k = costs.shape
+    if n == 0:
+        return np.empty(0, dtype=np.intp)
+
+    # Lexicographic order: no row can be dominated by a row sorted after it
+    order = np.lexsort(costs.T[::-1])
+
+    if k == 2:
+        # ⚡ Bolt: With two objectives a row is optimal iff its second cost beats
+        # every row sorted before it, which is a single running-minimum pass.
+        second = costs[order, 1]
+        best_before = np.minimum.accumulate(second)
+        keep = np.empty(n, dtype=bool)
+        keep[0] = True
+        keep[1:] = second[1:] < best_before[:-1]
+        return np.sort(order[keep])
+
+    # ⚡ Bolt: Pick each pivot as the remaining row with the smallest normalized
+    # cost sum. It is always Pareto-optimal (anything dominating it would have a
+    # smaller sum) and, being central, it prunes far more rows than a row picked
+    # from one end of the lexicographic order.
+    span = costs.max(axis=0) - costs.min(axis=0)
+    span[span == 0] = 1.0
+    score = (costs / span).sum(axis=1)
+
+    front = []
+    candidates = order
+    while len(candidates):
+        best = candidates[np.argmin(score[candidates])]
+        front.append(best)
+        dominated = np.all(costs[candidates] >= costs[best], axis=1)
+        candidates = candidates[~dominated]
+    return np.sort(np.array(front, dtype=np.intp))
+
+def _evaluate(axes, shape, flat_index, settings):
+    """Parameters and metrics for a set of flat grid indices."""
+    coords = np.unravel_index(flat_index, shape)
+    params = {name: axis[i] for name, axis, i in zip(PARAMETERS, axes, coords)}
+
+    telescope = Telescope(params['aperture'], params['focal_length'])
+    ccd = CCD(params['pixel_size'], params['read_noise'], params['dark_current'], params['quantum_efficiency'])
+
+    diffraction = telescope.diffraction_limit(settings['wavelength'])
+    pixel_scale = telescope.pixel_scale(ccd)
+    values = dict(params)
+    values['diffraction_limit'] = diffraction
+    values['pixel_scale'] = pixel_scale
+    values['sampling'] = diffraction / pixel_scale
+    values['snr'] = telescope.calculate_snr(settings['target_mag'], settings['exposure'], ccd, settings['sky_mag'])
+    values['limiting_magnitude'] = telescope.limiting_magnitude(settings['exposure'], settings['snr'], ccd,
+                                                                settings['sky_mag'])
+    return values
+
+def _costs(values, objectives):
+    """Stack objectives as minimization costs."""
+    columns = [values[name] if sense == 'min' else -values[name] for name, sense in objectives.items()]
+    return np.column_stack(columns)
+
+def _chunk_front(axes, shape, start, stop, settings, objectives):
+    """Worker entry point: Pareto front of one chunk of the grid."""
+    flat_index = np.arange(start, stop)
+    costs = _costs(_evaluate(axes, shape, flat_index, settings), objectives)
+    keep = pareto_front(costs)
+    return flat_index[keep], costs[keep]
+
+def design_sweep(aperture, focal_length, pixel_size=3.76e-6, read_noise=1.5, dark_current=0.01,
+                 quantum_efficiency=0.8, target_mag=15.0, exposure=60.0, snr=5.0, sky_mag=21.0,
+                 wavelength=550e-9, objectives=None, chunk_size=1000000, workers=1):
+    """
+    Sweep a Cartesian grid of instrument parameters and return its Pareto front.
+
+    Each parameter is a scalar or a 1-D axis of candidate values. The grid is
+    walked in chunks of ``chunk_size`` configurations (optionally spread over
+    a process pool); every chunk is evaluated with vectorized Telescope/CCD
+    arrays and reduced to its own Pareto front before merging.
+
+    Parameters:
+        aperture (float or array): Aperture diameters in meters.
+        focal_length (float or array): Focal lengths in meters.
+        pixel_size (float or array): Pixel sizes in meters.
+        read_noise (float or array): Read noise in electrons/pixel.
+        dark_current (float or array): Dark current in electrons/pixel/second.
+        quantum_efficiency (float or array): Quantum efficiency (0-1).
+        target_mag (float): Magnitude used for the 'snr' metric.
+        exposure (float): Exposure time in seconds for 'snr' and 'limiting_magnitude'.
+        snr (float): Signal-to-Noise Ratio defining 'limiting_magnitude'.
+        sky_mag (float): Sky background magnitude per arcsec^2.
+        wavelength (float): Wavelength in meters for 'diffraction_limit'.
+        objectives (dict): Column name -> 'min' or 'max'; any parameter or
+            metric ('diffraction_limit', 'pixel_scale', 'sampling', 'snr',
+            'limiting_magnitude'). Defaults to max limiting magnitude, min aperture.
+        chunk_size (int): Configurations evaluated per chunk.
+        workers (int): Number of worker processes.
+
+    Returns:
+        dict: Column name -> array for every Pareto-optimal configuration,
+            including all parameters and metrics plus the flat grid 'index'.
+    """
+    if objectives is None:
+        objectives = DEFAULT_OBJECTIVES
+    for name, sense in objectives.items():
+        if name not in PARAMETERS + METRICS:
+            raise ValueError(f"Unknown objective {name!r}")
+        if sense not in ('min', 'max'):
+            raise ValueError(f"Objective sense must be 'min' or 'max', got {sense!r}")
+
+    axes = tuple(np.atleast_1d(np.asarray(v, dtype=float)).ravel()
+                 for v in (aperture, focal_length, pixel_size, read_noise, dark_current, quantum_efficiency))
+    shape = tuple(len(axis) for axis in axes)
+    total = int(np.prod(shape))
+    settings = {'target_mag': target_mag, 'exposure': exposure, 'snr': snr,
+                'sky_mag': sky_mag, 'wavelength': wavelength}
+
+    tasks = [(axes, shape, start, min(start + chunk_size, total), settings, objectives)
+             for start in range(0, total, chunk_size)]
+    fronts = run_tasks(_chunk_front, tasks, workers)
+
+    index = np.concatenate([f[0] for f in fronts])
+    costs = np.concatenate([f[1] for f in fronts])
+    index = index[pareto_front(costs)]
+
+    result = _evaluate(axes, shape, index, settings)
+    result['index'] = index
+    return result
@@ -1,6 +1,9 @@
+import math
 import numpy as np
-import matplotlib.pyplot as plt
+from collections import OrderedDict
+from scipy.special import ellipk, ellipe, elliprj
 from zenith.utils import G, solar_mass, solar_radius, AU, earth_radius, jupiter_radius
+from zenith.plotting import render_light_curves
 
 # ⚡ Bolt: Hoist constant scalar calculation for Kepler's 3rd Law to module level
 # to avoid redundant arithmetic overhead on every function invocation.
@@ -70,6 +73,10 @@ class TransitSimulator:
         # ⚡ Bolt: Vectorized overlap calculation using np.clip to avoid expensive boolean masking
         # Calculate overlap fraction for all points
 
+        return time_hours, self._transit_flux(time_hours)
+
+    def _transit_flux(self, time_hours):
+        """Normalized flux at times (hours) from mid-transit."""
         # ⚡ Bolt: Use in-place NumPy operations to prevent intermediate array allocations (~2x faster)
         flux = np.abs(time_hours)
         flux *= -self._c2
@@ -77,26 +84,457 @@ class TransitSimulator:
         np.clip(flux, 0.0, 1.0, out=flux)
         flux *= -self.depth
         flux += 1.0
+        return flux
+
+    def _half_window(self):
+        """Hours from mid-transit beyond which the flux is exactly 1."""
+        return self._c1 / self._c2
+
+    def light_curve(self, time_days, epoch_days=0.0, out=None, chunk_size=1048576):
+        """
+        Normalized flux at arbitrary timestamps spanning any number of transits.
+
+        Timestamps need not be uniform or sorted (e.g. years of survey cadence
+        with gaps); each one is folded on the period around the nearest
+        mid-transit.
+
+        Parameters:
+            time_days (array): 1-D timestamps in days (e.g. BJD).
+            epoch_days (float): Time of one mid-transit, in the same time system.
+            out (array): Optional output buffer of the same length.
+            chunk_size (int): Timestamps folded per chunk; temporary memory
+                scales with this only.
 
-        return time_hours, flux
+        Returns:
+            array: Normalized flux for every timestamp.
+        """
+        time_days = np.asarray(time_days, dtype=np.float64)
+        if time_days.ndim != 1:
+            raise ValueError("time_days must be a 1-D array")
+        n = len(time_days)
+        if out is None:
+            out = np.empty(n)
+        elif out.shape != (n,):
+            raise ValueError(f"out must have shape {(n,)}, got {out.shape}")
+
+        period_days = self.period / 86400.0
+        half_window_days = self._half_window() / 24.0
+        # ⚡ Bolt: Fold into two reused chunk buffers, then evaluate the model only
+        # on in-transit points; everything else (usually >95% of a survey) is a fill.
+        phase = np.empty(min(chunk_size, n))
+        work = np.empty_like(phase)
+        for start in range(0, n, chunk_size):
+            stop = min(start + chunk_size, n)
+            ph = np.subtract(time_days[start:stop], epoch_days, out=phase[:stop - start])
+            cycles = np.divide(ph, period_days, out=work[:stop - start])
+            np.rint(cycles, out=cycles)
+            cycles *= period_days
+            ph -= cycles
+
+            block = out[start:stop]
+            block.fill(1.0)
+            index = np.flatnonzero(np.abs(ph, out=cycles) < half_window_days)
+            if len(index):
+                hours = ph[index]
+                hours *= 24.0
+                block[index] = self._transit_flux(hours)
+        return out
 
     def plot_light_curve(self, duration_hours=6, filename="transit_light_curve.png"):
         """
         Plot the light curve.
+
+        Use `zenith.plotting.render_light_curves` to render many planets.
+        """
+        render_light_curves([self], [filename], duration_hours)
+
+class TransitPopulation:
+    """
+    Simulate transit light curves of many planets at once.
+
+    Planet parameters are stored as struct-of-arrays (one array per
+    quantity) instead of one TransitSimulator per planet, so a population of
+    10^6 planets is a handful of vectorized passes rather than a million
+    constructor calls. The transit model is the same as TransitSimulator's.
+    """
+    def __init__(self, R_star_solar=1.0, R_planet_earth=1.0, period_days=365.25, M_star_solar=1.0):
+        """
+        Parameters:
+            R_star_solar (float or array): Radii of the stars in Solar Radii.
+            R_planet_earth (float or array): Radii of the planets in Earth Radii.
+            period_days (float or array): Orbital periods in days.
+            M_star_solar (float or array): Masses of the stars in Solar Masses.
+
+        All parameters are broadcast to a common 1-D shape (one entry per planet).
+        """
+        R_star, R_planet, period, M_star = np.broadcast_arrays(
+            *(np.atleast_1d(np.asarray(v, dtype=float)) for v in
+              (R_star_solar, R_planet_earth, period_days, M_star_solar)))
+        if R_star.ndim != 1:
+            raise ValueError("Population parameters must be scalars or 1-D arrays")
+
+        self.R_star = R_star * solar_radius
+        self.R_planet = R_planet * earth_radius
+        self.period = period * 86400.0 # seconds
+        self.M_star = M_star * solar_mass
+
+        # Kepler's 3rd Law, a^3 = G * M * T^2 / (4 * pi^2)
+        # ⚡ Bolt: np.cbrt is several times faster than a generic **(1/3) power on arrays
+        a = self.period * self.period
+        a *= self.M_star
+        a *= _KEPLER_CONSTANT
+        self.a = np.cbrt(a, out=a)
+
+        # Orbital velocity (assuming circular)
+        self.v_orb = (2 * np.pi) * self.a / self.period
+
+        # Transit depth
+        rp_rs = self.R_planet / self.R_star
+        self.depth = rp_rs * rp_rs
+
+        # Duration (full transit chord, center to center, edge-on)
+        chord = self.R_star + self.R_planet
+        self.duration = 2 * chord / self.v_orb
+
+        # ⚡ Bolt: Per-planet light curve coefficients, computed once (see TransitSimulator)
+        inv_2R = 0.5 / self.R_planet
+        self._c1 = chord * inv_2R
+        self._c2 = self.v_orb * inv_2R * 3600.0
+
+    def __len__(self):
+        return len(self.R_star)
+
+    def _fill(self, abs_time, start, stop, out):
+        """Write the flux of planets [start, stop) at the given |time| into out."""
+        np.multiply(abs_time, -self._c2[start:stop, None], out=out)
+        out += self._c1[start:stop, None]
+        np.clip(out, 0.0, 1.0, out=out)
+        out *= -self.depth[start:stop, None]
+        out += 1.0
+        return out
+
+    def generate_light_curves(self, duration_hours=6, points=1000, out=None, dtype=np.float64):
+        """
+        Generate synthetic light curves for every planet.
+
+        Parameters:
+            duration_hours (float): Total time window to simulate.
+            points (int): Number of data points.
+            out (array): Optional (N_planets, points) buffer for the flux.
+            dtype: Flux dtype when ``out`` is not given.
+
+        Returns:
+            tuple: (time_hours, normalized_flux) with flux of shape (N_planets, points).
+        """
+        time_hours = _time_grid(duration_hours, points)
+        if out is None:
+            out = np.empty((len(self), points), dtype=dtype)
+        elif out.shape != (len(self), points):
+            raise ValueError(f"out must have shape {(len(self), points)}, got {out.shape}")
+        return time_hours, self._fill(np.abs(time_hours), 0, len(self), out)
+
+    def iter_light_curves(self, duration_hours=6, points=1000, chunk_size=4096, dtype=np.float64):
+        """
+        Generate the light curves in blocks of planets.
+
+        Every block is written into the same reused buffer, so populations
+        whose full (N_planets, points) matrix does not fit in memory can be
+        reduced block by block.
+
+        Parameters:
+            duration_hours (float): Total time window to simulate.
+            points (int): Number of data points.
+            chunk_size (int): Number of planets per block.
+            dtype: Block dtype.
+
+        Yields:
+            tuple: (start, stop, block) where block is the (stop - start, points)
+                flux of planets ``start:stop``; it is overwritten by the next
+                block, so copy it to keep it. The time grid is `time_grid`.
+        """
+        abs_time = np.abs(_time_grid(duration_hours, points))
+        n = len(self)
+        buffer = np.empty((min(chunk_size, n), points), dtype=dtype)
+        for start in range(0, n, chunk_size):
+            stop = min(start + chunk_size, n)
+            yield start, stop, self._fill(abs_time, start, stop, buffer[:stop - start])
+
+    @staticmethod
+    def time_grid(duration_hours=6, points=1000):
+        """
+        Time samples (hours from mid-transit) of the generated light curves.
         """
-        time, flux = self.generate_light_curve(duration_hours)
+        return _time_grid(duration_hours, points)
 
-        plt.figure(figsize=(10, 6))
-        plt.plot(time, flux, 'b-', label='Model')
+def _time_grid(duration_hours, points):
+    """Evenly spaced times in hours, centered on mid-transit."""
+    t_half_hours = duration_hours / 2.0
+    return np.linspace(-t_half_hours, t_half_hours, points)
+
+# Equalities of the occultation geometry (z == p, z == 1 - p, ...) are decided
+# to this tolerance in units of the stellar radius.
+_GEOMETRY_TOL = 1e-12
+
+def _ellippi(n, m):
+    """Complete elliptic integral of the third kind, Pi(n, m) with a (1 + n sin^2) denominator."""
+    # Carlson form: Pi = R_F(0, 1-m, 1) - n/3 R_J(0, 1-m, 1, 1+n), with R_F(0, 1-m, 1) = K(m)
+    return ellipk(m) - n / 3.0 * elliprj(0.0, 1.0 - m, 1.0, 1.0 + n)
+
+def _occultation_basis(z, p):
+    """
+    Mandel & Agol (2002) occultation terms of a planet of radius ratio p at
+    sky separations z (stellar radii).
+
+    Returns:
+        tuple: (lambda_e, lambda_d, eta_d) arrays; lambda_d already includes
+            the 2/3 step for z < p.
+    """
+    z = np.array(z, dtype=np.float64)
+    z[np.abs(z - p) < _GEOMETRY_TOL] = p
+    z[np.abs(z - (1.0 - p)) < _GEOMETRY_TOL] = 1.0 - p
+    z[np.abs(z - (p - 1.0)) < _GEOMETRY_TOL] = p - 1.0
+    z[z < _GEOMETRY_TOL] = 0.0
+
+    lambda_e = np.zeros_like(z)
+    lambda_d = np.zeros_like(z)
+    eta_d = np.zeros_like(z)
+    p2 = p * p
+
+    # Star completely occulted
+    covered = z <= p - 1.0
+    lambda_e[covered] = 1.0
+    eta_d[covered] = 0.5
+
+    # Planet on the limb: uniform-disk overlap and eta_1
+    limb = (z >= abs(1.0 - p)) & (z < 1.0 + p) & ~covered
+    if limb.any():
+        zl = z[limb]
+        x1 = (p - zl) ** 2
+        x2 = (p + zl) ** 2
+        kap1 = np.arccos(np.clip((1.0 - p2 + zl * zl) / (2.0 * zl), -1.0, 1.0))
+        kap0 = np.arccos(np.clip((p2 + zl * zl - 1.0) / (2.0 * p * zl), -1.0, 1.0))
+        chord = np.sqrt(np.maximum(4.0 * zl * zl - (1.0 + zl * zl - p2) ** 2, 0.0))
+        lambda_e[limb] = (p2 * kap0 + kap1 - 0.5 * chord) / np.pi
+        eta_d[limb] = (kap1 + p2 * (p2 + 2.0 * zl * zl) * kap0
+                       - 0.25 * (1.0 + 5.0 * p2 + zl * zl) * np.sqrt(np.maximum((1.0 - x1) * (x2 - 1.0), 0.0))) / (2.0 * np.pi)
+
+        # lambda_1, except on the contact points handled below
+        ingress = limb & (z > abs(1.0 - p)) & (z != p)
+        zi = z[ingress]
+        x1 = (p - zi) ** 2
+        x2 = (p + zi) ** 2
+        x3 = p2 - zi * zi
+        m = (1.0 - x1) / (x2 - x1)
+        lambda_d[ingress] = 2.0 / (9.0 * np.pi * np.sqrt(x2 - x1)) * (
+            ((1.0 - x2) * (2.0 * x2 + x1 - 3.0) - 3.0 * x3 * (x2 - 2.0)) * ellipk(m)
+            + (x2 - x1) * (zi * zi + 7.0 * p2 - 4.0) * ellipe(m)
+            - 3.0 * x3 / x1 * _ellippi(1.0 / x1 - 1.0, m))
+
+    # Planet entirely on the disk: uniform overlap p^2 and eta_2
+    inside = z <= 1.0 - p
+    if inside.any():
+        zi = z[inside]
+        lambda_e[inside] = p2
+        eta_d[inside] = 0.5 * p2 * (p2 + 2.0 * zi * zi)
+
+        # lambda_2, away from the special points below
+        general = inside & (z != p) & (z != 1.0 - p) & (z > 0.0)
+        zg = z[general]
+        x1 = (p - zg) ** 2
+        x2 = (p + zg) ** 2
+        x3 = p2 - zg * zg
+        m = (x2 - x1) / (1.0 - x1)
+        lambda_d[general] = 2.0 / (9.0 * np.pi * np.sqrt(1.0 - x1)) * (
+            (1.0 - 5.0 * zg * zg + p2 + x3 * x3) * ellipk(m)
+            + (1.0 - x1) * (zg * zg + 7.0 * p2 - 4.0) * ellipe(m)
+            - 3.0 * x3 / x1 * _ellippi(x2 / x1 - 1.0, m))
+
+        # lambda_5: planet edge touching the limb from inside
+        edge = inside & (z == 1.0 - p) & (z != p)
+        lambda_d[edge] = (2.0 / (3.0 * np.pi) * np.arccos(1.0 - 2.0 * p)
+                          - 4.0 / (9.0 * np.pi) * np.sqrt(p * (1.0 - p)) * (3.0 + 2.0 * p - 8.0 * p2)
+                          - (2.0 / 3.0 if p > 0.5 else 0.0))
+        # lambda_6: planet centered on the star
+        lambda_d[inside & (z == 0.0)] = -2.0 / 3.0 * (1.0 - p2) ** 1.5
+
+    # Planet edge on the stellar center (z == p)
+    center = (z == p) & (z > 0.0)
+    if center.any():
+        if p < 0.5:
+            lambda_d[center] = 1.0 / 3.0 + 2.0 / (9.0 * np.pi) * (
+                4.0 * (2.0 * p2 - 1.0) * ellipe(4.0 * p2) + (1.0 - 4.0 * p2) * ellipk(4.0 * p2))
+        elif p > 0.5:
+            m = 0.25 / p2
+            lambda_d[center] = (1.0 / 3.0 + 16.0 * p / (9.0 * np.pi) * (2.0 * p2 - 1.0) * ellipe(m)
+                                - (32.0 * p2 * p2 - 20.0 * p2 + 3.0) / (9.0 * np.pi * p) * ellipk(m))
+        else:
+            lambda_d[center] = 1.0 / 3.0 - 4.0 / (9.0 * np.pi)
+            eta_d[center] = 3.0 / 32.0
+
+    # Heaviside step of the linear term when the planet covers the stellar center
+    lambda_d[z < p] += 2.0 / 3.0
+    return lambda_e, lambda_d, eta_d
+
+def quadratic_transit_flux(z, p, u1=0.0, u2=0.0):
+    """
+    Exact relative flux of a star with quadratic limb darkening occulted by a planet.
+
+    Uses the analytic Mandel & Agol (2002) model with the intensity profile
+    I(mu) = 1 - u1 (1 - mu) - u2 (1 - mu)^2.
+
+    Parameters:
+        z (float or array): Sky-projected separation of the centers in stellar radii.
+        p (float): Planet to star radius ratio.
+        u1 (float): Linear limb-darkening coefficient.
+        u2 (float): Quadratic limb-darkening coefficient.
+
+    Returns:
+        float or array: Normalized flux (1 out of transit).
+    """
+    lambda_e, lambda_d, eta_d = _occultation_basis(np.atleast_1d(z), p)
+    omega = 1.0 - u1 / 3.0 - u2 / 6.0
+    flux = 1.0 - ((1.0 - u1 - 2.0 * u2) * lambda_e + (u1 + 2.0 * u2) * lambda_d + u2 * eta_d) / omega
+    return flux if np.ndim(z) else flux[0]
+
+_BASIS_TABLES = OrderedDict()
+_BASIS_CACHE_SIZE = 32
+
+def _basis_grid(p, size):
+    """
+    Separation nodes for tabulating the occultation terms of radius ratio p.
+
+    Nodes are split evenly between the intervals bounded by the contact
+    points (0, p, |1 - p|, 1 + p) and clustered towards both ends of each
+    interval, where the terms have square-root-like kinks.
+    """
+    breaks = np.unique(np.clip([0.0, p, abs(1.0 - p), 1.0 + p], 0.0, 1.0 + p))
+    s = 0.5 - 0.5 * np.cos(np.linspace(0.0, np.pi, max(size // (len(breaks) - 1), 8)))
+    return np.unique(np.concatenate([lo + (hi - lo) * s for lo, hi in zip(breaks[:-1], breaks[1:])]))
+
+def _basis_table(p, size):
+    """Tabulated (z, lambda_e, lambda_d, eta_d) for radius ratio p, cached per (p, size)."""
+    key = (p, size)
+    table = _BASIS_TABLES.get(key)
+    if table is not None:
+        _BASIS_TABLES.move_to_end(key)
+        return table
+    z = _basis_grid(p, size)
+    table = (z,) + _occultation_basis(z, p)
+    for array in table:
+        array.flags.writeable = False
+    _BASIS_TABLES[key] = table
+    if len(_BASIS_TABLES) > _BASIS_CACHE_SIZE:
+        _BASIS_TABLES.popitem(last=False)
+    return table
+
+class LimbDarkenedTransit(TransitSimulator):
+    """
+    Simulate transit light curves of a limb-darkened star.
+
+    Uses the analytic Mandel & Agol (2002) overlap of a planet with a star of
+    quadratic limb darkening, I(mu) = 1 - u1 (1 - mu) - u2 (1 - mu)^2, on a
+    circular orbit with impact parameter b.
+    """
+    def __init__(self, R_star_solar=1.0, R_planet_earth=1.0, period_days=365.25, M_star_solar=1.0,
+                 impact_parameter=0.0, u1=0.4, u2=0.25, table_size=2048):
+        """
+        Parameters:
+            R_star_solar (float): Radius of the star in Solar Radii.
+            R_planet_earth (float): Radius of the planet in Earth Radii.
+            period_days (float): Orbital period in days.
+            M_star_solar (float): Mass of the star in Solar Masses.
+            impact_parameter (float): Sky-projected distance of closest approach
+                in stellar radii (0 is a central transit).
+            u1 (float): Linear limb-darkening coefficient.
+            u2 (float): Quadratic limb-darkening coefficient.
+            table_size (int): Number of tabulated separations of the elliptic
+                integral terms, or None to evaluate the exact model at every point.
+        """
+        super().__init__(R_star_solar, R_planet_earth, period_days, M_star_solar)
+        self.a_rs = self.a / self.R_star
+        if not 0.0 <= impact_parameter < self.a_rs:
+            raise ValueError("impact_parameter must be in [0, a/R_star)")
+        self.impact_parameter = impact_parameter
+        self.u1 = u1
+        self.u2 = u2
+        self.p = self.R_planet / self.R_star
+        self.table_size = table_size
+
+        # Chord across the stellar disk at impact parameter b
+        chord = (1.0 + self.p) ** 2 - impact_parameter * impact_parameter
+        self.duration = 2 * self.R_star * np.sqrt(max(chord, 0.0)) / self.v_orb
+
+        # ⚡ Bolt: The flux is linear in the occultation terms, which depend on p only.
+        # Their elliptic integrals are tabulated once per p (LRU cached across
+        # instances) and folded with u1/u2 into one deficit table here, so each
+        # light curve is a single interpolation instead of elliptic integrals per point.
+        self._omega = 1.0 - u1 / 3.0 - u2 / 6.0
+        if table_size:
+            z, lambda_e, lambda_d, eta_d = _basis_table(self.p, table_size)
+            self._z_table = z
+            self._deficit_table = self._deficit(lambda_e, lambda_d, eta_d)
+        # ⚡ Bolt: Hoist the per-call orbit constants
+        self._phase_rate = 2 * np.pi * 3600.0 / self.period
+        self._a_rs2 = self.a_rs * self.a_rs
+        self._z_scale = self._a_rs2 - impact_parameter * impact_parameter
+
+    def _deficit(self, lambda_e, lambda_d, eta_d):
+        """Fractional flux deficit from the occultation terms."""
+        u1, u2 = self.u1, self.u2
+        return ((1.0 - u1 - 2.0 * u2) * lambda_e + (u1 + 2.0 * u2) * lambda_d + u2 * eta_d) / self._omega
+
+    def separation(self, time_hours):
+        """
+        Sky-projected planet-star separation on the circular orbit.
+
+        Parameters:
+            time_hours (float or array): Time from mid-transit in hours.
+
+        Returns:
+            float or array: Separation in stellar radii (inf while the planet
+                is behind the star).
+        """
+        # ⚡ Bolt: z^2 = (a sin)^2 + (b cos)^2 = a^2 - (a^2 - b^2) cos^2 needs a
+        # single cosine and no hypot (~3x faster than the sin/cos/hypot form)
+        phase = np.multiply(time_hours, self._phase_rate)
+        if not isinstance(phase, np.ndarray):
+            cos_phase = math.cos(phase)
+            return math.sqrt(self._a_rs2 - self._z_scale * cos_phase * cos_phase) if cos_phase > 0.0 else math.inf
+        cos_phase = np.cos(phase, out=phase)
+        z = cos_phase * cos_phase
+        z *= -self._z_scale
+        z += self._a_rs2
+        np.sqrt(z, out=z)
+        z[cos_phase <= 0.0] = np.inf
+        return z
+
+    def flux(self, time_hours, out=None):
+        """
+        Normalized flux at the given times.
+
+        Parameters:
+            time_hours (float or array): Time from mid-transit in hours.
+            out (array): Optional output buffer.
+
+        Returns:
+            float or array: Normalized flux (1 out of transit).
+        """
+        z = self.separation(time_hours)
+        if self.table_size:
+            deficit = np.interp(z, self._z_table, self._deficit_table, right=0.0)
+        else:
+            deficit = self._deficit(*_occultation_basis(np.atleast_1d(z), self.p)).reshape(np.shape(z))
+        if out is None:
+            flux = np.subtract(1.0, deficit)
+            return flux if np.ndim(flux) else float(flux)
+        return np.subtract(1.0, deficit, out=out)
 
-        # Add some noise for realism
-        noise = np.random.normal(0, 0.0001, len(time))
-        plt.plot(time, flux + noise, 'k.', alpha=0.3, label='Simulated Data')
+    def _transit_flux(self, time_hours):
+        return self.flux(time_hours)
 
-        plt.xlabel("Time from mid-transit (hours)")
-        plt.ylabel("Normalized Flux")
-        plt.title(f"Exoplanet Transit (P={self.period/86400:.1f}d, Depth={self.depth:.4f})")
-        plt.legend()
-        plt.grid(True)
-        plt.savefig(filename)
-        plt.close()
+    def _half_window(self):
+        # Contact at z = 1 + p on the circular orbit: a^2 - (a^2 - b^2) cos^2 = (1 + p)^2
+        sin2 = ((1.0 + self.p) ** 2 - self.impact_parameter ** 2) / self._z_scale
+        if sin2 <= 0.0:
+            return 0.0
+        return math.asin(math.sqrt(min(sin2, 1.0))) / self._phase_rate
@@ -1,29 +1,343 @@
 import numpy as np
 import math
-import matplotlib.pyplot as plt
-from zenith.utils import c, h, rad_to_deg
+from collections import OrderedDict
+from zenith.utils import c, h, rad_to_deg, solar_radius, parsec, AB_ZERO_FLUX
+from zenith.astrophysics import planck_law, iter_planck_grid
+from zenith.plotting import render_performance_curves
+
+# Zero point flux (approximate for V-band) in photons/s/m^2
+ZERO_MAG_FLUX = 1.0e10
 
 class CCD:
     """
     Represents a CCD camera.
     """
-    def __init__(self, pixel_size=3.76e-6, read_noise=1.5, dark_current=0.01, quantum_efficiency=0.8):
+    # ⚡ Bolt: __slots__ keeps instances compact and attribute access fast; the
+    # version counter lets telescopes cache CCD-dependent terms safely.
+    __slots__ = ('_pixel_size', '_read_noise', '_dark_current', '_qe', '_qe_curve', '_version')
+
+    def __init__(self, pixel_size=3.76e-6, read_noise=1.5, dark_current=0.01, quantum_efficiency=0.8,
+                 qe_curve=None):
         """
         Parameters:
             pixel_size (float): Size of a pixel in meters.
             read_noise (float): Read noise in electrons/pixel.
             dark_current (float): Dark current in electrons/pixel/second.
             quantum_efficiency (float): Quantum efficiency (0-1).
+            qe_curve (tuple): Optional (wavelength, qe) arrays, wavelength in
+                meters, used by spectral SNR instead of the flat efficiency.
         """
+        self._version = 0
         self.pixel_size = pixel_size
         self.read_noise = read_noise
         self.dark_current = dark_current
         self.qe = quantum_efficiency
+        self.qe_curve = qe_curve
+
+    @property
+    def pixel_size(self):
+        return self._pixel_size
+
+    @pixel_size.setter
+    def pixel_size(self, value):
+        self._pixel_size = value
+        self._version += 1
+
+    @property
+    def read_noise(self):
+        return self._read_noise
+
+    @read_noise.setter
+    def read_noise(self, value):
+        self._read_noise = value
+        self._version += 1
+
+    @property
+    def dark_current(self):
+        return self._dark_current
+
+    @dark_current.setter
+    def dark_current(self, value):
+        self._dark_current = value
+        self._version += 1
+
+    @property
+    def qe(self):
+        return self._qe
+
+    @qe.setter
+    def qe(self, value):
+        self._qe = value
+        self._version += 1
+
+    @property
+    def qe_curve(self):
+        return self._qe_curve
+
+    @qe_curve.setter
+    def qe_curve(self, value):
+        if value is not None:
+            wavelength, qe = (np.asarray(v, dtype=float) for v in value)
+            if wavelength.shape != qe.shape or wavelength.ndim != 1:
+                raise ValueError("qe_curve must be a pair of equal-length 1-D arrays")
+            value = (wavelength, qe)
+        self._qe_curve = value
+        self._version += 1
+
+    def qe_at(self, wavelength):
+        """
+        Quantum efficiency at the given wavelengths.
+
+        Parameters:
+            wavelength (array): Wavelength in meters.
+
+        Returns:
+            array: QE interpolated from `qe_curve` (zero outside it), or the
+                flat quantum efficiency when no curve is set.
+        """
+        wavelength = np.asarray(wavelength, dtype=float)
+        if self._qe_curve is None:
+            return np.full(wavelength.shape, self._qe)
+        return np.interp(wavelength, *self._qe_curve, left=0.0, right=0.0)
+
+class Filter:
+    """
+    A filter bandpass sampled on a wavelength grid.
+
+    The grid doubles as the quadrature grid for spectral SNR, and the
+    quadrature weights are cached per CCD so that integrating the spectra
+    of many sources is a single matrix-vector product.
+    """
+    __slots__ = ('wavelength', 'transmission', 'name', '_weights')
+
+    def __init__(self, wavelength, transmission, name=None):
+        """
+        Parameters:
+            wavelength (array): Increasing wavelength grid in meters.
+            transmission (array): Filter transmission (0-1) on the grid.
+            name (str): Optional filter name.
+        """
+        wavelength = np.array(wavelength, dtype=float)
+        transmission = np.array(transmission, dtype=float)
+        if wavelength.ndim != 1 or wavelength.shape != transmission.shape or len(wavelength) < 2:
+            raise ValueError("wavelength and transmission must be equal-length 1-D arrays")
+        if np.any(np.diff(wavelength) <= 0):
+            raise ValueError("wavelength must be strictly increasing")
+        wavelength.flags.writeable = False
+        transmission.flags.writeable = False
+        self.wavelength = wavelength
+        self.transmission = transmission
+        self.name = name
+        self._weights = OrderedDict()
+
+    def __getstate__(self):
+        return (self.wavelength, self.transmission, self.name)
+
+    def __setstate__(self, state):
+        self.__init__(*state)
+
+    def __repr__(self):
+        lo, hi = self.wavelength[0], self.wavelength[-1]
+        return f"Filter({self.name!r}, {lo * 1e9:.0f}-{hi * 1e9:.0f} nm, {len(self.wavelength)} samples)"
+
+    def weights(self, ccd):
+        """
+        Quadrature weights of the filter x QE response, cached per CCD.
+
+        Parameters:
+            ccd (CCD): CCD camera object.
+
+        Returns:
+            tuple: (weights, zero_flux) where ``B_lambda @ weights`` converts a
+                spectral radiance sampled on `wavelength` into detected
+                electrons/s/m^2 per steradian of source, and ``zero_flux`` is
+                the detected electrons/s/m^2 from an AB magnitude 0 source.
+        """
+        # ⚡ Bolt: The weights only depend on the filter and the CCD, so they are
+        # computed once per (CCD, version) and shared by every source spectrum.
+        key = id(ccd)
+        cached = self._weights.get(key)
+        if cached is not None and cached[0] is ccd and cached[1] == ccd._version:
+            self._weights.move_to_end(key)
+            return cached[2]
+
+        wavelength = self.wavelength
+        # Trapezoidal rule on the (possibly non-uniform) grid
+        step = np.diff(wavelength)
+        dlam = np.zeros_like(wavelength)
+        dlam[:-1] += 0.5 * step
+        dlam[1:] += 0.5 * step
+        response = self.transmission * ccd.qe_at(wavelength) * dlam
+
+        # Photons per joule are lambda / (h c)
+        weights = response * (wavelength / (h * c))
+        # f_lambda = AB_ZERO_FLUX * c / lambda^2 for an AB magnitude 0 source
+        zero_flux = AB_ZERO_FLUX / h * float(np.sum(response / wavelength))
+        weights.flags.writeable = False
+
+        result = (weights, zero_flux)
+        self._weights[key] = (ccd, ccd._version, result)
+        if len(self._weights) > 8:
+            self._weights.popitem(last=False)
+        return result
+
+    def electron_flux(self, temperature, ccd, radius=solar_radius, distance=10.0 * parsec, chunk_size=65536):
+        """
+        Detected electron flux from blackbody sources through this filter.
+
+        Parameters:
+            temperature (float or array): Effective temperatures in Kelvin.
+            ccd (CCD): CCD camera object.
+            radius (float or array): Source radii in meters.
+            distance (float or array): Source distances in meters.
+            chunk_size (int): Number of temperatures integrated per block,
+                bounding the (chunk_size, N_wavelength) radiance matrix.
+
+        Returns:
+            float or array: Electrons/s per m^2 of collecting area.
+        """
+        weights, _ = self.weights(ccd)
+        wavelength = self.wavelength
+        # Flux density at the observer: F_lambda = pi B_lambda (R / d)^2
+        ratio = np.divide(radius, distance)
+        scale = np.pi * (ratio * ratio)
+
+        temperature = np.asarray(temperature, dtype=float)
+        with np.errstate(over='ignore'):
+            if temperature.ndim == 0:
+                return float(planck_law(wavelength, float(temperature)) @ weights) * scale
+
+            temps = temperature.ravel()
+            flux = np.empty(temps.shape)
+            # ⚡ Bolt: Reuse one (chunk_size, N_wavelength) radiance buffer for every block
+            for start, stop, block in iter_planck_grid(wavelength, temps, chunk_size):
+                np.matmul(block, weights, out=flux[start:stop])
+        flux = flux.reshape(temperature.shape)
+        return flux * scale
+
+class Instrument:
+    """
+    A telescope + CCD + sky background prepared for repeated SNR evaluations.
+
+    Holds the per-second terms of the CCD equation, so an SNR costs a few
+    multiply-adds. It is a snapshot: call `Telescope.prepare` again after
+    changing the telescope or the CCD.
+    """
+    __slots__ = ('zero_rate', 'background_rate', 'read_var')
+
+    def __init__(self, zero_rate, background_rate, read_var):
+        """
+        Parameters:
+            zero_rate (float): Electrons/second from a magnitude-zero target.
+            background_rate (float): Sky plus dark electrons/second over the aperture.
+            read_var (float): Read noise variance over the aperture in electrons^2.
+        """
+        self.zero_rate = zero_rate
+        self.background_rate = background_rate
+        self.read_var = read_var
+
+    def snr(self, target_mag, exposure, out=None):
+        """
+        Calculate Signal-to-Noise Ratio (CCD Equation).
+
+        Parameters:
+            target_mag (float or array): Apparent magnitude of the target.
+            exposure (float or array): Exposure time in seconds.
+            out (array): Optional output buffer with the broadcast shape.
+
+        Returns:
+            float or array: Signal-to-Noise Ratio.
+        """
+        if (out is None and not isinstance(target_mag, np.ndarray) and not isinstance(exposure, np.ndarray)
+                and not isinstance(self.zero_rate, np.ndarray) and not isinstance(self.background_rate, np.ndarray)
+                and not isinstance(self.read_var, np.ndarray)):
+            signal = self.zero_rate * exposure * math.exp(-0.9210340371976183 * target_mag)
+            return signal / math.sqrt(signal + self.background_rate * exposure + self.read_var)
+
+        rate = np.exp(np.multiply(target_mag, -0.9210340371976183))
+        return self.snr_from_rate(rate * self.zero_rate, exposure, out)
+
+    def snr_from_rate(self, rate, exposure, out=None):
+        """
+        Calculate Signal-to-Noise Ratio from a detected target rate.
+
+        Parameters:
+            rate (float or array): Target electrons/second.
+            exposure (float or array): Exposure time in seconds.
+            out (array): Optional output buffer with the broadcast shape.
+
+        Returns:
+            float or array: Signal-to-Noise Ratio.
+        """
+        constant_noise = self.background_rate * exposure + self.read_var
+        if out is None and np.ndim(rate) == 0 and np.ndim(exposure) == 0 and np.ndim(constant_noise) == 0:
+            signal = float(rate) * exposure
+            return signal / math.sqrt(signal + constant_noise)
+
+        signal = np.multiply(rate, exposure)
+        shape = np.broadcast_shapes(np.shape(signal), np.shape(constant_noise))
+        if out is None:
+            out = np.empty(shape, dtype=np.result_type(signal, constant_noise))
+        np.add(signal, constant_noise, out=out)
+        np.sqrt(out, out=out)
+        np.divide(signal, out, out=out)
+        return out
+
+    def exposure_for_snr(self, target_mag, snr):
+        """
+        Exposure time needed to reach a Signal-to-Noise Ratio (inverse CCD Equation).
+
+        With S and B the target and background electron rates and R the read
+        noise variance, SNR^2 (S t + B t + R) = S^2 t^2 is a quadratic in t
+        whose positive root is evaluated directly for every target.
+
+        Parameters:
+            target_mag (float or array): Apparent magnitude of the target.
+            snr (float or array): Required Signal-to-Noise Ratio.
+
+        Returns:
+            float or array: Exposure time in seconds.
+        """
+        target_rate = np.exp(np.multiply(target_mag, -0.9210340371976183)) * self.zero_rate
+        snr2 = np.multiply(snr, snr)
+
+        b = snr2 * (target_rate + self.background_rate)
+        s2 = target_rate * target_rate
+        exposure = np.sqrt(b * b + 4.0 * s2 * snr2 * self.read_var)
+        exposure += b
+        exposure /= 2.0 * s2
+        return exposure
+
+    def limiting_magnitude(self, exposure, snr):
+        """
+        Faintest magnitude that reaches a Signal-to-Noise Ratio in a given exposure.
+
+        Solves SNR^2 (F + B t + R) = F^2 for the target electrons F, then
+        converts the implied rate back to a magnitude.
+
+        Parameters:
+            exposure (float or array): Exposure time in seconds.
+            snr (float or array): Required Signal-to-Noise Ratio.
+
+        Returns:
+            float or array: Limiting apparent magnitude.
+        """
+        snr2 = np.multiply(snr, snr)
+
+        electrons = np.sqrt(snr2 * snr2 + 4.0 * snr2 * (self.background_rate * exposure + self.read_var))
+        electrons += snr2
+        electrons /= 2.0
+        # m = -2.5 log10(F / (zero_rate * t)) = -ln(F / (zero_rate * t)) / 0.921...
+        mag = np.log(electrons / (self.zero_rate * exposure))
+        mag /= -0.9210340371976183
+        return mag
 
 class Telescope:
     """
     Represents an optical telescope.
     """
+    __slots__ = ('_aperture', '_focal_length', '_area', '_diffraction_constant', '_derived')
+
     def __init__(self, aperture, focal_length):
         """
         Parameters:
@@ -32,13 +346,117 @@ class Telescope:
         """
         self.aperture = aperture
         self.focal_length = focal_length
+
+    def __getstate__(self):
+        return (self._aperture, self._focal_length)
+
+    def __setstate__(self, state):
+        self.aperture, self.focal_length = state
+
+    @property
+    def aperture(self):
+        return self._aperture
+
+    @aperture.setter
+    def aperture(self, value):
+        self._aperture = value
         # ⚡ Bolt: Use explicit multiplication instead of **2 for simple squares to bypass
         # the overhead of the generalized power evaluation function.
-        half_aperture = self.aperture / 2.0
-        self.area = np.pi * (half_aperture * half_aperture)
+        half_aperture = value / 2.0
+        self._area = np.pi * (half_aperture * half_aperture)
         # ⚡ Bolt: Hoist constant scalar calculations for diffraction limit to avoid
         # redundant math and function calls on every invocation (~3x speedup).
-        self._diffraction_constant = 1.22 * rad_to_deg(1.0) * 3600.0 / aperture
+        self._diffraction_constant = 1.22 * rad_to_deg(1.0) * 3600.0 / value
+        self._derived = None
+
+    @property
+    def focal_length(self):
+        return self._focal_length
+
+    @focal_length.setter
+    def focal_length(self, value):
+        self._focal_length = value
+        self._derived = None
+
+    @property
+    def area(self):
+        """Collecting area in m^2."""
+        return self._area
+
+    def _ccd_terms(self, ccd):
+        """
+        Exposure- and sky-independent CCD equation terms, cached per CCD.
+
+        Returns:
+            tuple: (zero-magnitude target rate, aperture solid angle in arcsec^2,
+                dark rate over the aperture, read-noise variance over the aperture).
+        """
+        # ⚡ Bolt: Pixel scale, aperture pixel count and the noise constants only
+        # change with the telescope or CCD, so they are computed once and reused
+        # until either side is modified (tracked by the CCD version counter).
+        derived = self._derived
+        if derived is not None and derived[0] is ccd and derived[1] == ccd._version:
+            return derived[2]
+
+        zero_rate = ZERO_MAG_FLUX * self._area * ccd.qe
+        # Pixel scale in arcsec/pixel and pixel area in arcsec^2
+        pixel_scale = 206265 * (ccd.pixel_size / self._focal_length)
+        pixel_area_arcsec = pixel_scale * pixel_scale
+        # Assuming star light is concentrated in a seeing disk of roughly 2 arcsec
+        # diameter, area ~ pi*1^2 = 3.14 arcsec^2, covering at least one pixel
+        n_pixels = 3.14 / pixel_area_arcsec
+        if isinstance(n_pixels, np.ndarray):
+            n_pixels = np.maximum(n_pixels, 1.0)
+        elif n_pixels < 1:
+            n_pixels = 1.0
+        read_noise = ccd.read_noise
+        terms = (zero_rate, pixel_area_arcsec * n_pixels,
+                 ccd.dark_current * n_pixels, (read_noise * read_noise) * n_pixels)
+        self._derived = (ccd, ccd._version, terms)
+        return terms
+
+    def prepare(self, ccd, sky_mag=21.0, bandpass=None):
+        """
+        Prepare this telescope and a CCD for repeated SNR evaluations.
+
+        Parameters:
+            ccd (CCD): CCD camera object.
+            sky_mag (float or array): Sky background magnitude per arcsec^2.
+            bandpass (Filter): Optional filter; magnitudes (target and sky)
+                are then AB magnitudes through the filter and the CCD QE curve
+                instead of the flat ZERO_MAG_FLUX zero point.
+
+        Returns:
+            Instrument: Prepared instrument with `snr`, `exposure_for_snr` and
+                `limiting_magnitude` methods.
+        """
+        return Instrument(*self._rates(ccd, sky_mag, bandpass))
+
+    def spectral_snr(self, temperature, exposure, ccd, bandpass, radius=solar_radius,
+                     distance=10.0 * parsec, sky_mag=21.0, out=None):
+        """
+        Calculate Signal-to-Noise Ratio for blackbody sources through a filter.
+
+        The source signal integrates B_lambda(T) x filter transmission x QE(lambda)
+        over the filter's wavelength grid with cached quadrature weights, so
+        any number of temperatures costs one matrix-vector product.
+
+        Parameters:
+            temperature (float or array): Effective temperatures in Kelvin.
+            exposure (float or array): Exposure time in seconds.
+            ccd (CCD): CCD camera object.
+            bandpass (Filter): Filter bandpass.
+            radius (float or array): Source radii in meters.
+            distance (float or array): Source distances in meters.
+            sky_mag (float or array): Sky background AB magnitude per arcsec^2 in the band.
+            out (array): Optional output buffer with the broadcast shape.
+
+        Returns:
+            float or array: Signal-to-Noise Ratio.
+        """
+        instrument = self.prepare(ccd, sky_mag, bandpass)
+        rate = bandpass.electron_flux(temperature, ccd, radius, distance) * self._area
+        return instrument.snr_from_rate(rate, exposure, out)
 
     def diffraction_limit(self, wavelength=550e-9):
         """
@@ -52,26 +470,87 @@ class Telescope:
         """
         return wavelength * self._diffraction_constant
 
-    def calculate_snr(self, target_mag, exposure, ccd, sky_mag=21.0):
+    def pixel_scale(self, ccd):
+        """
+        Calculate the plate scale at the detector.
+
+        Parameters:
+            ccd (CCD): CCD camera object.
+
+        Returns:
+            float: Pixel scale in arcseconds per pixel.
+        """
+        return 206265 * (ccd.pixel_size / self._focal_length)
+
+    def field_of_view(self, ccd, nx, ny):
+        """
+        Calculate the angular size of a rectangular detector.
+
+        Parameters:
+            ccd (CCD): CCD camera object.
+            nx (int): Detector width in pixels.
+            ny (int): Detector height in pixels.
+
+        Returns:
+            tuple: (width, height) in degrees.
+        """
+        half = ccd.pixel_size / (2.0 * self.focal_length)
+        width = 2.0 * math.atan(nx * half)
+        height = 2.0 * math.atan(ny * half)
+        return rad_to_deg(width), rad_to_deg(height)
+
+    def _calculate_snr_grid(self, target_mag, exposure, ccd, sky_mag, out):
+        """Broadcasting CCD equation over every input (see `calculate_snr`)."""
+        # Parameter-only terms first: these are usually much smaller than the
+        # final grid, so they are cheap to evaluate before broadcasting.
+        zero_rate, sky_area, dark_rate, read_var = self._ccd_terms(ccd)
+        C_target = zero_rate * exposure
+
+        # Avoid in-place products here: the factors may broadcast to a larger shape
+        sky = np.exp(np.multiply(sky_mag, -0.9210340371976183))
+        sky = sky * (C_target * sky_area)
+        constant_noise = sky + (dark_rate * exposure + read_var)
+
+        photons_target = np.exp(np.multiply(target_mag, -0.9210340371976183))
+        photons_target = photons_target * C_target
+
+        shape = np.broadcast_shapes(np.shape(photons_target), np.shape(constant_noise))
+        if out is None:
+            out = np.empty(shape, dtype=np.result_type(photons_target, constant_noise))
+        # ⚡ Bolt: Reuse the output buffer for the noise and the final ratio
+        np.add(photons_target, constant_noise, out=out)
+        np.sqrt(out, out=out)
+        np.divide(photons_target, out, out=out)
+        return out
+
+    def calculate_snr(self, target_mag, exposure, ccd, sky_mag=21.0, out=None):
         """
         Calculate Signal-to-Noise Ratio (CCD Equation).
 
+        Every input broadcasts: target magnitude, exposure and sky magnitude
+        as well as the CCD parameters and the telescope geometry may be arrays
+        (e.g. a mag x exposure x sky_mag x read_noise trade-study grid built
+        with np.meshgrid or np.ix_). Scalar inputs keep a pure-Python fast path.
+
         Parameters:
-            target_mag (float): Apparent magnitude of the target.
-            exposure (float): Exposure time in seconds.
+            target_mag (float or array): Apparent magnitude of the target.
+            exposure (float or array): Exposure time in seconds.
             ccd (CCD): CCD camera object.
-            sky_mag (float): Sky background magnitude per arcsec^2.
+            sky_mag (float or array): Sky background magnitude per arcsec^2.
+            out (array): Optional output buffer with the broadcast shape.
 
         Returns:
-            float: Signal-to-Noise Ratio.
+            float or array: Signal-to-Noise Ratio.
         """
-        # Constants
-        # Zero point flux (approximate for V-band) in photons/s/m^2
-        ZERO_MAG_FLUX = 1.0e10
+        zero_rate, sky_area, dark_rate, read_var = self._ccd_terms(ccd)
+        if (out is not None or isinstance(exposure, np.ndarray) or isinstance(zero_rate, np.ndarray)
+                or isinstance(sky_area, np.ndarray) or isinstance(dark_rate, np.ndarray)
+                or isinstance(read_var, np.ndarray)):
+            return self._calculate_snr_grid(target_mag, exposure, ccd, sky_mag, out)
 
         # 1. Calculate Signal (S)
         # ⚡ Bolt: Combined all scalar constants before array multiplication to avoid intermediate array allocation
-        C_target = ZERO_MAG_FLUX * self.area * exposure * ccd.qe
+        C_target = zero_rate * exposure
         # Photons hitting the detector
         # Fast array exponentiation (10**x -> np.exp(ln(10) * x)) provides ~2x speedup
         # ⚡ Bolt: Eliminate temporary array creation overhead during array exponentiation
@@ -85,24 +564,11 @@ class Telescope:
         # 2. Calculate Noise
         # a. Shot noise from target (sqrt(S))
 
-        # b. Sky Background
-        # Pixel scale in arcsec/pixel
-        pixel_scale = 206265 * (ccd.pixel_size / self.focal_length)
-        # Area of a pixel in arcsec^2
-        # ⚡ Bolt: Use explicit multiplication to avoid small integer power overhead
-        pixel_area_arcsec = pixel_scale * pixel_scale
-
-        # Assuming star light is concentrated in a certain number of pixels (aperture photometry)
-        # Let's assume a seeing disk of roughly 2 arcsec diameter, area ~ pi*1^2 = 3.14 arcsec^2
-        # Number of pixels for aperture
-        n_pixels = 3.14 / pixel_area_arcsec
-        if n_pixels < 1: n_pixels = 1
-
+        # b. Sky Background over the aperture pixels (see `_ccd_terms`)
         # ⚡ Bolt: Combined all scalar constants (including n_pixels) before array multiplication
         # to eliminate redundant intermediate array iterations and temporary arrays.
-        C_sky_total = ZERO_MAG_FLUX * self.area * exposure * ccd.qe * pixel_area_arcsec * n_pixels
+        C_sky_total = C_target * sky_area
 
-        # Photons from sky for all pixels in aperture
         # ⚡ Bolt: Eliminate temporary array creation overhead during array exponentiation
         if isinstance(sky_mag, np.ndarray):
             total_sky_photons = sky_mag * -0.9210340371976183
@@ -111,16 +577,9 @@ class Telescope:
         else:
             total_sky_photons = C_sky_total * math.exp(-0.9210340371976183 * sky_mag)
 
-        # c. Dark Current
-        dark_electrons = ccd.dark_current * exposure * n_pixels
-
-        # d. Read Noise
-        # ⚡ Bolt: Use explicit multiplication
-        read_noise_electrons = (ccd.read_noise * ccd.read_noise) * n_pixels
-
-        # Total Noise
+        # c. Dark Current and d. Read Noise
         # ⚡ Bolt: Combine scalar constant noise terms before array addition to avoid redundant array iterations
-        constant_noise = total_sky_photons + (dark_electrons + read_noise_electrons)
+        constant_noise = total_sky_photons + (dark_rate * exposure + read_var)
 
         # Allocate noise array, then use in-place operations below to eliminate further intermediate allocations
         noise = photons_target + constant_noise
@@ -130,21 +589,61 @@ class Telescope:
             return noise
         return photons_target / math.sqrt(noise)
 
+    def _rates(self, ccd, sky_mag, bandpass=None):
+        """
+        Per-second terms of the CCD equation, optionally zero-pointed through a `Filter`.
+
+        Returns:
+            tuple: (zero-magnitude target rate, background rate, read-noise variance)
+                where background combines sky and dark current over the aperture.
+        """
+        zero_rate, sky_area, dark_rate, read_var = self._ccd_terms(ccd)
+        if bandpass is not None:
+            zero_rate = bandpass.weights(ccd)[1] * self._area
+        if isinstance(sky_mag, np.ndarray):
+            sky_rate = np.exp(sky_mag * -0.9210340371976183) * (zero_rate * sky_area)
+        else:
+            sky_rate = math.exp(-0.9210340371976183 * sky_mag) * (zero_rate * sky_area)
+        return zero_rate, sky_rate + dark_rate, read_var
+
+    def exposure_for_snr(self, target_mag, snr, ccd, sky_mag=21.0):
+        """
+        Exposure time needed to reach a Signal-to-Noise Ratio (inverse CCD Equation).
+
+        See `Instrument.exposure_for_snr`.
+
+        Parameters:
+            target_mag (float or array): Apparent magnitude of the target.
+            snr (float or array): Required Signal-to-Noise Ratio.
+            ccd (CCD): CCD camera object.
+            sky_mag (float or array): Sky background magnitude per arcsec^2.
+
+        Returns:
+            float or array: Exposure time in seconds.
+        """
+        return self.prepare(ccd, sky_mag).exposure_for_snr(target_mag, snr)
+
+    def limiting_magnitude(self, exposure, snr, ccd, sky_mag=21.0):
+        """
+        Faintest magnitude that reaches a Signal-to-Noise Ratio in a given exposure.
+
+        See `Instrument.limiting_magnitude`.
+
+        Parameters:
+            exposure (float or array): Exposure time in seconds.
+            snr (float or array): Required Signal-to-Noise Ratio.
+            ccd (CCD): CCD camera object.
+            sky_mag (float or array): Sky background magnitude per arcsec^2.
+
+        Returns:
+            float or array: Limiting apparent magnitude.
+        """
+        return self.prepare(ccd, sky_mag).limiting_magnitude(exposure, snr)
+
     def plot_performance_curve(self, mag_range, ccd, exposure=60, filename="snr_curve.png"):
         """
         Plot SNR vs Magnitude for a fixed exposure time.
+
+        Use `zenith.plotting.render_performance_curves` to render many instruments.
         """
-        mags = np.linspace(mag_range[0], mag_range[1], 50)
-        # ⚡ Bolt: Vectorized SNR calculation over magnitude array to avoid slow Python loop
-        snrs = self.calculate_snr(mags, exposure, ccd)
-
-        plt.figure(figsize=(10, 6))
-        plt.plot(mags, snrs, label=f"Exposure {exposure}s")
-        plt.xlabel("Apparent Magnitude")
-        plt.ylabel("Signal-to-Noise Ratio (SNR)")
-        plt.title(f"Telescope Performance (D={self.aperture}m, f={self.focal_length}m)")
-        plt.axhline(y=5, color='r', linestyle='--', label="Detection Limit (SNR=5)")
-        plt.grid(True)
-        plt.legend()
-        plt.savefig(filename)
-        plt.close()
+        render_performance_curves([self], ccd, [filename], mag_range, exposure)
@@ -0,0 +1,109 @@
+"""
+Zenith Parallel: Shared-memory arrays and process-pool helpers
+
+Large outputs live in a multiprocessing.shared_memory block that workers
+attach to by name, so only small task descriptions are ever pickled.
+"""
+
+import os
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+def default_workers():
+    """Number of worker processes to use when none is given."""
+    return os.cpu_count() or 1
+
+class SharedArray:
+    """
+    A NumPy array backed by a named shared-memory block.
+
+    Pass ``spec`` to worker processes and call `SharedArray.attach` there to
+    get a view of the same memory without copying or pickling the data.
+    """
+    def __init__(self, shape, dtype=np.float64):
+        """
+        Parameters:
+            shape (tuple): Array shape.
+            dtype: Array dtype.
+        """
+        dtype = np.dtype(dtype)
+        nbytes = max(int(np.prod(shape)) * dtype.itemsize, 1)
+        self._shm = shared_memory.SharedMemory(create=True, size=nbytes)
+        self.array = np.ndarray(shape, dtype=dtype, buffer=self._shm.buf)
+        self.spec = (self._shm.name, tuple(shape), dtype.str)
+
+    @staticmethod
+    def attach(spec):
+        """
+        Attach to a shared array from another process.
+
+        Parameters:
+            spec (tuple): The ``spec`` of the creating SharedArray.
+
+        Returns:
+            tuple: (shm, array); call ``shm.close()`` when done with ``array``.
+        """
+        name, shape, dtype = spec
+        shm = shared_memory.SharedMemory(name=name)
+        return shm, np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+
+    def detach(self):
+        """
+        Hand the shared memory over to a plain ndarray, without copying.
+
+        The block is unlinked, so workers can no longer attach to it, and it
+        is released once the returned array and all of its views are gone.
+
+        Returns:
+            array: The data, valid beyond the lifetime of this SharedArray.
+        """
+        interface = self.array.__array_interface__
+        self.array = None
+        shm, self._shm = self._shm, None
+        shm.unlink()
+        return np.asarray(_SharedBlock(shm, interface))
+
+    def close(self):
+        """Release and unlink the shared-memory block (no-op after `detach`)."""
+        if self._shm is None:
+            return
+        self.array = None
+        self._shm.close()
+        self._shm.unlink()
+        self._shm = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+class _SharedBlock:
+    """Base object of a detached SharedArray: closes the block when the array goes."""
+    def __init__(self, shm, interface):
+        self._shm = shm
+        self.__array_interface__ = interface
+
+    def __del__(self):
+        self._shm.close()
+
+def run_tasks(func, tasks, workers=None):
+    """
+    Run ``func(*task)`` for every task, in a process pool when workers > 1.
+
+    Parameters:
+        func (callable): Module-level (picklable) function.
+        tasks (list): Argument tuples, one per call.
+        workers (int): Number of worker processes (default: CPU count).
+
+    Returns:
+        list: Results in task order.
+    """
+    if workers is None:
+        workers = default_workers()
+    if workers <= 1 or len(tasks) <= 1:
+        return [func(*task) for task in tasks]
+    with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as pool:
+        futures = [pool.submit(func, *task) for task in tasks]
+        return [f.result() for f in futures]
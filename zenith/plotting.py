@@ -0,0 +1,176 @@
+"""
+Zenith Plotting: Batch figure rendering without pyplot
+
+Figures are built once per process with the object-oriented Agg backend and
+reused as templates: rendering another telescope or planet only swaps the
+line data and texts before saving, instead of creating and tearing down a
+global pyplot figure per plot. Batches can be spread across worker processes.
+"""
+
+import numpy as np
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from zenith.parallel import run_tasks, default_workers
+
+class PerformanceCurvePlot:
+    """
+    Reusable SNR vs magnitude figure.
+    """
+    def __init__(self, figsize=(10, 6), points=50):
+        """
+        Parameters:
+            figsize (tuple): Figure size in inches.
+            points (int): Number of magnitudes sampled per curve.
+        """
+        self.points = points
+        self.figure = Figure(figsize=figsize)
+        FigureCanvasAgg(self.figure)
+        ax = self.figure.add_subplot()
+        self._line, = ax.plot([], [], label="Exposure")
+        ax.set_xlabel("Apparent Magnitude")
+        ax.set_ylabel("Signal-to-Noise Ratio (SNR)")
+        ax.axhline(y=5, color='r', linestyle='--', label="Detection Limit (SNR=5)")
+        ax.grid(True)
+        self._legend = ax.legend()
+        self._ax = ax
+
+    def render(self, telescope, ccd, filename, mag_range=(10, 18), exposure=60):
+        """
+        Plot SNR vs Magnitude for a fixed exposure time and save it.
+
+        Parameters:
+            telescope (Telescope): Telescope object.
+            ccd (CCD): CCD camera object.
+            filename (str): Output image path.
+            mag_range (tuple): (brightest, faintest) magnitude.
+            exposure (float): Exposure time in seconds.
+        """
+        mags = np.linspace(mag_range[0], mag_range[1], self.points)
+        # ⚡ Bolt: Vectorized SNR calculation over magnitude array to avoid slow Python loop
+        snrs = telescope.calculate_snr(mags, exposure, ccd)
+
+        self._line.set_data(mags, snrs)
+        label = f"Exposure {exposure}s"
+        self._line.set_label(label)
+        self._legend.get_texts()[0].set_text(label)
+        self._ax.set_title(f"Telescope Performance (D={telescope.aperture}m, f={telescope.focal_length}m)")
+        self._ax.relim()
+        self._ax.autoscale_view()
+        self.figure.savefig(filename)
+
+class LightCurvePlot:
+    """
+    Reusable transit light curve figure.
+    """
+    def __init__(self, figsize=(10, 6)):
+        """
+        Parameters:
+            figsize (tuple): Figure size in inches.
+        """
+        self.figure = Figure(figsize=figsize)
+        FigureCanvasAgg(self.figure)
+        ax = self.figure.add_subplot()
+        self._model, = ax.plot([], [], 'b-', label='Model')
+        self._data, = ax.plot([], [], 'k.', alpha=0.3, label='Simulated Data')
+        ax.set_xlabel("Time from mid-transit (hours)")
+        ax.set_ylabel("Normalized Flux")
+        ax.legend()
+        ax.grid(True)
+        self._ax = ax
+
+    def render(self, simulator, filename, duration_hours=6, rng=None):
+        """
+        Plot a transit light curve with simulated noisy data and save it.
+
+        Parameters:
+            simulator (TransitSimulator): Transit simulator object.
+            filename (str): Output image path.
+            duration_hours (float): Total time window to plot.
+            rng (Generator): Random generator for the simulated data noise.
+        """
+        if rng is None:
+            rng = np.random.default_rng()
+        time, flux = simulator.generate_light_curve(duration_hours)
+        # Add some noise for realism
+        noise = rng.normal(0, 0.0001, len(time))
+
+        self._model.set_data(time, flux)
+        self._data.set_data(time, flux + noise)
+        self._ax.set_title(f"Exoplanet Transit (P={simulator.period/86400:.1f}d, Depth={simulator.depth:.4f})")
+        self._ax.relim()
+        self._ax.autoscale_view()
+        self.figure.savefig(filename)
+
+def _render_performance_batch(jobs, mag_range, exposure):
+    """Worker entry point: render a batch of performance curves on one template."""
+    plot = PerformanceCurvePlot()
+    for telescope, ccd, filename in jobs:
+        plot.render(telescope, ccd, filename, mag_range, exposure)
+    return [filename for _, _, filename in jobs]
+
+def _render_light_curve_batch(jobs, duration_hours):
+    """Worker entry point: render a batch of light curves on one template."""
+    plot = LightCurvePlot()
+    for simulator, filename, seed in jobs:
+        plot.render(simulator, filename, duration_hours, np.random.default_rng(seed))
+    return [filename for _, filename, _ in jobs]
+
+def _batches(jobs, workers):
+    """Split jobs into contiguous batches, a few per worker for load balancing."""
+    if workers <= 1:
+        return [jobs] if jobs else []
+    size = max(1, -(-len(jobs) // (workers * 4)))
+    return [jobs[i:i + size] for i in range(0, len(jobs), size)]
+
+def render_performance_curves(telescopes, ccds, filenames, mag_range=(10, 18), exposure=60, workers=1):
+    """
+    Render SNR vs magnitude curves for many instruments.
+
+    Parameters:
+        telescopes (list): Telescope objects.
+        ccds (CCD or list): One CCD for all telescopes, or one per telescope.
+        filenames (list): Output image paths, one per telescope.
+        mag_range (tuple): (brightest, faintest) magnitude.
+        exposure (float): Exposure time in seconds.
+        workers (int): Number of worker processes (None: CPU count).
+
+    Returns:
+        list: The written filenames.
+    """
+    telescopes = list(telescopes)
+    if not isinstance(ccds, (list, tuple)):
+        ccds = [ccds] * len(telescopes)
+    if not len(telescopes) == len(ccds) == len(filenames):
+        raise ValueError("telescopes, ccds and filenames must have the same length")
+    if workers is None:
+        workers = default_workers()
+
+    jobs = list(zip(telescopes, ccds, filenames))
+    tasks = [(batch, mag_range, exposure) for batch in _batches(jobs, workers)]
+    return [f for names in run_tasks(_render_performance_batch, tasks, workers) for f in names]
+
+def render_light_curves(simulators, filenames, duration_hours=6, seed=None, workers=1):
+    """
+    Render transit light curves for many planets.
+
+    Parameters:
+        simulators (list): TransitSimulator objects.
+        filenames (list): Output image paths, one per simulator.
+        duration_hours (float): Total time window to plot.
+        seed (int or SeedSequence): Seed for the simulated data noise; each
+            plot draws from its own spawned child sequence.
+        workers (int): Number of worker processes (None: CPU count).
+
+    Returns:
+        list: The written filenames.
+    """
+    simulators = list(simulators)
+    if len(simulators) != len(filenames):
+        raise ValueError("simulators and filenames must have the same length")
+    if workers is None:
+        workers = default_workers()
+
+    seeds = np.random.SeedSequence(seed).spawn(len(simulators))
+    jobs = list(zip(simulators, filenames, seeds))
+    tasks = [(batch, duration_hours) for batch in _batches(jobs, workers)]
+    return [f for names in run_tasks(_render_light_curve_batch, tasks, workers) for f in names]
@@ -0,0 +1,251 @@
+"""
+Zenith Population: Streaming stellar population synthesis
+
+Stars are sampled and evaluated in fixed-size chunks written into reusable
+buffers, and summarized by incremental reducers (histograms, HR-diagram
+density grids, luminosity functions), so peak memory depends on the chunk
+size only, never on the number of stars.
+"""
+
+import math
+import numpy as np
+from zenith.utils import solar_radius, sun_lum
+from zenith.astrophysics import luminosity_from_radius_temp, apparent_magnitude
+
+# Main-sequence scalings: R ~ M^0.8 and, with L ~ M^3.5 = R^2 T^4, T ~ M^0.475
+_RADIUS_EXPONENT = 0.8
+_TEMPERATURE_EXPONENT = 0.475
+_SUN_TEMPERATURE = 5772.0
+# Absolute bolometric magnitude of the Sun (IAU 2015 B2)
+_SUN_M_BOL = 4.74
+
+COLUMNS = ('mass', 'radius', 'temperature', 'distance', 'luminosity', 'log_temperature',
+           'log_luminosity', 'absolute_magnitude', 'apparent_magnitude')
+
+def _column(chunk, spec):
+    """A chunk column by name, or computed by a callable on the chunk."""
+    return spec(chunk) if callable(spec) else chunk[spec]
+
+def _bin_index(values, edges, uniform):
+    """Bin index of every value (-1 outside the edges; the last edge is inclusive)."""
+    n = len(edges) - 1
+    if uniform:
+        index = values - edges[0]
+        index *= n / (edges[-1] - edges[0])
+        index = index.astype(np.intp)
+        # Rounding can push values next to an edge into the neighbouring bin
+        # (or past the last one); correct against the edges like np.histogram
+        np.clip(index, 0, n - 1, out=index)
+        index[values < edges[index]] -= 1
+        index[(values >= edges[index + 1]) & (index < n - 1)] += 1
+    else:
+        index = np.searchsorted(edges, values, side='right') - 1
+    index[values == edges[-1]] = n - 1
+    index[~((values >= edges[0]) & (values <= edges[-1]))] = -1
+    return index
+
+def _edges(bins, range):
+    """Bin edges and whether they are uniform (which allows direct index arithmetic)."""
+    if np.ndim(bins) == 0:
+        if range is None:
+            raise ValueError("range is required with a bin count (the data is never seen at once)")
+        return np.linspace(range[0], range[1], int(bins) + 1), True
+    edges = np.asarray(bins, dtype=float)
+    if edges.ndim != 1 or len(edges) < 2 or np.any(np.diff(edges) <= 0):
+        raise ValueError("bins must be a count or increasing edges")
+    return edges, False
+
+class Histogram:
+    """
+    Incremental 1-D histogram of a population column.
+    """
+    def __init__(self, column, bins=100, range=None, where=None):
+        """
+        Parameters:
+            column (str or callable): Column name, or a function of the chunk
+                dict returning the values.
+            bins (int or array): Number of bins (requires ``range``) or bin edges.
+            range (tuple): (low, high) for a bin count.
+            where (callable): Optional function of the chunk returning a boolean
+                mask of the stars to count.
+        """
+        self.column = column
+        self.where = where
+        self.edges, self._uniform = _edges(bins, range)
+        self.counts = np.zeros(len(self.edges) - 1, dtype=np.int64)
+
+    def update(self, chunk):
+        """Add one chunk of stars."""
+        index = _bin_index(_column(chunk, self.column), self.edges, self._uniform)
+        if self.where is not None:
+            index[~self.where(chunk)] = -1
+        # ⚡ Bolt: One bincount per chunk instead of np.histogram's sort/search
+        self.counts += np.bincount(index[index >= 0], minlength=len(self.counts))
+
+class Histogram2D:
+    """
+    Incremental 2-D density grid of two population columns.
+    """
+    def __init__(self, x, y, bins=(100, 100), range=(None, None), where=None):
+        """
+        Parameters:
+            x (str or callable): Column (or function of the chunk) on the first axis.
+            y (str or callable): Column (or function of the chunk) on the second axis.
+            bins (tuple): Bin counts or edges for each axis.
+            range (tuple): (low, high) per axis for bin counts.
+            where (callable): Optional function of the chunk returning a boolean mask.
+        """
+        self.x = x
+        self.y = y
+        self.where = where
+        self.x_edges, self._x_uniform = _edges(bins[0], range[0])
+        self.y_edges, self._y_uniform = _edges(bins[1], range[1])
+        self.counts = np.zeros((len(self.x_edges) - 1, len(self.y_edges) - 1), dtype=np.int64)
+
+    def update(self, chunk):
+        """Add one chunk of stars."""
+        ix = _bin_index(_column(chunk, self.x), self.x_edges, self._x_uniform)
+        iy = _bin_index(_column(chunk, self.y), self.y_edges, self._y_uniform)
+        keep = (ix >= 0) & (iy >= 0)
+        if self.where is not None:
+            keep &= self.where(chunk)
+        flat = ix[keep] * self.counts.shape[1] + iy[keep]
+        self.counts += np.bincount(flat, minlength=self.counts.size).reshape(self.counts.shape)
+
+class HRDiagram(Histogram2D):
+    """
+    Incremental Hertzsprung-Russell diagram: star counts over log temperature
+    and absolute magnitude (or any other y column).
+    """
+    def __init__(self, bins=(200, 200), range=((3.3, 4.8), (-10.0, 20.0)), y='absolute_magnitude', where=None):
+        """
+        Parameters:
+            bins (tuple): Bin counts or edges for (log temperature, y).
+            range (tuple): (low, high) per axis for bin counts.
+            y (str or callable): Vertical axis column.
+            where (callable): Optional function of the chunk returning a boolean mask.
+        """
+        super().__init__('log_temperature', y, bins, range, where)
+
+class LuminosityFunction(Histogram):
+    """
+    Incremental luminosity function: star counts per absolute magnitude bin,
+    optionally for a magnitude-limited sample.
+    """
+    def __init__(self, bins=60, range=(-10.0, 20.0), mag_limit=None, magnitude='apparent_magnitude'):
+        """
+        Parameters:
+            bins (int or array): Number of bins (requires ``range``) or bin edges.
+            range (tuple): (low, high) absolute magnitude for a bin count.
+            mag_limit (float): Only count stars with ``magnitude <= mag_limit``.
+            magnitude (str): Apparent magnitude column used for the limit.
+        """
+        where = None if mag_limit is None else (lambda chunk: chunk[magnitude] <= mag_limit)
+        super().__init__('absolute_magnitude', bins, range, where)
+        self.mag_limit = mag_limit
+
+def iter_population(n_stars, chunk_size=1000000, seed=None, mass_range=(0.1, 50.0), imf_slope=2.35,
+                    max_distance=1000.0, temperature_scatter=0.0, photometry=None):
+    """
+    Sample a main-sequence field population in fixed-size chunks.
+
+    Masses follow a power-law IMF (Salpeter by default), radius and
+    temperature follow main-sequence mass scalings (with optional lognormal
+    temperature scatter), and distances fill a sphere uniformly. Luminosity,
+    bolometric absolute and apparent magnitudes are derived per chunk.
+
+    Parameters:
+        n_stars (int): Total number of stars.
+        chunk_size (int): Stars per chunk.
+        seed (int or SeedSequence): Seed; each chunk draws from its own spawned sequence.
+        mass_range (tuple): (lowest, highest) mass in Solar masses.
+        imf_slope (float): IMF power-law slope alpha in dN/dM ~ M^-alpha.
+        max_distance (float): Radius of the sampled volume in parsecs.
+        temperature_scatter (float): Lognormal scatter of the temperature (dex).
+        photometry (PhotometryTable): Optional table adding an apparent AB
+            magnitude column per band, named after the band.
+
+    Yields:
+        dict: Column name -> array for the chunk (see COLUMNS). The arrays are
+            views into buffers reused by the next chunk; copy them to keep them.
+    """
+    size = min(chunk_size, n_stars)
+    buffers = {name: np.empty(size) for name in COLUMNS}
+    bands = () if photometry is None else photometry.bands
+    for band in bands:
+        buffers[band] = np.empty(size)
+
+    # Inverse CDF of the power-law IMF
+    lo, hi = mass_range
+    k = 1.0 - imf_slope
+    lo_k = lo ** k
+    span_k = hi ** k - lo_k
+
+    starts = range(0, n_stars, chunk_size)
+    seeds = np.random.SeedSequence(seed).spawn(len(starts))
+    for start, chunk_seed in zip(starts, seeds):
+        n = min(chunk_size, n_stars - start)
+        rng = np.random.default_rng(chunk_seed)
+        chunk = {name: buf[:n] for name, buf in buffers.items()}
+        mass, radius, temperature, distance = (chunk[c] for c in ('mass', 'radius', 'temperature', 'distance'))
+
+        rng.random(out=mass)
+        if k == 0.0:
+            mass *= math.log(hi / lo)
+            np.exp(mass, out=mass)
+            mass *= lo
+        else:
+            mass *= span_k
+            mass += lo_k
+            np.power(mass, 1.0 / k, out=mass)
+
+        np.power(mass, _RADIUS_EXPONENT, out=radius)
+        radius *= solar_radius
+        np.power(mass, _TEMPERATURE_EXPONENT, out=temperature)
+        temperature *= _SUN_TEMPERATURE
+        if temperature_scatter:
+            scatter = chunk['log_temperature']
+            rng.standard_normal(out=scatter)
+            scatter *= temperature_scatter * math.log(10.0)
+            np.exp(scatter, out=scatter)
+            temperature *= scatter
+
+        rng.random(out=distance)
+        np.cbrt(distance, out=distance)
+        distance *= max_distance
+
+        # ⚡ Bolt: Evaluate straight into the chunk buffers (no temporaries)
+        luminosity_from_radius_temp(radius, temperature, out=chunk['luminosity'])
+        np.log10(temperature, out=chunk['log_temperature'])
+        log_l = chunk['log_luminosity']
+        np.divide(chunk['luminosity'], sun_lum, out=log_l)
+        np.log10(log_l, out=log_l)
+        absolute = chunk['absolute_magnitude']
+        np.multiply(log_l, -2.5, out=absolute)
+        absolute += _SUN_M_BOL
+        apparent_magnitude(absolute, distance, out=chunk['apparent_magnitude'])
+
+        if bands:
+            for band, mags in photometry.magnitudes(temperature, radius, distance=distance).items():
+                chunk[band][...] = mags
+        yield chunk
+
+def synthesize_population(n_stars, reducers, chunk_size=1000000, seed=None, **model):
+    """
+    Stream a synthetic population through incremental reducers.
+
+    Parameters:
+        n_stars (int): Total number of stars (e.g. 10**8).
+        reducers (list): Objects with an ``update(chunk)`` method, e.g.
+            Histogram, Histogram2D, HRDiagram or LuminosityFunction.
+        chunk_size (int): Stars per chunk; peak memory scales with this only.
+        seed (int or SeedSequence): Random seed.
+        **model: Population model options of `iter_population`.
+
+    Returns:
+        list: The updated reducers.
+    """
+    for chunk in iter_population(n_stars, chunk_size, seed, **model):
+        for reducer in reducers:
+            reducer.update(chunk)
+    return reducers
@@ -0,0 +1,145 @@
+"""
+Zenith Scheduler: Priority-driven night planning
+
+Builds a sequential night plan from a target list using closed-form
+visibility windows, SNR-sized exposures, airmass and slew/overhead time.
+"""
+
+import math
+import numpy as np
+from collections import namedtuple
+from zenith.astrometry import radec_to_unit_vector
+from zenith.time import julian_date, local_sidereal_time, SECONDS_PER_DAY
+from zenith.visibility import visibility_windows
+from zenith.utils import _DEG_TO_RAD, _RAD_TO_DEG
+
+ObservationPlan = namedtuple('ObservationPlan', ['target', 'start', 'end', 'exposure', 'airmass'])
+
+def schedule_night(ra, dec, priority, mag, snr, telescope, ccd, lat, lon, start, end,
+                   sky_mag=21.0, max_airmass=2.0, overhead=30.0, slew_rate=2.0,
+                   max_exposure=3600.0):
+    """
+    Build a greedy night plan that maximizes priority-weighted observing quality.
+
+    At every step the scheduler picks, among targets whose visibility window
+    can still fit the slew, overhead and exposure, the one with the highest
+    score ``priority * efficiency / airmass``, where efficiency is the
+    exposure fraction of the block. Only targets whose windows are open are
+    scored; windows enter and leave the active pool incrementally as the
+    night advances.
+
+    Parameters:
+        ra (array): Right Ascension of the targets in degrees.
+        dec (array): Declination of the targets in degrees.
+        priority (array): Target priorities (higher is more important).
+        mag (array): Apparent magnitudes of the targets.
+        snr (float or array): Required Signal-to-Noise Ratio per target.
+        telescope (Telescope): Telescope object.
+        ccd (CCD): CCD camera object.
+        lat (float): Observer's latitude in degrees.
+        lon (float): Observer's longitude in degrees.
+        start (datetime, datetime64 or float): Start of the night (UTC or Julian Date).
+        end (datetime, datetime64 or float): End of the night (UTC or Julian Date).
+        sky_mag (float): Sky background magnitude per arcsec^2.
+        max_airmass (float): Airmass limit for observations.
+        overhead (float): Fixed per-target overhead (readout, acquisition) in seconds.
+        slew_rate (float): Slew speed in degrees per second.
+        max_exposure (float): Longest allowed exposure in seconds; targets
+            needing more are not scheduled.
+
+    Returns:
+        ObservationPlan: (target, start, end, exposure, airmass) arrays in
+            execution order; times are Julian Dates, exposures in seconds.
+    """
+    jd_start = float(julian_date(start))
+    jd_end = float(julian_date(end))
+    ra = np.asarray(ra, dtype=float).ravel()
+    dec = np.asarray(dec, dtype=float).ravel()
+    n = len(ra)
+    priority = np.broadcast_to(np.asarray(priority, dtype=float), (n,))
+
+    # Closed-form inverse CCD equation sizes every exposure in one pass
+    exposure = telescope.exposure_for_snr(np.broadcast_to(mag, (n,)), snr, ccd, sky_mag)
+    exposure = np.where(exposure <= max_exposure, exposure, np.nan)
+    exposure_days = exposure / SECONDS_PER_DAY
+    overhead_days = overhead / SECONDS_PER_DAY
+
+    # Windows that can hold at least the overhead plus the exposure
+    windows = visibility_windows(ra, dec, lat, lon, jd_start, jd_end, max_airmass)
+    fits = windows.duration >= exposure_days[windows.index] + overhead_days
+    order = np.argsort(windows.start[fits], kind='stable')
+    w_target = windows.index[fits][order]
+    w_start = windows.start[fits][order]
+    w_end = windows.end[fits][order]
+
+    # Static per-target terms
+    xyz = radec_to_unit_vector(ra, dec)
+    dec_rad = dec * _DEG_TO_RAD
+    lat_rad = lat * _DEG_TO_RAD
+    sin_dec_sin_lat = np.sin(dec_rad) * math.sin(lat_rad)
+    cos_dec_cos_lat = np.cos(dec_rad) * math.cos(lat_rad)
+
+    done = np.zeros(n, dtype=bool)
+    pool = np.empty(0, dtype=np.intp)
+    next_window = 0
+    pointing = None
+    t = jd_start
+    plan = []
+
+    while t < jd_end:
+        # Admit windows that have opened by now
+        opened = np.searchsorted(w_start, t, side='right')
+        if opened > next_window:
+            pool = np.concatenate((pool, np.arange(next_window, opened)))
+            next_window = opened
+
+        # Retire windows whose target is done or that can no longer fit a block
+        tgt = w_target[pool]
+        alive = ~done[tgt] & (t + overhead_days + exposure_days[tgt] <= w_end[pool])
+        pool = pool[alive]
+        tgt = tgt[alive]
+
+        if len(pool):
+            if pointing is None:
+                slew = np.zeros(len(pool))
+            else:
+                cos_sep = xyz[tgt] @ pointing
+                np.clip(cos_sep, -1.0, 1.0, out=cos_sep)
+                slew = np.arccos(cos_sep)
+                slew *= _RAD_TO_DEG / slew_rate
+            setup = slew + overhead
+            begin = t + setup / SECONDS_PER_DAY
+            finish = begin + exposure_days[tgt]
+            feasible = (finish <= w_end[pool]) & (finish <= jd_end)
+
+        if not len(pool) or not feasible.any():
+            # Nothing can start now: jump to the next window opening
+            if next_window >= len(w_start):
+                break
+            t = w_start[next_window]
+            continue
+
+        # Airmass at mid-exposure for every candidate
+        mid = begin + 0.5 * exposure_days[tgt]
+        ha = local_sidereal_time(mid, lon) - ra[tgt]
+        ha *= _DEG_TO_RAD
+        sin_alt = cos_dec_cos_lat[tgt] * np.cos(ha)
+        sin_alt += sin_dec_sin_lat[tgt]
+
+        exp_t = exposure[tgt]
+        score = priority[tgt] * exp_t / (exp_t + setup) * sin_alt
+        score[~feasible] = -np.inf
+        best = int(np.argmax(score))
+
+        target = tgt[best]
+        plan.append((target, begin[best], finish[best], exp_t[best], 1.0 / sin_alt[best]))
+        done[target] = True
+        pointing = xyz[target]
+        t = finish[best]
+
+    if not plan:
+        empty = np.empty(0)
+        return ObservationPlan(np.empty(0, dtype=np.intp), empty, empty, empty, empty)
+    target, begin, finish, exp_t, airmass = zip(*plan)
+    return ObservationPlan(np.array(target, dtype=np.intp), np.array(begin), np.array(finish),
+                           np.array(exp_t), np.array(airmass))
@@ -0,0 +1,135 @@
+"""
+Zenith SkyIndex: Spatial index over star catalogs
+
+Stars are stored as unit vectors in a KD-tree, so cone, field-of-view and
+horizon queries only visit the tree nodes near the query region.
+"""
+
+import math
+import numpy as np
+from scipy.spatial import cKDTree
+from zenith.astrometry import radec_to_unit_vector, calculate_lst
+from zenith.utils import _DEG_TO_RAD, _RAD_TO_DEG
+
+class SkyIndex:
+    """
+    KD-tree index over catalog positions on the celestial sphere.
+    """
+    def __init__(self, ra, dec, leafsize=32):
+        """
+        Parameters:
+            ra (array): Right Ascension of the catalog stars in degrees.
+            dec (array): Declination of the catalog stars in degrees.
+            leafsize (int): Number of stars per KD-tree leaf.
+        """
+        self.ra = np.asarray(ra, dtype=float).ravel()
+        self.dec = np.asarray(dec, dtype=float).ravel()
+        self._xyz = radec_to_unit_vector(self.ra, self.dec)
+        self._tree = cKDTree(self._xyz, leafsize=leafsize)
+
+    def __len__(self):
+        return len(self.ra)
+
+    def query_cone(self, ra, dec, radius):
+        """
+        Find all stars within an angular radius of a pointing.
+
+        Parameters:
+            ra (float): Right Ascension of the cone centre in degrees.
+            dec (float): Declination of the cone centre in degrees.
+            radius (float): Cone radius in degrees.
+
+        Returns:
+            array: Sorted catalog indices of the stars inside the cone.
+        """
+        if radius >= 180.0:
+            return np.arange(len(self))
+        # Angular distance maps to chord length 2*sin(r/2) between unit vectors
+        chord = 2.0 * math.sin(0.5 * radius * _DEG_TO_RAD)
+        centre = radec_to_unit_vector(ra, dec)
+        idx = self._tree.query_ball_point(centre, chord, return_sorted=True)
+        return np.asarray(idx, dtype=np.intp)
+
+    def query_fov(self, ra, dec, width, height, rotation=0.0):
+        """
+        Find all stars inside a rectangular field of view.
+
+        The rectangle is defined in the tangent (gnomonic) plane of the
+        pointing, which is how a flat detector sees the sky.
+
+        Parameters:
+            ra (float): Right Ascension of the field centre in degrees.
+            dec (float): Declination of the field centre in degrees.
+            width (float): Full field width in degrees.
+            height (float): Full field height in degrees.
+            rotation (float): Position angle of the field in degrees (East of North).
+
+        Returns:
+            array: Sorted catalog indices of the stars inside the field.
+        """
+        half_x = math.tan(0.5 * width * _DEG_TO_RAD)
+        half_y = math.tan(0.5 * height * _DEG_TO_RAD)
+        # Circumscribed cone first, then the exact rectangle on the candidates
+        radius = math.atan(math.hypot(half_x, half_y)) * _RAD_TO_DEG
+        idx = self.query_cone(ra, dec, radius)
+
+        dra = (self.ra[idx] - ra) * _DEG_TO_RAD
+        dec_rad = self.dec[idx] * _DEG_TO_RAD
+        dec0 = dec * _DEG_TO_RAD
+        sin_dec0 = math.sin(dec0)
+        cos_dec0 = math.cos(dec0)
+        sin_dec = np.sin(dec_rad)
+        cos_dec = np.cos(dec_rad)
+        cos_dra = np.cos(dra)
+
+        cos_c = sin_dec0 * sin_dec + cos_dec0 * cos_dec * cos_dra
+        xi = cos_dec * np.sin(dra) / cos_c
+        eta = (cos_dec0 * sin_dec - sin_dec0 * cos_dec * cos_dra) / cos_c
+
+        if rotation:
+            pa = rotation * _DEG_TO_RAD
+            c = math.cos(pa)
+            s = math.sin(pa)
+            xi, eta = xi * c - eta * s, xi * s + eta * c
+
+        inside = (cos_c > 0) & (np.abs(xi) <= half_x) & (np.abs(eta) <= half_y)
+        return idx[inside]
+
+    def query_field(self, ra, dec, telescope, ccd, nx, ny, rotation=0.0):
+        """
+        Find all stars falling on a detector, sized from the telescope and CCD.
+
+        Parameters:
+            ra (float): Right Ascension of the field centre in degrees.
+            dec (float): Declination of the field centre in degrees.
+            telescope (Telescope): Telescope object.
+            ccd (CCD): CCD camera object.
+            nx (int): Detector width in pixels.
+            ny (int): Detector height in pixels.
+            rotation (float): Position angle of the detector in degrees.
+
+        Returns:
+            array: Sorted catalog indices of the stars on the detector.
+        """
+        width, height = telescope.field_of_view(ccd, nx, ny)
+        return self.query_fov(ra, dec, width, height, rotation)
+
+    def above_horizon(self, lat, lon, time, min_altitude=0.0):
+        """
+        Find all stars above an altitude limit at a given time.
+
+        A star's altitude only depends on its distance from the zenith, which
+        sits at RA = LST (hour angle 0) and Dec = latitude, so the horizon cull
+        is a cone query of radius 90 - min_altitude around that point.
+
+        Parameters:
+            lat (float): Observer's latitude in degrees.
+            lon (float): Observer's longitude in degrees.
+            time (datetime or float): UTC datetime object or Julian Date.
+            min_altitude (float): Altitude limit in degrees.
+
+        Returns:
+            array: Sorted catalog indices of the stars above the limit.
+        """
+        lst = float(calculate_lst(lon, time))
+        return self.query_cone(lst, lat, 90.0 - min_altitude)
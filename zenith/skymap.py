@@ -0,0 +1,133 @@
+"""
+Zenith SkyMap: All-sky altitude/airmass cubes
+
+Renders (N_times, N_dec, N_ra) grids over the whole sky, split across a
+process pool that writes into one shared-memory output array.
+"""
+
+import math
+import numpy as np
+from zenith.time import julian_date, local_sidereal_time
+from zenith.parallel import SharedArray, run_tasks, default_workers
+from zenith.utils import _DEG_TO_RAD, _RAD_TO_DEG
+
+QUANTITIES = ('altitude', 'airmass')
+
+def sky_grid(n_ra, n_dec):
+    """
+    Cell-centre coordinates of an equirectangular all-sky grid.
+
+    Parameters:
+        n_ra (int): Number of RA cells over [0, 360).
+        n_dec (int): Number of Dec cells over [-90, 90].
+
+    Returns:
+        tuple: (ra, dec) 1-D arrays in degrees.
+    """
+    ra = (np.arange(n_ra) + 0.5) * (360.0 / n_ra)
+    dec = (np.arange(n_dec) + 0.5) * (180.0 / n_dec) - 90.0
+    return ra, dec
+
+def _render_tile(out, lst, ra_rad, sin_dec_sin_lat, cos_dec_cos_lat, quantity):
+    """Fill ``out[t, dec, ra]`` for one block of LSTs and Dec rows."""
+    for k in range(len(lst)):
+        # ⚡ Bolt: The hour angle only depends on RA, so cos(HA) is one row of
+        # N_ra values and the cell grid is an outer product with the Dec terms.
+        cos_ha = np.cos(lst[k] * _DEG_TO_RAD - ra_rad)
+        plane = out[k]
+        np.multiply.outer(cos_dec_cos_lat, cos_ha, out=plane)
+        plane += sin_dec_sin_lat[:, None]
+        if quantity == 'altitude':
+            np.clip(plane, -1.0, 1.0, out=plane)
+            np.arcsin(plane, out=plane)
+            plane *= _RAD_TO_DEG
+        else:
+            below = plane <= 0
+            with np.errstate(divide='ignore'):
+                np.divide(1.0, plane, out=plane)
+            plane[below] = np.inf
+
+def _render_shared(spec, t0, t1, d0, d1, lst, ra_rad, sin_dec_sin_lat, cos_dec_cos_lat, quantity):
+    """Worker entry point: render a tile straight into the shared cube."""
+    shm, cube = SharedArray.attach(spec)
+    try:
+        _render_tile(cube[t0:t1, d0:d1], lst[t0:t1], ra_rad,
+                     sin_dec_sin_lat[d0:d1], cos_dec_cos_lat[d0:d1], quantity)
+    finally:
+        del cube
+        shm.close()
+
+def _split(n, parts):
+    edges = np.linspace(0, n, min(parts, n) + 1).astype(int)
+    return list(zip(edges[:-1], edges[1:]))
+
+def sky_map(lat, lon, times, n_ra=2048, n_dec=1024, quantity='altitude',
+            dtype=np.float32, workers=None, out=None):
+    """
+    Render an all-sky altitude or airmass cube.
+
+    Parameters:
+        lat (float): Observer's latitude in degrees.
+        lon (float): Observer's longitude in degrees.
+        times (datetime64 or array): UTC times (datetime64) or Julian Dates.
+        n_ra (int): Number of RA cells over [0, 360).
+        n_dec (int): Number of Dec cells over [-90, 90].
+        quantity (str): 'altitude' (degrees) or 'airmass' (inf below the horizon).
+        dtype: Output dtype, np.float32 (default) or np.float64.
+        workers (int): Number of worker processes (default: CPU count).
+        out (array or SharedArray): Optional preallocated output of shape
+            (N_times, n_dec, n_ra). Workers render straight into a SharedArray;
+            a plain array receives a copy of the parallel result.
+
+    Returns:
+        array: Cube of shape (N_times, n_dec, n_ra); see `sky_grid` for cell centres.
+            Without ``out``, a parallel cube is returned in the shared memory
+            the workers wrote to (no copy).
+    """
+    if quantity not in QUANTITIES:
+        raise ValueError(f"quantity must be one of {QUANTITIES}")
+    lst = np.atleast_1d(local_sidereal_time(julian_date(times), lon))
+    shape = (len(lst), n_dec, n_ra)
+    shared = out if isinstance(out, SharedArray) else None
+    if shared is not None:
+        out = shared.array
+    if out is not None and out.shape != shape:
+        raise ValueError(f"out must have shape {shape}")
+
+    ra, dec = sky_grid(n_ra, n_dec)
+    ra_rad = ra * _DEG_TO_RAD
+    dec_rad = dec * _DEG_TO_RAD
+    lat_rad = lat * _DEG_TO_RAD
+    sin_dec_sin_lat = np.sin(dec_rad) * math.sin(lat_rad)
+    cos_dec_cos_lat = np.cos(dec_rad) * math.cos(lat_rad)
+
+    if workers is None:
+        workers = default_workers()
+    if workers <= 1:
+        if out is None:
+            out = np.empty(shape, dtype=dtype)
+        _render_tile(out, lst, ra_rad, sin_dec_sin_lat, cos_dec_cos_lat, quantity)
+        return out
+
+    # Tiles over time slices, further split into Dec bands when there are
+    # fewer slices than workers, so every worker gets a comparable share.
+    time_blocks = _split(len(lst), workers * 2)
+    dec_parts = max(1, -(-workers * 2 // len(time_blocks)))
+    dec_blocks = _split(n_dec, dec_parts)
+
+    # ⚡ Bolt: Workers write into the memory that is returned, so a cube of
+    # ~1 GB is never held twice or copied after rendering.
+    cube = shared if shared is not None else SharedArray(shape, dtype if out is None else out.dtype)
+    try:
+        tasks = [(cube.spec, t0, t1, d0, d1, lst, ra_rad, sin_dec_sin_lat, cos_dec_cos_lat, quantity)
+                 for t0, t1 in time_blocks for d0, d1 in dec_blocks]
+        run_tasks(_render_shared, tasks, workers)
+        if shared is not None:
+            return shared.array
+        if out is None:
+            return cube.detach()
+        np.copyto(out, cube.array)
+        return out
+    finally:
+        if shared is None:
+            cube.close()
@@ -0,0 +1,135 @@
+"""
+Zenith Time: Vectorized time scales (Julian Date, GMST, LST)
+
+Works directly on numpy.datetime64 arrays, Unix-second arrays and Julian
+Date arrays so whole time grids can be converted without building Python
+datetime objects.
+"""
+
+import numpy as np
+from datetime import datetime, timezone
+
+JD_UNIX_EPOCH = 2440587.5   # Julian Date of 1970-01-01 00:00:00 UTC
+JD_J2000 = 2451545.0        # Julian Date of 2000-01-01 12:00:00 UTC
+SECONDS_PER_DAY = 86400.0
+
+# Approximate GMST polynomial (degrees, degrees per day since J2000)
+_GMST_J2000 = 280.46061837
+_GMST_RATE = 360.98564736629
+
+_UNIX_EPOCH_DATETIME64 = np.datetime64('1970-01-01T00:00:00', 'us')
+_J2000_DATETIME64 = np.datetime64('2000-01-01T12:00:00', 'us')
+_ONE_DAY = np.timedelta64(86400000000, 'us')
+
+def _datetime_to_unix(time):
+    """Seconds since the Unix epoch for a (naive UTC or aware) datetime."""
+    if time.tzinfo == timezone.utc:
+        return time.timestamp()
+    if time.tzinfo is None:
+        return time.replace(tzinfo=timezone.utc).timestamp()
+    return time.timestamp()
+
+def unix_to_jd(seconds):
+    """
+    Convert Unix timestamps to Julian Dates.
+
+    Parameters:
+        seconds (float or array): Seconds since 1970-01-01 00:00:00 UTC.
+
+    Returns:
+        float or array: Julian Date.
+    """
+    return seconds / SECONDS_PER_DAY + JD_UNIX_EPOCH
+
+def jd_to_unix(jd):
+    """
+    Convert Julian Dates to Unix timestamps.
+
+    Parameters:
+        jd (float or array): Julian Date.
+
+    Returns:
+        float or array: Seconds since 1970-01-01 00:00:00 UTC.
+    """
+    return (jd - JD_UNIX_EPOCH) * SECONDS_PER_DAY
+
+def datetime64_to_jd(times):
+    """
+    Convert numpy.datetime64 values (UTC) to Julian Dates.
+
+    Parameters:
+        times (datetime64 or array): UTC times.
+
+    Returns:
+        float or array: Julian Date.
+    """
+    return (np.asarray(times) - _UNIX_EPOCH_DATETIME64) / _ONE_DAY + JD_UNIX_EPOCH
+
+def julian_date(time):
+    """
+    Convert a time or array of times to Julian Dates.
+
+    Parameters:
+        time: A datetime (naive values are treated as UTC), a datetime64
+            scalar/array, a sequence of datetimes, or a float/array that is
+            already a Julian Date (returned unchanged).
+
+    Returns:
+        float or array: Julian Date.
+    """
+    if isinstance(time, datetime):
+        return unix_to_jd(_datetime_to_unix(time))
+
+    arr = np.asarray(time)
+    if arr.dtype.kind == 'M':
+        return datetime64_to_jd(arr)
+    if arr.dtype.kind == 'O':
+        return np.array([julian_date(t) for t in arr.ravel()]).reshape(arr.shape)
+    return arr if arr.ndim else time
+
+def days_since_j2000(time):
+    """
+    Convert a time or array of times to (fractional) days since J2000.
+
+    Parameters:
+        time: Anything accepted by `julian_date`.
+
+    Returns:
+        float or array: Days since 2000-01-01 12:00:00 UTC.
+    """
+    if isinstance(time, datetime):
+        return (_datetime_to_unix(time) / SECONDS_PER_DAY) - 10957.5
+
+    arr = np.asarray(time)
+    if arr.dtype.kind == 'M':
+        # ⚡ Bolt: Subtract the epoch in integer microseconds before converting to float
+        # to avoid losing precision on the large Julian Date offset.
+        return (arr - _J2000_DATETIME64) / _ONE_DAY
+    return julian_date(time) - JD_J2000
+
+def gmst(time):
+    """
+    Calculate Greenwich Mean Sidereal Time (GMST) in degrees.
+
+    Parameters:
+        time: Anything accepted by `julian_date`.
+
+    Returns:
+        float or array: GMST in degrees [0, 360).
+    """
+    d = days_since_j2000(time)
+    return (_GMST_J2000 + _GMST_RATE * d) % 360.0
+
+def local_sidereal_time(time, longitude):
+    """
+    Calculate Local Sidereal Time (LST) in degrees for a whole time grid.
+
+    Parameters:
+        time: Anything accepted by `julian_date`.
+        longitude (float or array): Observer's longitude in degrees (East is positive).
+
+    Returns:
+        float or array: LST in degrees [0, 360).
+    """
+    d = days_since_j2000(time)
+    return (_GMST_J2000 + _GMST_RATE * d + longitude) % 360.0
@@ -3,6 +3,7 @@ Zenith Utils: Physical and Astronomical Constants
 """
 
 import math
+import numpy as np
 
 # Physical Constants
 c = 2.99792458e8        # Speed of light in vacuum [m/s]
@@ -21,6 +22,7 @@ earth_mass = 5.972e24   # Earth mass [kg]
 earth_radius = 6.371e6  # Earth radius [m]
 jupiter_radius = 7.1492e7 # Jupiter equatorial radius [m]
 sun_lum = 3.828e26      # Solar luminosity [W]
+AB_ZERO_FLUX = 3631.0e-26 # AB magnitude zero point (3631 Jy) [W m^-2 Hz^-1]
 
 # ⚡ Bolt: Hoist constant mathematical expression to a module-level constant to bypass redundant arithmetic overhead.
 _MPC_IN_METERS = 1e6 * parsec
@@ -30,20 +32,50 @@ _MPC_IN_METERS = 1e6 * parsec
 _DEG_TO_RAD = math.pi / 180.0
 _RAD_TO_DEG = 180.0 / math.pi
 
-def mpc_to_m(mpc):
-    """Convert Megaparsecs to meters."""
-    return mpc * _MPC_IN_METERS
+def _ufunc_out(out, dtype, *args):
+    """
+    Output array for the ufunc-style (out=/where=/dtype=) code paths.
 
-def m_to_mpc(m):
-    """Convert meters to Megaparsecs."""
-    return m / _MPC_IN_METERS
+    Allocates like a NumPy ufunc when ``out`` is None: the broadcast shape of
+    the inputs, in ``dtype`` or the floating result type of the inputs.
+    """
+    if out is None:
+        shape = np.broadcast_shapes(*(np.shape(a) for a in args))
+        if dtype is None:
+            dtype = np.result_type(*args, 1.0)
+        out = np.empty(shape, dtype=dtype)
+    return out
 
-def rad_to_deg(rad):
-    """Convert radians to degrees."""
+def _ufunc_result(out, given):
+    """Return ``out`` as a ufunc would: the array itself, or a scalar for 0-d results."""
+    return out if given or out.ndim else out[()]
+
+def _scale(x, factor, out, where, dtype):
+    """x * factor with the ufunc-style keyword contract."""
+    if out is None and where is True and dtype is None:
+        return x * factor
+    res = _ufunc_out(out, dtype, x)
+    np.multiply(x, factor, out=res, where=where)
+    return _ufunc_result(res, out is not None)
+
+def mpc_to_m(mpc, out=None, where=True, dtype=None):
+    """Convert Megaparsecs to meters (accepts ufunc-style out=, where=, dtype=)."""
+    return _scale(mpc, _MPC_IN_METERS, out, where, dtype)
+
+def m_to_mpc(m, out=None, where=True, dtype=None):
+    """Convert meters to Megaparsecs (accepts ufunc-style out=, where=, dtype=)."""
+    if out is None and where is True and dtype is None:
+        return m / _MPC_IN_METERS
+    res = _ufunc_out(out, dtype, m)
+    np.divide(m, _MPC_IN_METERS, out=res, where=where)
+    return _ufunc_result(res, out is not None)
+
+def rad_to_deg(rad, out=None, where=True, dtype=None):
+    """Convert radians to degrees (accepts ufunc-style out=, where=, dtype=)."""
     # ⚡ Bolt: Explictly multiply by pre-calculated constant to bypass math.degrees function call overhead
-    return rad * _RAD_TO_DEG
+    return _scale(rad, _RAD_TO_DEG, out, where, dtype)
 
-def deg_to_rad(deg):
-    """Convert degrees to radians."""
+def deg_to_rad(deg, out=None, where=True, dtype=None):
+    """Convert degrees to radians (accepts ufunc-style out=, where=, dtype=)."""
     # ⚡ Bolt: Explictly multiply by pre-calculated constant to bypass math.radians function call overhead
-    return deg * _DEG_TO_RAD
+    return _scale(deg, _DEG_TO_RAD, out, where, dtype)
@@ -0,0 +1,199 @@
+"""
+Zenith Visibility: Target visibility windows as compact interval arrays
+
+Windows come from the closed-form rise/set solver, so their cost scales
+with the number of windows rather than with any time resolution.
+"""
+
+import math
+import numpy as np
+from zenith.astrometry import rise_transit_set
+from zenith.time import julian_date, _GMST_RATE
+
+# Length of a sidereal day in (solar) days
+_SIDEREAL_DAY = 360.0 / _GMST_RATE
+
+def _sweep(index, start, end, depth):
+    """
+    Sweep-line over per-target intervals.
+
+    Returns the (index, start, end) arrays of the regions covered by at
+    least ``depth`` of the input intervals, merged and sorted per target.
+    depth=1 gives the union, depth=2 the intersection of two disjoint sets.
+    """
+    n = len(index)
+    idx = np.concatenate((index, index))
+    t = np.concatenate((start, end))
+    delta = np.ones(2 * n, dtype=np.int64)
+    delta[n:] = -1
+
+    # Sort by target, then time; at equal times open before closing so
+    # touching intervals merge instead of leaving zero-length gaps.
+    order = np.lexsort((-delta, t, idx))
+    idx = idx[order]
+    t = t[order]
+    level = np.cumsum(delta[order])
+    prev = level - delta[order]
+
+    opens = (level >= depth) & (prev < depth)
+    closes = (level < depth) & (prev >= depth)
+    out_index = idx[opens]
+    out_start = t[opens]
+    out_end = t[closes]
+
+    keep = out_end > out_start
+    return out_index[keep], out_start[keep], out_end[keep]
+
+class IntervalSet:
+    """
+    Per-target time intervals stored as flat arrays sorted by (index, start).
+
+    Intervals of one target never overlap. Times are Julian Dates.
+    """
+    def __init__(self, index, start, end, n_targets=None, normalized=False):
+        """
+        Parameters:
+            index (array): Target index of each interval.
+            start (array): Interval start times.
+            end (array): Interval end times.
+            n_targets (int): Number of targets (defaults to max(index) + 1).
+            normalized (bool): Set if the inputs are already sorted and disjoint.
+        """
+        index = np.asarray(index, dtype=np.int64).ravel()
+        start = np.asarray(start, dtype=float).ravel()
+        end = np.asarray(end, dtype=float).ravel()
+        if not normalized:
+            index, start, end = _sweep(index, start, end, 1)
+        self.index = index
+        self.start = start
+        self.end = end
+        if n_targets is None:
+            n_targets = int(index.max()) + 1 if len(index) else 0
+        self.n_targets = n_targets
+
+    def __len__(self):
+        return len(self.index)
+
+    def __repr__(self):
+        return f"IntervalSet({len(self)} intervals, {self.n_targets} targets)"
+
+    def _new(self, index, start, end, other=None):
+        n_targets = self.n_targets if other is None else max(self.n_targets, other.n_targets)
+        return IntervalSet(index, start, end, n_targets=n_targets, normalized=True)
+
+    @property
+    def duration(self):
+        """Length of each interval in days."""
+        return self.end - self.start
+
+    def total_duration(self):
+        """
+        Total visible time per target.
+
+        Returns:
+            array: Summed interval length in days, one entry per target.
+        """
+        return np.bincount(self.index, weights=self.duration, minlength=self.n_targets)
+
+    def for_target(self, i):
+        """
+        Intervals of a single target.
+
+        Returns:
+            tuple: (start, end) arrays.
+        """
+        lo, hi = np.searchsorted(self.index, [i, i + 1])
+        return self.start[lo:hi], self.end[lo:hi]
+
+    def union(self, other):
+        """Per-target union with another IntervalSet."""
+        return self._new(*_sweep(np.concatenate((self.index, other.index)),
+                                 np.concatenate((self.start, other.start)),
+                                 np.concatenate((self.end, other.end)), 1), other)
+
+    def intersection(self, other):
+        """Per-target intersection with another IntervalSet."""
+        return self._new(*_sweep(np.concatenate((self.index, other.index)),
+                                 np.concatenate((self.start, other.start)),
+                                 np.concatenate((self.end, other.end)), 2), other)
+
+    def within(self, start, end):
+        """
+        Intersect every target's intervals with common time ranges
+        (e.g. one dusk-to-dawn range per night).
+
+        Parameters:
+            start (float or array): Range start times (Julian Dates).
+            end (float or array): Range end times (Julian Dates).
+
+        Returns:
+            IntervalSet: The clipped intervals.
+        """
+        ranges = IntervalSet(np.zeros(np.size(start), dtype=np.int64), start, end)
+        n_ranges = len(ranges)
+        targets = np.repeat(np.arange(self.n_targets), n_ranges)
+        common = IntervalSet(targets, np.tile(ranges.start, self.n_targets),
+                             np.tile(ranges.end, self.n_targets),
+                             n_targets=self.n_targets, normalized=True)
+        return self.intersection(common)
+
+    def min_duration(self, duration):
+        """
+        Drop intervals shorter than ``duration`` days.
+
+        Returns:
+            IntervalSet: The remaining intervals.
+        """
+        keep = self.duration >= duration
+        return self._new(self.index[keep], self.start[keep], self.end[keep])
+
+def visibility_windows(ra, dec, lat, lon, start, end, max_airmass=2.0):
+    """
+    Windows during which each target is below an airmass limit.
+
+    Parameters:
+        ra (float or array): Right Ascension in degrees.
+        dec (float or array): Declination in degrees.
+        lat (float): Observer's latitude in degrees.
+        lon (float): Observer's longitude in degrees.
+        start (datetime, datetime64 or float): Start of the period (UTC or Julian Date).
+        end (datetime, datetime64 or float): End of the period (UTC or Julian Date).
+        max_airmass (float): Airmass limit (sec(z) approximation).
+
+    Returns:
+        IntervalSet: Visible windows per target, clipped to [start, end].
+    """
+    jd_start = float(julian_date(start))
+    jd_end = float(julian_date(end))
+    ra = np.atleast_1d(np.asarray(ra, dtype=float))
+    dec = np.atleast_1d(np.asarray(dec, dtype=float))
+    ra, dec = np.broadcast_arrays(ra, dec)
+    n_targets = ra.size
+
+    # airmass = 1 / sin(alt)
+    altitude = math.degrees(math.asin(1.0 / max_airmass))
+
+    # First transit at or after one sidereal day before the start, then every
+    # sidereal day after that until the period is covered.
+    rts = rise_transit_set(ra.ravel(), dec.ravel(), lat, lon, jd_start - _SIDEREAL_DAY, altitude)
+    n_days = int(math.ceil((jd_end - jd_start) / _SIDEREAL_DAY)) + 2
+    offsets = np.arange(n_days) * _SIDEREAL_DAY
+
+    half = (rts.set - rts.transit)[:, None]
+    transits = rts.transit[:, None] + offsets
+    crossing = ~(rts.circumpolar | rts.never_rises)
+    targets = np.arange(n_targets)
+
+    index = np.repeat(targets[crossing], n_days)
+    starts = (transits[crossing] - half[crossing]).ravel()
+    ends = (transits[crossing] + half[crossing]).ravel()
+
+    # Circumpolar targets are visible for the whole period
+    always = targets[rts.circumpolar]
+    index = np.concatenate((index, always))
+    starts = np.concatenate((starts, np.full(len(always), jd_start)))
+    ends = np.concatenate((ends, np.full(len(always), jd_end)))
+
+    np.clip(starts, jd_start, jd_end, out=starts)
+    np.clip(ends, jd_start, jd_end, out=ends)
+    return IntervalSet(index, starts, ends, n_targets=n_targets)